@@ -65,15 +65,15 @@ class Segment:
                 weight of the Segment, used as thickness to draw
                 defaults to None
         """
-        self.a = Vector(x, y)
-        self.b = Vector()
+        self.a = Vec2(x, y)
+        self.b = Vec2()
         self.length = length
         self.angle = angle
         self.weight = (weight, 4)[weight is None]
 
         self._renderer = renderer
 
-    def set_a(self, a: Vector) -> None:
+    def set_a(self, a: Vec2) -> None:
         """
         sets a new a point for the current Segment\\
         then updates point b
@@ -87,7 +87,7 @@ class Segment:
         """
         dx = cos(self.angle) * self.length
         dy = sin(self.angle) * self.length
-        self.b.setCoord(x=self.a.x + dx, y=self.a.y + dy)
+        self.b.x, self.b.y = self.a.x + dx, self.a.y + dy
 
     def show(self) -> None:
         """
@@ -98,7 +98,7 @@ class Segment:
         self._renderer.stroke_weight = round(self.weight)
         self._renderer.line(self.a, self.b)
 
-    def follow(self, target: Vector) -> None:
+    def follow(self, target: Vec2) -> None:
         """
         makes Segment follow a target Vector :
         1) make Segment point towards designated target
@@ -130,7 +130,7 @@ class Tentacle:
                  win: tuple,
                  size: int,
                  seg_length: float = None,
-                 base: Vector = None) -> None:
+                 base: Vec2 = None) -> None:
         """
         new Tentacle instance
 
@@ -145,14 +145,14 @@ class Tentacle:
             seg_length : float, (optional)
                 length of all Segments
                 defaults to None
-            base : Vector, (optional)
+            base : Vec2, (optional)
                 a fixed base or a free Tentacle
                 defaults to None
         """
         self.base = base
         self.has_base = True
         if base is None:
-            self.base = Vector()
+            self.base = Vec2()
             self.has_base = False
 
         self.size = size
@@ -174,7 +174,7 @@ class Tentacle:
         for segment in self.array:
             segment.show()
 
-    def follow(self, target: Vector) -> None:
+    def follow(self, target: Vec2) -> None:
         """
         makes Tentacle follow target:
         1) last Segment follows target
@@ -203,7 +203,7 @@ class Ball:
      * a ``GRAVITY`` force
      * a bounce method on the lower edge of the screen
     """
-    GRAVITY = Vector(0, .07)
+    GRAVITY = Vec2(0, .07)
     RADIUS = 7
     VELOCITY = 4
 
@@ -223,10 +223,10 @@ class Ball:
             win : tuple
                 size of the windows
         """
-        self.pos = Vector(x, y)
+        self.pos = Vec2(x, y)
         self.win = win
 
-        self.vel = Vector.random2d(mag=self.VELOCITY)
+        self.vel = Vec2.random2d(mag=self.VELOCITY)
         self.vel.heading = _constrain(self.vel.heading, -pi / 8, pi / 8)
 
         self._renderer = renderer
@@ -296,7 +296,7 @@ def setup() -> None:
             Tentacle(renderer, (WIDTH, HEIGHT),
                      SIZE,
                      seg_length=LENGTH,
-                     base=Vector(x, y)))
+                     base=Vec2(x, y)))
 
     ball = Ball(renderer, 100, 100, (WIDTH, HEIGHT))
 
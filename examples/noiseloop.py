@@ -1,3 +1,4 @@
+import numpy as np
 from phoenyx import *
 
 renderer: Renderer = Renderer(600, 600, "Perlin Noise Loop")
@@ -9,6 +10,11 @@ t_offset = 0
 spacing = 0.05
 slider: Slider
 
+# one row of (x, y, width, height) per cell, column after column
+cells = np.indices((600 // w, 600 // w)).reshape(2, -1).T * w
+cells = np.hstack((cells, np.full_like(cells, w)))
+offsets = np.arange(600 // w) * spacing
+
 
 def switch() -> None:
     global SHOWINFO
@@ -41,16 +47,10 @@ def setup() -> None:
 def draw() -> None:
     global slider, t_offset
 
-    y_offset = 0
-    for i in range(600 // w):
-        x_offset = 0
-        for j in range(600 // w):
-            d = noise(x_offset, y_offset, t_offset)
-            d = int((d+1) * 255 / 2)
-            renderer.fill = d
-            renderer.rect((i * w, j * w), w, w)
-            x_offset += spacing
-        y_offset += spacing
+    # d[j, i] is the noise of the cell in column i and row j
+    d = noise.grid(offsets, offsets, [t_offset])[:, :, 0]
+    d = ((d.T.ravel() + 1) * 255 / 2).astype(int)
+    renderer.rects(cells, np.repeat(d[:, np.newaxis], 3, axis=1))
 
     t_offset += slider.value
 
@@ -2,7 +2,7 @@ from phoenyx import *
 import random as rd
 
 renderer: Renderer = Renderer(600, 600, "collision")
-sandbox: SandBox = SandBox(renderer)
+sandbox: SandBox = SandBox(renderer, sleep_time_threshold=.5)
 
 count = 0
 fall = True
@@ -37,6 +37,7 @@ def setup() -> None:
     global fall
     init()
     renderer.create_menu("options", toggle=revert, clear=clear)
+    renderer.set_idle(lambda: not fall and sandbox.is_idle)
 
     renderer.set_background(51)
     renderer.text_size = 15
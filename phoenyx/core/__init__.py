@@ -1,2 +1,7 @@
+from .batchrunner import *
+from .profiler import *
+from .recorder import *
 from .renderer import *
 from .sandbox import *
+from .shapegroup import *
+from .textcache import *
@@ -0,0 +1,252 @@
+from concurrent.futures import ProcessPoolExecutor, Future
+from itertools import product
+from multiprocessing import shared_memory
+from typing import Callable, Union
+import time
+import numpy as np
+
+__all__ = ["BatchRunner"]
+
+from ..data import *
+
+
+def _kinetic_observe(sandbox) -> np.ndarray:
+    """
+    default observable : number of bodies and total kinetic energy
+    """
+    bodies = sandbox.bodies
+    return np.array((len(bodies), sum(b.kinetic_energy for b in bodies)),
+                    dtype=np.float64)
+
+
+def _run_scene(name: str, shape: tuple[int, ...], index: int,
+               factory: Callable, params: dict, steps: int, observe: Callable,
+               fps: int, iter: int) -> tuple[int, float]:
+    """
+    worker : builds a scene, steps it and writes its observables to shared memory
+
+    Returns
+    -------
+        tuple[int, float] : index of the run and seconds spent stepping
+    """
+    # workers share the resource tracker of the main process, which unlinks the block
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        results = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+        progress = np.ndarray((shape[0], ),
+                              dtype=np.int64,
+                              buffer=shm.buf,
+                              offset=results.nbytes)
+        sandbox = factory(**params)
+        out = results[index]
+        start = time.perf_counter()
+        for k in range(steps):
+            sandbox.step(fps, iter)
+            out[k] = observe(sandbox)
+            progress[index] = k + 1
+        elapsed = time.perf_counter() - start
+        del results, progress, out
+    finally:
+        shm.close()
+    return index, elapsed
+
+
+class BatchRunner:
+    """
+    Phoenyx BatchRunner
+    ===================
+    Runs many independent SandBox scenes in parallel processes, without Renderer.
+    1. a scene factory builds one SandBox (created with ``renderer=None``) from keyword parameters
+    2. the parameter grid gives the parameters of each run (cartesian product of a dict of lists,
+       or a list of dicts)
+    3. after each step, the observables of each run are written to a shared memory
+       ``(runs, steps, ...)`` array, readable while the runs go on
+    4. ``report`` gives the throughput in steps per second
+
+    The factory and observe functions must be picklable (defined at the top level of a module).
+
+    Examples
+    --------
+    >>> def galton(elasticity, friction):
+    ...     sandbox = SandBox(None, 300, 300)
+    ...     ...
+    ...     return sandbox
+    >>> with BatchRunner(galton, {"elasticity": [.2, .5, .8], "friction": [.5, .9]}, 600) as runner:
+    ...     results = runner.run()
+    >>> runner.report
+    ... # {'runs': 6, 'steps': 3600, 'seconds': ..., 'steps_per_second': ..., 'run_steps_per_second': ...}
+    """
+    def __init__(self,
+                 factory: Callable,
+                 grid: Union[dict[str, list], list[dict]],
+                 steps: int,
+                 observe: Callable = None,
+                 fps: int = 60,
+                 iter: int = 1,
+                 workers: int = None) -> None:
+        """
+        new BatchRunner instance\\
+        builds the first scene once to get the shape of the observables
+
+        Parameters
+        ----------
+            factory : Callable
+                function building a SandBox from the keyword parameters of a run
+            grid : dict[str, list] | list[dict]
+                values taken by each parameter, or the parameters of each run
+            steps : int
+                number of steps of each run
+            observe : Callable, (optional)
+                function of the SandBox giving a fixed shape array after each step
+                defaults to the number of bodies and their total kinetic energy
+            fps : int, (optional)
+                frames per second given to ``SandBox.step``
+                defaults to 60
+            iter : int, (optional)
+                iterations per step given to ``SandBox.step``
+                defaults to 1
+            workers : int, (optional)
+                number of processes
+                defaults to the number of processors
+        """
+        if isinstance(grid, dict):
+            keys = list(grid)
+            self.params = [
+                dict(zip(keys, values))
+                for values in product(*(grid[k] for k in keys))
+            ]
+        else:
+            self.params = [dict(p) for p in grid]
+
+        self._factory = factory
+        self._observe = observe if observe is not None else _kinetic_observe
+        self._steps = steps
+        self._fps = fps
+        self._iter = iter
+        self._workers = workers
+
+        probe = np.asarray(self._observe(factory(**self.params[0])),
+                           dtype=np.float64)
+        self._shape = (len(self.params), steps) + probe.shape
+
+        size = int(np.prod(self._shape)) * 8 + len(self.params) * 8
+        self._shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        self._results = np.ndarray(self._shape,
+                                   dtype=np.float64,
+                                   buffer=self._shm.buf)
+        self._results.fill(np.nan)
+        self._progress = np.ndarray((len(self.params), ),
+                                    dtype=np.int64,
+                                    buffer=self._shm.buf,
+                                    offset=self._results.nbytes)
+        self._progress.fill(0)
+
+        self._pool: ProcessPoolExecutor = None
+        self._futures: list[Future] = []
+        self._start = 0.
+        self._elapsed = np.zeros(len(self.params))
+        self.report: dict[str, Union[int, float, np.ndarray]] = {}
+
+    def __enter__(self) -> "BatchRunner":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @property
+    def results(self) -> np.ndarray:
+        """
+        gets the observables, a ``(runs, steps, ...)`` array filled with nan until written\\
+        this is a live view of the shared memory while the runs go on, a copy after ``close``
+        """
+        return self._results
+
+    @property
+    def progress(self) -> np.ndarray:
+        """
+        gets the number of steps done by each run
+        """
+        return self._progress
+
+    @property
+    def is_running(self) -> bool:
+        """
+        gets if some runs are not finished yet
+        """
+        return any(not f.done() for f in self._futures)
+
+    def start(self) -> None:
+        """
+        starts all runs in the background, see ``results``, ``progress`` and ``wait``
+        """
+        if self._pool is not None:
+            warn(f"WARNING [batch runner] : runs already started")
+            return
+        if self._shm is None:
+            warn(f"ERROR [batch runner] : runner closed, nothing happened")
+            return
+        self._pool = ProcessPoolExecutor(self._workers)
+        self._start = time.perf_counter()
+        self._futures = [
+            self._pool.submit(_run_scene, self._shm.name, self._shape, i,
+                              self._factory, params, self._steps,
+                              self._observe, self._fps, self._iter)
+            for i, params in enumerate(self.params)
+        ]
+
+    def wait(self) -> dict[str, Union[int, float, np.ndarray]]:
+        """
+        waits for all runs to finish and fills ``report``
+
+        Returns
+        -------
+            dict : ``runs``, total ``steps``, wall clock ``seconds``, overall ``steps_per_second``
+            and ``run_steps_per_second`` (one value per run, time spent stepping in the worker)
+        """
+        if self._pool is None:
+            self.start()
+        for future in self._futures:
+            index, elapsed = future.result()
+            self._elapsed[index] = elapsed
+        seconds = time.perf_counter() - self._start
+        self._pool.shutdown()
+
+        total = int(self._progress.sum())
+        self.report = {
+            "runs": len(self.params),
+            "steps": total,
+            "seconds": seconds,
+            "steps_per_second": total / seconds if seconds > 0 else 0.,
+            "run_steps_per_second":
+            self._steps / np.maximum(self._elapsed, 1e-12),
+        }
+        return self.report
+
+    def run(self) -> np.ndarray:
+        """
+        starts all runs and waits for them, see ``start`` and ``wait``
+
+        Returns
+        -------
+            np.ndarray : copy of the ``(runs, steps, ...)`` observables
+        """
+        self.start()
+        self.wait()
+        return self._results.copy()
+
+    def close(self) -> None:
+        """
+        waits for the runs if needed and frees the shared memory\\
+        ``results`` and ``progress`` are copied beforehand
+        """
+        if self._shm is None:
+            return
+        if self._pool is not None:
+            if self.is_running:
+                self.wait()
+            self._pool.shutdown()
+        self._results = self._results.copy()
+        self._progress = self._progress.copy()
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
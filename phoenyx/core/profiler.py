@@ -0,0 +1,214 @@
+from collections import deque
+import csv
+import json
+import time
+import pygame
+import numpy as np
+
+__all__ = ["Profiler"]
+
+from ..data import *
+
+_COLORS = [
+    (230, 25, 75),
+    (60, 180, 75),
+    (255, 225, 25),
+    (0, 130, 200),
+    (245, 130, 48),
+    (145, 30, 180),
+    (70, 240, 240),
+    (240, 50, 230),
+    (210, 245, 60),
+    (250, 190, 212),
+]
+
+
+class Profiler:
+    """
+    Phoenyx Profiler
+    ================
+    created by ``Renderer.set_profiler``
+
+    Times each phase of ``Renderer.run`` (update, draw, ui elements, events, tick,
+    overlay, present...) with ``time.perf_counter_ns``, and each type of ui element.
+    1. the last ``window`` samples of each phase are kept
+    2. ``stats`` gets the 50th, 95th and 99th percentiles of each phase
+    3. ``draw`` renders a stacked graph of the last frames with the percentiles
+    4. ``export`` writes the samples to a csv or json file
+    """
+    def __init__(self, window: int = 240, overlay: bool = False) -> None:
+        """
+        new Profiler instance
+
+        Parameters
+        ----------
+            window : int, (optional)
+                number of samples kept for each phase
+                defaults to 240
+            overlay : bool, (optional)
+                if the Renderer should draw the overlay each frame
+                defaults to False
+        """
+        self._window = max(window, 1)
+        self._samples: dict[str, deque[int]] = {}
+        self.overlay = overlay
+
+    def lap(self, phase: str, start: int) -> int:
+        """
+        records the time elapsed since ``start`` for a phase
+
+        Parameters
+        ----------
+            phase : str
+                name of the phase
+            start : int
+                start time of the phase, from ``time.perf_counter_ns``
+
+        Returns
+        -------
+            int : the current time, to start the next phase with
+        """
+        now = time.perf_counter_ns()
+        try:
+            self._samples[phase].append(now - start)
+        except KeyError:
+            self._samples[phase] = deque([now - start], maxlen=self._window)
+        return now
+
+    @property
+    def phases(self) -> list[str]:
+        """
+        gets the name of the recorded phases, in order of appearance
+        """
+        return list(self._samples)
+
+    def samples(self, phase: str) -> np.ndarray:
+        """
+        gets the recorded samples of a phase in nanoseconds, oldest first
+
+        Parameters
+        ----------
+            phase : str
+                name of the phase
+        """
+        return np.fromiter(self._samples.get(phase, ()), dtype=np.int64)
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """
+        gets the median, 95th and 99th percentiles and mean of each phase in milliseconds
+
+        Returns
+        -------
+            dict[str, dict[str, float]] : ``{phase: {"p50": ..., "p95": ..., "p99": ..., "mean": ...}}``
+        """
+        stats = {}
+        for phase in self._samples:
+            ms = self.samples(phase) / 1e6
+            p50, p95, p99 = np.percentile(ms, (50, 95, 99))
+            stats[phase] = {
+                "p50": float(p50),
+                "p95": float(p95),
+                "p99": float(p99),
+                "mean": float(ms.mean())
+            }
+        return stats
+
+    def clear(self) -> None:
+        """
+        forgets all samples
+        """
+        self._samples.clear()
+
+    def export(self, path: str) -> None:
+        """
+        writes the samples to a file\\
+        json files also get the stats, csv files get one ``phase, index, ns`` row per sample
+
+        Parameters
+        ----------
+            path : str
+                path of the file, ending with ``.json`` or ``.csv``
+        """
+        if path.endswith(".json"):
+            with open(path, "w") as f:
+                json.dump(
+                    {
+                        "samples": {
+                            phase: list(samples)
+                            for phase, samples in self._samples.items()
+                        },
+                        "stats": self.stats(),
+                    }, f)
+        elif path.endswith(".csv"):
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(("phase", "index", "ns"))
+                for phase, samples in self._samples.items():
+                    writer.writerows(
+                        (phase, i, ns) for i, ns in enumerate(samples))
+        else:
+            warn(
+                f"ERROR [profiler] : can't export to {path}, use a .json or .csv file"
+            )
+
+    def draw(
+        self,
+        renderer,
+        pos: tuple[int, int] = (10, 10),
+        size: tuple[int, int] = (240, 80)
+    ) -> None:
+        """
+        draws a stacked graph of the time spent in each phase over the last frames\\
+        plus the percentiles of each phase, directly on the window
+
+        Parameters
+        ----------
+            renderer : Renderer
+                the renderer to draw on
+            pos : tuple[int, int], (optional)
+                top left corner of the overlay
+                defaults to (10, 10)
+            size : tuple[int, int], (optional)
+                width and height of the graph
+                defaults to (240, 80)
+        """
+        phases = [p for p in self._samples if not p.startswith("ui:")]
+        if not phases:
+            return
+        window = renderer._window
+        x, y = pos
+        w, h = size
+        n = min(w, self._window)
+
+        # last n samples of each phase, aligned on the most recent frame
+        stack = np.zeros((len(phases), n))
+        for i, phase in enumerate(phases):
+            samples = self.samples(phase)[-n:] / 1e6
+            stack[i, n - len(samples):] = samples
+        top = np.cumsum(stack, axis=0)
+        scale = h / max(top[-1].max(), 1e-3)
+        bar = w / n
+
+        rects = [window.fill((0, 0, 0), (x, y, w, h))]
+        for i in range(len(phases) - 1, -1, -1):
+            color = _COLORS[i % len(_COLORS)]
+            for j in np.flatnonzero(top[i]):
+                height = max(int(top[i, j] * scale), 1)
+                window.fill(color,
+                            (x + int(j * bar), y + h - height, max(
+                                int(bar), 1), height))
+
+        # percentiles, ui element types in grey
+        stats = self.stats()
+        ty = y + h + 2
+        for phase, s in stats.items():
+            if phase in phases:
+                color = _COLORS[phases.index(phase) % len(_COLORS)]
+            else:
+                color = (200, 200, 200)
+            label = f"{phase} {s['p50']:.2f} / {s['p95']:.2f} / {s['p99']:.2f} ms"
+            surface = renderer.font.render(label, True, color)
+            rects.append(window.blit(surface, (x, ty)))
+            ty += surface.get_height()
+        for rect in rects:
+            renderer._mark(rect)
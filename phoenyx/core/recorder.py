@@ -0,0 +1,213 @@
+import os
+import queue
+import shutil
+import subprocess
+import threading
+import pygame
+import numpy as np
+
+__all__ = ["Recorder"]
+
+from ..data import *
+
+_FORMATS = ("png", "npy", "raw")
+_NPY_HEADER_SIZE = 128
+
+
+def _npy_header(shape: tuple[int, ...]) -> bytes:
+    """
+    builds a version 1.0 ``.npy`` header of fixed size for uint8 data\\
+    so it can be rewritten in place once the number of frames is known
+    """
+    header = f"{{'descr': '|u1', 'fortran_order': False, 'shape': {shape}, }}"
+    header = header.ljust(_NPY_HEADER_SIZE - 10 - 1) + "\n"
+    length = len(header).to_bytes(2, "little")
+    return b"\x93NUMPY\x01\x00" + length + header.encode("latin1")
+
+
+class Recorder:
+    """
+    Phoenyx Recorder
+    ================
+    created by ``Renderer.record``
+
+    Writes frames to disk from a background thread, so the main loop only pays for
+    copying the frame into a bounded queue.
+    1. ``png`` : a sequence of numbered png files in a directory
+    2. ``npy`` : a single uncompressed ``(frames, height, width, 3)`` uint8 stack
+    3. ``raw`` : a raw rgb24 stream, piped to an external encoder if it is found\\
+       (the output format is then guessed by the encoder from the file extension)
+    """
+    def __init__(self,
+                 path: str,
+                 size: tuple[int, int],
+                 fmt: str = "png",
+                 fps: int = 60,
+                 queue_size: int = 64,
+                 policy: str = BLOCK,
+                 encoder: str = "ffmpeg") -> None:
+        """
+        new Recorder instance
+
+        Parameters
+        ----------
+            path : str
+                directory for ``png``, file path for ``npy`` and ``raw``
+            size : tuple[int, int]
+                width and height of the frames
+            fmt : str, (optional)
+                one of ``png``, ``npy`` or ``raw``
+                defaults to "png"
+            fps : int, (optional)
+                frame rate given to the external encoder
+                defaults to 60
+            queue_size : int, (optional)
+                maximum number of frames waiting to be written
+                defaults to 64
+            policy : str, (optional)
+                what to do when the queue is full, ``BLOCK`` the main loop or ``DROP`` the frame
+                defaults to BLOCK
+            encoder : str, (optional)
+                external encoder used by ``raw``, set to None to write the raw stream itself
+                defaults to "ffmpeg"
+        """
+        if fmt not in _FORMATS:
+            warn(
+                f"ERROR [recorder] : format {fmt} is not supported, png used instead"
+            )
+            fmt = "png"
+        if policy not in (BLOCK, DROP):
+            warn(
+                f"ERROR [recorder] : policy {policy} is not supported, BLOCK used instead"
+            )
+            policy = BLOCK
+
+        self._path = path
+        self._width, self._height = size
+        self._fmt = fmt
+        self._fps = fps
+        self._policy = policy
+        self._encoder = encoder
+
+        self._file = None
+        self._process: subprocess.Popen = None
+        self._error: Exception = None
+
+        self.frames = 0
+        self.dropped = 0
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max(queue_size, 1))
+        self._open()
+        self._thread = threading.Thread(target=self._write_loop, daemon=True)
+        self._thread.start()
+
+    @property
+    def is_recording(self) -> bool:
+        """
+        gets if the Recorder still accepts frames
+        """
+        return self._thread is not None
+
+    def _open(self) -> None:
+        """
+        opens the output, and the external encoder if any
+        """
+        if self._fmt == "png":
+            os.makedirs(self._path, exist_ok=True)
+        elif self._fmt == "npy":
+            self._file = open(self._path, "wb")
+            self._file.write(_npy_header((0, self._height, self._width, 3)))
+        else:
+            exe = shutil.which(
+                self._encoder) if self._encoder is not None else None
+            if exe is None:
+                if self._encoder is not None:
+                    warn(
+                        f"ERROR [recorder] : encoder {self._encoder} not found, writing raw rgb24 stream"
+                    )
+                self._file = open(self._path, "wb")
+            else:
+                self._process = subprocess.Popen(
+                    [
+                        exe, "-y", "-loglevel", "error", "-f", "rawvideo",
+                        "-pix_fmt", "rgb24", "-s",
+                        f"{self._width}x{self._height}", "-r",
+                        str(self._fps), "-i", "-", self._path
+                    ],
+                    stdin=subprocess.PIPE,
+                )
+                self._file = self._process.stdin
+
+    def push(self, frame: np.ndarray) -> None:
+        """
+        hands a frame over to the writer thread\\
+        only blocks when the queue is full and the policy is ``BLOCK``
+
+        Parameters
+        ----------
+            frame : np.ndarray
+                (height, width, 3) array of uint8 rgb values, must not be modified afterwards
+        """
+        if self._thread is None:
+            return
+        if self._policy == BLOCK:
+            self._queue.put(frame)
+        else:
+            try:
+                self._queue.put_nowait(frame)
+            except queue.Full:
+                self.dropped += 1
+
+    def _write_loop(self) -> None:
+        """
+        writes frames until the stop sentinel is received\\
+        keeps draining the queue after an error so the main loop never hangs
+        """
+        while (frame := self._queue.get()) is not None:
+            if self._error is not None:
+                continue
+            try:
+                self._write(np.ascontiguousarray(frame, dtype=np.uint8))
+                self.frames += 1
+            except (OSError, ValueError, pygame.error) as e:
+                self._error = e
+
+    def _write(self, frame: np.ndarray) -> None:
+        """
+        writes a single contiguous frame
+        """
+        if self._fmt == "png":
+            surface = pygame.image.frombuffer(frame.tobytes(),
+                                              (self._width, self._height),
+                                              "RGB")
+            name = os.path.join(self._path, f"frame_{self.frames:06d}.png")
+            pygame.image.save(surface, name)
+        else:
+            self._file.write(frame.tobytes())
+
+    def close(self) -> None:
+        """
+        waits for the queued frames to be written and closes the output
+        """
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+        if self._fmt == "npy" and self._error is None:
+            self._file.seek(0)
+            self._file.write(
+                _npy_header((self.frames, self._height, self._width, 3)))
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError as e:
+                self._error = self._error or e
+        if self._process is not None:
+            self._process.wait()
+
+        if self._error is not None:
+            warn(
+                f"ERROR [recorder] : recording to {self._path} stopped after {self.frames} frames ({self._error})"
+            )
@@ -1,9 +1,10 @@
 from typing import Callable, Union
+from itertools import repeat
 import pygame
 import difflib
+import time
 import math as m
-
-pygame.init()
+import numpy as np
 
 __all__ = ["Renderer"]
 
@@ -12,6 +13,72 @@ import __main__  # type: ignore (pylance bad)
 from ..data import *
 from ..pmath import *
 from ..elements import *
+from .textcache import TextCache
+from .recorder import Recorder
+from .profiler import Profiler
+
+
+def _xy(point: Union[tuple, list, Vector]) -> Union[tuple, list]:
+    """
+    Gets the first two coordinates of a point in a form pygame parses quickly\\
+    numpy arrays (hence Vectors) become lists, other sequences are sliced
+    """
+    if isinstance(point, np.ndarray):
+        return point.tolist()[:2]
+    return point[:2]
+
+
+class _State:
+    """
+    Snapshot of the drawing state of a Renderer\\
+    copied and restored by plain attribute assignment, used by push and pop
+    """
+    __slots__ = ("fill_color", "fill", "stroke_color", "stroke_weight",
+                 "stroke", "matrix", "rect_mode", "translation_behavior",
+                 "rotation_behavior", "scale_behavior", "text_color",
+                 "text_size", "ff_name", "ff_is_sys", "font")
+
+    def __init__(self, renderer: "Renderer") -> None:
+        """
+        new state saving the current attributes of ``renderer``
+        """
+        self.fill_color = renderer._fill_color
+        self.fill = renderer._fill
+        self.stroke_color = renderer._stroke_color
+        self.stroke_weight = renderer._stroke_weight
+        self.stroke = renderer._stroke
+        self.matrix = renderer._matrix
+        self.rect_mode = renderer._rect_mode
+        self.translation_behavior = renderer._translation_behavior
+        self.rotation_behavior = renderer._rotation_behavior
+        self.scale_behavior = renderer._scale_behavior
+        self.text_color = renderer._text_color
+        self.text_size = renderer._text_size
+        self.ff_name = renderer._ff_name
+        self.ff_is_sys = renderer._ff_is_sys
+        self.font = renderer.font
+
+    def restore(self, renderer: "Renderer") -> None:
+        """
+        puts the saved attributes back on ``renderer``\\
+        the saved font object is reused, nothing is rebuilt
+        """
+        renderer._fill_color = self.fill_color
+        renderer._fill = self.fill
+        renderer._stroke_color = self.stroke_color
+        renderer._stroke_weight = self.stroke_weight
+        renderer._stroke = self.stroke
+        if renderer._matrix is not self.matrix:
+            renderer._set_matrix(self.matrix)
+        renderer._rect_mode = self.rect_mode
+        renderer._translation_behavior = self.translation_behavior
+        renderer._rotation_behavior = self.rotation_behavior
+        renderer._scale_behavior = self.scale_behavior
+        renderer._text_color = self.text_color
+        renderer._text_size = self.text_size
+        renderer._ff_name = self.ff_name
+        renderer._ff_is_sys = self.ff_is_sys
+        renderer.font = self.font
 
 
 class Renderer:
@@ -96,7 +163,11 @@ class Renderer:
 
     # font = pygame.font.SysFont("comicsans", 11)
 
-    def __init__(self, width: int, height: int, title: str = None) -> None:
+    def __init__(self,
+                 width: int,
+                 height: int,
+                 title: str = None,
+                 headless: bool = False) -> None:
         """
         new Renderer instance
 
@@ -109,17 +180,17 @@ class Renderer:
             title : str, (optional)
                 title of the window, can be changed
                 defaults to None
+            headless : bool, (optional)
+                draws into an in-memory surface instead of opening a window\\
+                no display is needed, events and frame rate limits are skipped
+                defaults to False
         """
         # window management
-        self._window: pygame.Surface = pygame.display.set_mode((width, height))
+        self._headless = headless
         self._width = width
         self._height = height
         self._title = (title, "Pygame Engine with Python")[title is None]
-        pygame.display.set_caption(self._title)
-
-        self.font = pygame.font.SysFont("comicsans", 11)
-        self._ff_name = "comicsans"
-        self._ff_is_sys = True
+        self._window: pygame.Surface = self._open_window()
 
         # drawing attributes management
         self._fill_color = (255, 255, 255)
@@ -129,20 +200,13 @@ class Renderer:
         self._stroke = True
         self._rect_mode = CORNER
 
-        # offsets
-        self._has_translation = False
-        self._x_offset = 0
-        self._y_offset = 0
+        # affine transformation matrix (translations, rotations and scales)
+        self._matrix = np.identity(3)
+        self._affine = (1., 0., 0., 0., 1., 0.)
+        self._matrix_scale = 1.
+        self._has_matrix = False
         self._translation_behavior = RESET
-
-        # angles
-        self._has_rotation = False
-        self._rot_angle = 0
         self._rotation_behavior = RESET
-
-        # scale
-        self._has_scale = False
-        self._scale_factor = 1
         self._scale_behavior = RESET
 
         # background
@@ -156,6 +220,10 @@ class Renderer:
         # text management
         self._text_color = (255, 255, 255)
         self._text_size = 12
+        self._ff_name = "comicsans"
+        self._ff_is_sys = True
+        self._text_cache = TextCache()
+        self.font = self._text_cache.get_font(self._ff_name, self._text_size)
 
         # buttons management
         self._has_buttons = False
@@ -185,9 +253,7 @@ class Renderer:
 
         # save
         self._has_save = False
-        # list[list[tuple[int, int, int], bool, tuple[int, int, int], int, bool, bool, int, int, bool,
-        #           Union[int, float], bool, Union[int, float], str, str, str, str, tuple[int, int, int], int]]
-        self._save: list[list[18]] = []
+        self._save: list[_State] = []
 
         # keys
         self._key_binding: dict[int, int] = {}
@@ -199,8 +265,28 @@ class Renderer:
         # bench mode
         self._benchmark = False
 
+        # dirty rectangles mode
+        self._dirty_mode = False
+        self._full_redraw = True
+        self._dirty_rects: list[pygame.Rect] = []
+        self._prev_dirty_rects: list[pygame.Rect] = []
+
+        # idle throttling
+        self._idle: Callable[[], bool] = None
+        self._is_idle = False
+        self._idle_fps = 10
+        self._idle_redraw = True
+        self._idle_frame: pygame.Surface = None
+
         # running
         self._is_running = True
+        self._frame_count = 0
+
+        # recording
+        self._recorder: Recorder = None
+
+        # profiling
+        self._profiler: Profiler = None
 
     def set_title(self, title: str) -> None:
         """
@@ -212,15 +298,144 @@ class Renderer:
                 the new title
         """
         self._title = title
-        pygame.display.set_caption(self._title)
+        if not self._headless:
+            pygame.display.set_caption(self._title)
 
     def set_icon(self, path: str) -> None:
         """
         sets the icon of the app
         """
+        if self._headless:
+            return
         surface = pygame.image.load(path)
         pygame.display.set_icon(surface)
 
+    def _open_window(self) -> pygame.Surface:
+        """
+        initializes pygame and gets the surface to draw on\\
+        a display window, or an in-memory surface in headless mode
+        """
+        size = self._width, self._height
+        if self._headless:
+            pygame.font.init()
+            return pygame.Surface(size)
+        pygame.init()
+        window = pygame.display.set_mode(size)
+        pygame.display.set_caption(self._title)
+        return window
+
+    @property
+    def is_headless(self) -> bool:
+        """
+        gets if the Renderer draws into an in-memory surface instead of a window
+        """
+        return self._headless
+
+    @property
+    def frame_count(self) -> int:
+        """
+        gets the number of frames drawn by ``run`` so far
+        """
+        return self._frame_count
+
+    def get_frame(self, copy: bool = True) -> np.ndarray:
+        """
+        gets the current content of the window as a numpy array
+
+        Parameters
+        ----------
+            copy : bool, (optional)
+                if False, gets a view that writes through to the window\\
+                the window stays locked until the view is deleted
+                defaults to True
+
+        Returns
+        -------
+            np.ndarray : (height, width, 3) array of uint8 rgb values
+        """
+        if copy:
+            return pygame.surfarray.array3d(self._window).swapaxes(0, 1)
+        return pygame.surfarray.pixels3d(self._window).swapaxes(0, 1)
+
+    def record(self,
+               path: str,
+               fmt: str = "png",
+               queue_size: int = 64,
+               policy: str = BLOCK,
+               encoder: str = "ffmpeg") -> Recorder:
+        """
+        starts recording every frame shown by ``run`` or ``flip``\\
+        frames are written by a background thread, see ``help(phoenyx.Recorder)``
+
+        Parameters
+        ----------
+            path : str
+                directory for ``png``, file path for ``npy`` and ``raw``
+            fmt : str, (optional)
+                one of ``png``, ``npy`` or ``raw``
+                defaults to "png"
+            queue_size : int, (optional)
+                maximum number of frames waiting to be written
+                defaults to 64
+            policy : str, (optional)
+                what to do when the queue is full, ``BLOCK`` the main loop or ``DROP`` the frame
+                defaults to BLOCK
+            encoder : str, (optional)
+                external encoder the ``raw`` stream is piped to if it is found
+                defaults to "ffmpeg"
+
+        Returns
+        -------
+            Recorder : the new recorder
+        """
+        self.stop_record()
+        self._recorder = Recorder(path, (self._width, self._height), fmt,
+                                  self._fps, queue_size, policy, encoder)
+        return self._recorder
+
+    def stop_record(self) -> None:
+        """
+        stops recording and waits for the remaining frames to be written\\
+        called by ``quit``
+        """
+        if self._recorder is not None:
+            self._recorder.close()
+            self._recorder = None
+
+    def set_profiler(self,
+                     enabled: bool = True,
+                     overlay: bool = False,
+                     window: int = 240) -> Profiler:
+        """
+        enables or disables the timing of each phase of ``run``\\
+        see ``help(phoenyx.Profiler)``
+
+        Parameters
+        ----------
+            enabled : bool, (optional)
+                if the profiler should be enabled
+                defaults to True
+            overlay : bool, (optional)
+                if the profiler graph should be drawn on top of each frame
+                defaults to False
+            window : int, (optional)
+                number of samples kept for each phase
+                defaults to 240
+
+        Returns
+        -------
+            Profiler : the new profiler, None if disabled
+        """
+        self._profiler = Profiler(window, overlay) if enabled else None
+        return self._profiler
+
+    @property
+    def profiler(self) -> Profiler:
+        """
+        gets the profiler, None if disabled
+        """
+        return self._profiler
+
     @property
     def win_width(self) -> int:
         """
@@ -441,11 +656,11 @@ class Renderer:
             size : int
                 new text size
         """
+        if size == self._text_size:
+            return
         self._text_size = size
-        if self._ff_is_sys:
-            self.font = pygame.font.SysFont(self._ff_name, size)
-        else:
-            self.font = pygame.font.Font(self._ff_name, size)
+        self.font = self._text_cache.get_font(self._ff_name, size,
+                                              self._ff_is_sys)
 
     @property
     def text_font(self) -> str:
@@ -476,15 +691,14 @@ class Renderer:
             )
             return
 
-        size = self._text_size
         if name is not None:
             self._ff_name = name
             self._ff_is_sys = True
-            self.font = pygame.font.SysFont(self._ff_name, size)
         elif path is not None:
             self._ff_name = path
             self._ff_is_sys = False
-            self.font = pygame.font.Font(self._ff_name, size)
+        self.font = self._text_cache.get_font(self._ff_name, self._text_size,
+                                              self._ff_is_sys)
 
     @property
     def text_color(self) -> tuple[int, int, int]:
@@ -601,50 +815,63 @@ class Renderer:
                 )
                 self.stroke_weight = 1
 
-    def _offset_point(self, point: tuple) -> list[float, float]:
+    def _mark(self, rect: pygame.Rect) -> None:
         """
-        Offsets a point based on _x_offset and _y_offset
+        Records an area of the window that has been drawn on\\
+        only used in dirty rectangles mode
 
         Parameters
         ----------
-            point : tuple
-                the point to apply the transformation
-
-        Returns
-        -------
-            list : transformed point
+            rect : pygame.Rect
+                the area, as returned by pygame drawing functions
         """
-        point = list(point)
-        new_point = [point[0] + self._x_offset, point[1] + self._y_offset]
-        return new_point
+        if self._dirty_mode:
+            self._dirty_rects.append(rect)
 
-    def _rotate_point(self, point: tuple) -> list[float, float]:
+    def _mark_points(self, points: np.ndarray, pad: float) -> None:
         """
-        Rotates a point based on _rot_angle in radians\\
-        relatives to the axis origin
+        Records the bounding box of an array of points that has been drawn on\\
+        only used in dirty rectangles mode
 
         Parameters
         ----------
-            point : tuple
-                the point to apply the transformation
+            points : np.ndarray
+                (N, 2) array of points
+            pad : float
+                extra space around the points (radius, stroke weight...)
+        """
+        if self._dirty_mode and len(points):
+            x0, y0 = np.floor(points.min(axis=0) - pad).tolist()
+            x1, y1 = np.ceil(points.max(axis=0) + pad).tolist()
+            self._dirty_rects.append(
+                pygame.Rect(x0, y0, x1 - x0 + 1, y1 - y0 + 1))
 
-        Returns
-        -------
-            list : transformed point
+    def _mark_all(self) -> None:
         """
-        point = list(point)
-        new_point = [
-            point[0] * m.cos(self._rot_angle) -
-            point[1] * m.sin(self._rot_angle),
-            point[0] * m.sin(self._rot_angle) +
-            point[1] * m.cos(self._rot_angle)
-        ]
-        return new_point
+        Records that the whole window has been drawn on\\
+        only used in dirty rectangles mode
+        """
+        if self._dirty_mode:
+            self._full_redraw = True
 
-    def _scale_point(self, point: tuple) -> list[float, float]:
+    def _set_matrix(self, matrix: np.ndarray) -> None:
         """
-        Scales a point based on _scale_factor\\
-        relatives to the axis origin
+        Sets the current transformation matrix\\
+        also caches its coefficients so single points are transformed without numpy
+
+        Parameters
+        ----------
+            matrix : np.ndarray
+                3x3 affine matrix
+        """
+        self._matrix = matrix
+        a, b, tx, c, d, ty = self._affine = tuple(matrix[:2].ravel().tolist())
+        self._matrix_scale = m.sqrt(abs(a*d - b*c))
+        self._has_matrix = self._affine != (1., 0., 0., 0., 1., 0.)
+
+    def _transform_point(self, point: tuple) -> tuple[float, float]:
+        """
+        Applies the current transformation matrix to a point
 
         Parameters
         ----------
@@ -653,13 +880,11 @@ class Renderer:
 
         Returns
         -------
-            list : transformed point
+            tuple : transformed point
         """
-        point = list(point)
-        new_point = [
-            point[0] * self._scale_factor, point[1] * self._scale_factor
-        ]
-        return new_point
+        a, b, tx, c, d, ty = self._affine
+        x, y = _xy(point)
+        return a*x + b*y + tx, c*x + d*y + ty
 
     def line(self, point1: Union[tuple, list, Vector],
              point2: Union[tuple, list, Vector]) -> None:
@@ -674,19 +899,15 @@ class Renderer:
             point2 : tuple | list | Vector
                 second point
         """
-        if self._has_scale:
-            point1 = self._scale_point(point1)
-            point2 = self._scale_point(point2)
-        if self._has_rotation:
-            point1 = self._rotate_point(point1)
-            point2 = self._rotate_point(point2)
-        if self._has_translation:
-            point1 = self._offset_point(point1)
-            point2 = self._offset_point(point2)
+        if self._has_matrix:
+            point1 = self._transform_point(point1)
+            point2 = self._transform_point(point2)
 
         color = self.stroke
         weight = self.stroke_weight
-        pygame.draw.line(self._window, color, point1[:2], point2[:2], weight)
+        self._mark(
+            pygame.draw.line(self._window, color, _xy(point1), _xy(point2),
+                             weight))
 
     def aaline(self, point1: Union[tuple, list, Vector],
                point2: Union[tuple, list, Vector]) -> None:
@@ -701,19 +922,15 @@ class Renderer:
             point2 : tuple | list | Vector
                 second point
         """
-        if self._has_scale:
-            point1 = self._scale_point(point1)
-            point2 = self._scale_point(point2)
-        if self._has_rotation:
-            point1 = self._rotate_point(point1)
-            point2 = self._rotate_point(point2)
-        if self._has_translation:
-            point1 = self._offset_point(point1)
-            point2 = self._offset_point(point2)
+        if self._has_matrix:
+            point1 = self._transform_point(point1)
+            point2 = self._transform_point(point2)
 
         color = self.stroke
         weight = self.stroke_weight
-        pygame.draw.aaline(self._window, color, point1[:2], point2[:2], weight)
+        self._mark(
+            pygame.draw.aaline(self._window, color, _xy(point1), _xy(point2),
+                               weight))
 
     def lines(self,
               *points: Union[tuple, list, Vector],
@@ -731,15 +948,11 @@ class Renderer:
                 defaults to True
         """
         points: list[list[float, float]] = [list(p[:2]) for p in points]
-        if self._has_scale:
-            points = list(map(self._scale_point, points))
-        if self._has_rotation:
-            points = list(map(self._rotate_point, points))
-        if self._has_translation:
-            points = list(map(self._offset_point, points))
+        if self._has_matrix:
+            points = list(map(self._transform_point, points))
 
         color = self.stroke
-        pygame.draw.lines(self._window, color, closed, points)
+        self._mark(pygame.draw.lines(self._window, color, closed, points))
 
     def aalines(self,
                 *points: Union[tuple, list, Vector],
@@ -757,15 +970,11 @@ class Renderer:
                 defaults to True
         """
         points: list[list[float, float]] = [list(p[:2]) for p in points]
-        if self._has_scale:
-            points = list(map(self._scale_point, points))
-        if self._has_rotation:
-            points = list(map(self._rotate_point, points))
-        if self._has_translation:
-            points = list(map(self._offset_point, points))
+        if self._has_matrix:
+            points = list(map(self._transform_point, points))
 
         color = self.stroke
-        pygame.draw.aalines(self._window, color, closed, points)
+        self._mark(pygame.draw.aalines(self._window, color, closed, points))
 
     def polygon(self, *points: Union[tuple, list, Vector]) -> None:
         """
@@ -779,20 +988,17 @@ class Renderer:
         """
         self._debug_enabled_drawing_methods()
         points: list[list[float, float]] = [list(p[:2]) for p in points]
-        if self._has_scale:
-            points = list(map(self._scale_point, points))
-        if self._has_rotation:
-            points = list(map(self._rotate_point, points))
-        if self._has_translation:
-            points = list(map(self._offset_point, points))
+        if self._has_matrix:
+            points = list(map(self._transform_point, points))
 
         # fill
         if self._fill:
-            pygame.draw.polygon(self._window, self.fill, points, 0)
+            self._mark(pygame.draw.polygon(self._window, self.fill, points, 0))
         # stroke
         if self._stroke:
-            pygame.draw.polygon(self._window, self.stroke, points,
-                                self.stroke_weight)
+            self._mark(
+                pygame.draw.polygon(self._window, self.stroke, points,
+                                    self.stroke_weight))
 
     def rect(self, point: Union[tuple, list, Vector], width: int,
              height: int) -> None:
@@ -814,21 +1020,13 @@ class Renderer:
         if self.rect_mode == CENTER:
             point[0] -= width // 2
             point[1] -= height // 2
-        # if self._has_rotation:
-        #     point = self._rotate_point(point)
-        # if self._has_translation:
-        #     point = self._offset_point(point)
 
         x, y = point[:2]
         points = [(x, y), (x + width, y), (x + width, y + height),
                   (x, y + height)]
 
-        if self._has_scale:
-            points = list(map(self._scale_point, points))
-        if self._has_rotation:
-            points = list(map(self._rotate_point, points))
-        if self._has_translation:
-            points = list(map(self._offset_point, points))
+        if self._has_matrix:
+            points = list(map(self._transform_point, points))
 
         # # fill
         # if self._fill:
@@ -839,11 +1037,12 @@ class Renderer:
 
         # fill
         if self._fill:
-            pygame.draw.polygon(self._window, self.fill, points, 0)
+            self._mark(pygame.draw.polygon(self._window, self.fill, points, 0))
         # stroke
         if self._stroke:
-            pygame.draw.polygon(self._window, self.stroke, points,
-                                self.stroke_weight)
+            self._mark(
+                pygame.draw.polygon(self._window, self.stroke, points,
+                                    self.stroke_weight))
 
     def square(self, point: Union[tuple, list, Vector], size: int) -> None:
         """
@@ -862,20 +1061,12 @@ class Renderer:
         if self.rect_mode == CENTER:
             point[0] -= size // 2
             point[1] -= size // 2
-        # if self._has_rotation:
-        #     point = self._rotate_point(point)
-        # if self._has_translation:
-        #     point = self._offset_point(point)
 
         x, y = point[:2]
         points = [(x, y), (x + size, y), (x + size, y + size), (x, y + size)]
 
-        if self._has_scale:
-            points = list(map(self._scale_point, points))
-        if self._has_rotation:
-            points = list(map(self._rotate_point, points))
-        if self._has_translation:
-            points = list(map(self._offset_point, points))
+        if self._has_matrix:
+            points = list(map(self._transform_point, points))
 
         # # fill
         # if self._fill:
@@ -886,11 +1077,12 @@ class Renderer:
 
         # fill
         if self._fill:
-            pygame.draw.polygon(self._window, self.fill, points, 0)
+            self._mark(pygame.draw.polygon(self._window, self.fill, points, 0))
         # stroke
         if self._stroke:
-            pygame.draw.polygon(self._window, self.stroke, points,
-                                self.stroke_weight)
+            self._mark(
+                pygame.draw.polygon(self._window, self.stroke, points,
+                                    self.stroke_weight))
 
     def ellipse(self, point: Union[tuple, list, Vector], width: int,
                 height: int) -> None:
@@ -912,24 +1104,25 @@ class Renderer:
         if self.rect_mode == CENTER:
             point[0] -= width // 2
             point[1] -= height // 2
-        if self._has_scale:
-            point = self._scale_point(point)
-            width *= self._scale_factor
-            height *= self._scale_factor
-        if self._has_rotation:
-            point = self._rotate_point(point)
-        if self._has_translation:
-            point = self._offset_point(point)
+        if self._has_matrix:
+            k = self._matrix_scale
+            cx, cy = self._transform_point(
+                (point[0] + width/2, point[1] + height/2))
+            width *= k
+            height *= k
+            point = cx - width/2, cy - height/2
 
         # fill
         if self._fill:
-            pygame.draw.ellipse(self._window, self.fill,
-                                (point[:2], (width, height)), 0)
+            self._mark(
+                pygame.draw.ellipse(self._window, self.fill,
+                                    (point[:2], (width, height)), 0))
         # stroke
         if self._stroke:
-            pygame.draw.ellipse(self._window, self.stroke,
-                                (point[:2], (width, height)),
-                                self.stroke_weight)
+            self._mark(
+                pygame.draw.ellipse(self._window, self.stroke,
+                                    (point[:2], (width, height)),
+                                    self.stroke_weight))
 
     def circle(self, center: Union[tuple, list, Vector], radius: int) -> None:
         """
@@ -944,21 +1137,21 @@ class Renderer:
                 circle radius
         """
         self._debug_enabled_drawing_methods()
-        if self._has_scale:
-            center = self._scale_point(center)
-            radius *= self._scale_factor
-        if self._has_rotation:
-            center = self._rotate_point(center)
-        if self._has_translation:
-            center = self._offset_point(center)
+        if self._has_matrix:
+            center = self._transform_point(center)
+            radius *= self._matrix_scale
+        else:
+            center = _xy(center)
 
         # fill
         if self._fill:
-            pygame.draw.circle(self._window, self.fill, center[:2], radius, 0)
+            self._mark(
+                pygame.draw.circle(self._window, self.fill, center, radius, 0))
         # stroke
         if self._stroke:
-            pygame.draw.circle(self._window, self.stroke, center[:2], radius,
-                               self._stroke_weight)
+            self._mark(
+                pygame.draw.circle(self._window, self.stroke, center, radius,
+                                   self._stroke_weight))
 
     def arc(self, point: Union[tuple, list, Vector], width: int, height: int,
             start: float, stop: float) -> None:
@@ -984,26 +1177,29 @@ class Renderer:
         if self.rect_mode == CENTER:
             point[0] -= width // 2
             point[1] -= height // 2
-        if self._has_scale:
-            point = self._scale_point(point)
-            width *= self._scale_factor
-            height *= self._scale_factor
-        if self._has_rotation:
-            point = self._rotate_point(point)
-            start += self._rot_angle
-            stop += self._rot_angle
-        if self._has_translation:
-            point = self._offset_point(point)
+        if self._has_matrix:
+            k = self._matrix_scale
+            cx, cy = self._transform_point(
+                (point[0] + width/2, point[1] + height/2))
+            width *= k
+            height *= k
+            point = cx - width/2, cy - height/2
+            angle = m.atan2(self._affine[3], self._affine[0])
+            start += angle
+            stop += angle
 
         # fill
         if self._fill:
-            pygame.draw.ellipse(self._window, self.fill,
-                                (point[:2], (width, height)), start, stop, 0)
+            self._mark(
+                pygame.draw.ellipse(self._window, self.fill,
+                                    (point[:2], (width, height)), start, stop,
+                                    0))
         # stroke
         if self._stroke:
-            pygame.draw.ellipse(self._window, self.stroke,
-                                (point[:2], (width, height)), start, stop,
-                                self.stroke_weight)
+            self._mark(
+                pygame.draw.ellipse(self._window, self.stroke,
+                                    (point[:2], (width, height)), start, stop,
+                                    self.stroke_weight))
 
     def point(self, point: Union[tuple, list, Vector]) -> None:
         """
@@ -1015,15 +1211,320 @@ class Renderer:
             point : tuple | list | Vector
                 the point coordinates
         """
-        if self._has_scale:
-            point = self._scale_point(point)
-        if self._has_rotation:
-            point = self._rotate_point(point)
-        if self._has_translation:
-            point = self._offset_point(point)
+        if self._has_matrix:
+            point = self._transform_point(point)
+
+        self._mark(
+            pygame.draw.circle(self._window, self.stroke, _xy(point),
+                               self._stroke_weight, 0))
+
+    def _transform_array(self, points: np.ndarray) -> np.ndarray:
+        """
+        Applies the current transformation matrix to an array of points at once
+
+        Parameters
+        ----------
+            points : np.ndarray
+                (N, 2) array of points
+
+        Returns
+        -------
+            np.ndarray : (N, 2) array of transformed points
+        """
+        if not self._has_matrix:
+            return points
+        matrix = self._matrix
+        return points @ matrix[:2, :2].T + matrix[:2, 2]
+
+    @staticmethod
+    def _as_points(points: np.ndarray, method: str) -> np.ndarray:
+        """
+        Converts an array-like of points to a (N, 2) float array\\
+        extra coordinates are dropped, returns None if the shape is wrong
+
+        Parameters
+        ----------
+            points : np.ndarray
+                (N, 2) or (N, 3) array-like of points
+            method : str
+                name of the calling method, used for warnings
+        """
+        points = np.asarray(points, dtype=np.float64)
+        if points.ndim == 1 and points.size in (2, 3):
+            points = points.reshape(1, -1)
+        if points.ndim != 2 or points.shape[1] < 2:
+            warn(
+                f"ERROR [renderer] : {method} expects a (N, 2) array of points, got shape {points.shape}, nothing happened"
+            )
+            return None
+        return points[:, :2]
+
+    @staticmethod
+    def _as_colors(colors: np.ndarray, n: int,
+                   method: str) -> list[tuple[int, int, int]]:
+        """
+        Converts an optional (N, 3) array-like of colors to a list of color tuples\\
+        returns None if ``colors`` is None or has a wrong shape
+
+        Parameters
+        ----------
+            colors : np.ndarray
+                (N, 3) array-like of colors, might be None
+            n : int
+                number of items to draw
+            method : str
+                name of the calling method, used for warnings
+        """
+        if colors is None:
+            return None
+        colors = np.asarray(colors)
+        if colors.shape != (n, 3):
+            warn(
+                f"ERROR [renderer] : {method} expects a ({n}, 3) array of colors, got shape {colors.shape}, using default color instead"
+            )
+            return None
+        return list(map(tuple, np.clip(colors, 0, 255).astype(int).tolist()))
+
+    def circles(self,
+                centers: np.ndarray,
+                radii: Union[np.ndarray, float],
+                colors: np.ndarray = None) -> None:
+        """
+        draws many circles on the screen at once\\
+        calls debug_enabled_drawing_methods first\\
+        the current scale, rotation and translation are applied once to all centers
+
+        Parameters
+        ----------
+            centers : np.ndarray
+                (N, 2) array of center points
+            radii : np.ndarray | float
+                (N,) array of radius or a single radius for all circles
+            colors : np.ndarray, (optional)
+                (N, 3) array of colors used instead of the fill color\\
+                (or the stroke color if filling is disabled)
+                defaults to None
+        """
+        self._debug_enabled_drawing_methods()
+        centers = self._as_points(centers, "circles")
+        if centers is None:
+            return
+        n = len(centers)
+        try:
+            radii = np.broadcast_to(np.asarray(radii, dtype=np.float64), (n, ))
+        except ValueError:
+            warn(
+                f"ERROR [renderer] : circles expects {n} radius, got {np.shape(radii)}, nothing happened"
+            )
+            return
+
+        centers = self._transform_array(centers)
+        if self._has_matrix:
+            radii = radii * self._matrix_scale
+        if n:
+            self._mark_points(centers, radii.max() + self._stroke_weight)
+        centers = centers.tolist()
+        radii = radii.tolist()
+
+        colors = self._as_colors(colors, n, "circles")
+
+        window = self._window
+        draw_circle = pygame.draw.circle
+        # fill
+        if self._fill:
+            fills = colors or repeat(self._fill_color, n)
+            for center, radius, color in zip(centers, radii, fills):
+                draw_circle(window, color, center, radius, 0)
+        # stroke
+        if self._stroke:
+            weight = self._stroke_weight
+            strokes = (colors or repeat(self._stroke_color, n),
+                       repeat(self._stroke_color, n))[self._fill]
+            for center, radius, color in zip(centers, radii, strokes):
+                draw_circle(window, color, center, radius, weight)
+
+    def rects(self, xywh: np.ndarray, colors: np.ndarray = None) -> None:
+        """
+        draws many rectangles on the screen at once\\
+        calls debug_enabled_drawing_methods first\\
+        follows rect_mode, the current scale, rotation and translation are applied once to all corners
+
+        Parameters
+        ----------
+            xywh : np.ndarray
+                (N, 4) array of base points, widths and heights
+            colors : np.ndarray, (optional)
+                (N, 3) array of colors used instead of the fill color\\
+                (or the stroke color if filling is disabled)
+                defaults to None
+        """
+        self._debug_enabled_drawing_methods()
+        xywh = np.asarray(xywh, dtype=np.float64)
+        if xywh.ndim == 1 and xywh.size == 4:
+            xywh = xywh.reshape(1, 4)
+        if xywh.ndim != 2 or xywh.shape[1] != 4:
+            warn(
+                f"ERROR [renderer] : rects expects a (N, 4) array, got shape {xywh.shape}, nothing happened"
+            )
+            return
+        n = len(xywh)
+        x, y, w, h = xywh.T
+        if self.rect_mode == CENTER:
+            x = x - w//2
+            y = y - h//2
+
+        corners = np.empty((n, 4, 2))
+        corners[:, 0, 0] = corners[:, 3, 0] = x
+        corners[:, 1, 0] = corners[:, 2, 0] = x + w
+        corners[:, 0, 1] = corners[:, 1, 1] = y
+        corners[:, 2, 1] = corners[:, 3, 1] = y + h
+        corners = self._transform_array(corners.reshape(-1, 2))
+        self._mark_points(corners, self._stroke_weight)
+        corners = corners.reshape(n, 4, 2).tolist()
+
+        colors = self._as_colors(colors, n, "rects")
+
+        window = self._window
+        draw_polygon = pygame.draw.polygon
+        # fill
+        if self._fill:
+            fills = colors or repeat(self._fill_color, n)
+            for points, color in zip(corners, fills):
+                draw_polygon(window, color, points, 0)
+        # stroke
+        if self._stroke:
+            weight = self._stroke_weight
+            strokes = (colors or repeat(self._stroke_color, n),
+                       repeat(self._stroke_color, n))[self._fill]
+            for points, color in zip(corners, strokes):
+                draw_polygon(window, color, points, weight)
+
+    def polygons(self,
+                 polygons: Union[np.ndarray, list[np.ndarray]],
+                 colors: np.ndarray = None) -> None:
+        """
+        draws many polygons on the screen at once\\
+        calls debug_enabled_drawing_methods first\\
+        the current scale, rotation and translation are applied once to all vertexes
+
+        Parameters
+        ----------
+            polygons : np.ndarray | list[np.ndarray]
+                (N, K, 2) array of vertexes, or a list of N (K, 2) arrays if K varies
+            colors : np.ndarray, (optional)
+                (N, 3) array of colors used instead of the fill color\\
+                (or the stroke color if filling is disabled)
+                defaults to None
+        """
+        self._debug_enabled_drawing_methods()
+        if isinstance(polygons, np.ndarray) and polygons.ndim == 3:
+            n, k = polygons.shape[:2]
+            counts = np.full(n, k)
+            vertexes = polygons.reshape(-1, polygons.shape[2])
+        else:
+            n = len(polygons)
+            counts = np.fromiter(map(len, polygons), dtype=np.intp, count=n)
+            vertexes = np.concatenate(polygons) if n else np.empty((0, 2))
+        vertexes = self._as_points(vertexes, "polygons")
+        if vertexes is None:
+            return
+
+        vertexes = self._transform_array(vertexes)
+        self._mark_points(vertexes, self._stroke_weight)
+        vertexes = vertexes.tolist()
+        ends = np.cumsum(counts).tolist()
+        shapes = [
+            vertexes[end - count:end]
+            for end, count in zip(ends, counts.tolist())
+        ]
+
+        colors = self._as_colors(colors, n, "polygons")
+
+        window = self._window
+        draw_polygon = pygame.draw.polygon
+        # fill
+        if self._fill:
+            fills = colors or repeat(self._fill_color, n)
+            for points, color in zip(shapes, fills):
+                draw_polygon(window, color, points, 0)
+        # stroke
+        if self._stroke:
+            weight = self._stroke_weight
+            strokes = (colors or repeat(self._stroke_color, n),
+                       repeat(self._stroke_color, n))[self._fill]
+            for points, color in zip(shapes, strokes):
+                draw_polygon(window, color, points, weight)
 
-        pygame.draw.circle(self._window, self.stroke, point[:2],
-                           self._stroke_weight, 0)
+    def line_segments(self,
+                      p0: np.ndarray,
+                      p1: np.ndarray,
+                      colors: np.ndarray = None) -> None:
+        """
+        draws many independent lines on the screen at once\\
+        uses the stroke color and stroke weight even if stroking is disabled\\
+        the current scale, rotation and translation are applied once to all end points
+
+        Parameters
+        ----------
+            p0 : np.ndarray
+                (N, 2) array of first points
+            p1 : np.ndarray
+                (N, 2) array of second points
+            colors : np.ndarray, (optional)
+                (N, 3) array of colors used instead of the stroke color
+                defaults to None
+        """
+        p0 = self._as_points(p0, "line_segments")
+        p1 = self._as_points(p1, "line_segments")
+        if p0 is None or p1 is None:
+            return
+        if (n := len(p0)) != len(p1):
+            warn(
+                f"ERROR [renderer] : line_segments got {n} first points and {len(p1)} second points, nothing happened"
+            )
+            return
+
+        ends = self._transform_array(np.concatenate((p0, p1)))
+        self._mark_points(ends, self._stroke_weight)
+        ends = ends.tolist()
+        strokes = self._as_colors(colors, n, "line_segments") or repeat(
+            self._stroke_color, n)
+
+        window = self._window
+        weight = self._stroke_weight
+        draw_line = pygame.draw.line
+        for a, b, color in zip(ends[:n], ends[n:], strokes):
+            draw_line(window, color, a, b, weight)
+
+    def points(self, xy: np.ndarray, colors: np.ndarray = None) -> None:
+        """
+        draws many points on the screen at once\\
+        uses stroke color and stroke weight even if stroking is disabled\\
+        the current scale, rotation and translation are applied once to all points
+
+        Parameters
+        ----------
+            xy : np.ndarray
+                (N, 2) array of points
+            colors : np.ndarray, (optional)
+                (N, 3) array of colors used instead of the stroke color
+                defaults to None
+        """
+        xy = self._as_points(xy, "points")
+        if xy is None:
+            return
+        n = len(xy)
+        xy = self._transform_array(xy)
+        self._mark_points(xy, self._stroke_weight)
+        xy = xy.tolist()
+        strokes = self._as_colors(colors, n, "points") or repeat(
+            self._stroke_color, n)
+
+        window = self._window
+        weight = self._stroke_weight
+        draw_circle = pygame.draw.circle
+        for point, color in zip(xy, strokes):
+            draw_circle(window, color, point, weight, 0)
 
     def sprites(self, group: pygame.sprite.Group) -> None:
         """
@@ -1036,6 +1537,8 @@ class Renderer:
                 a group of sprites
         """
         group.draw(self._window)
+        if self._dirty_mode:
+            self._dirty_rects.extend(sprite.rect for sprite in group)
 
     def load_image(self, path: str) -> pygame.Surface:
         """
@@ -1078,7 +1581,7 @@ class Renderer:
             dx, dy = self.get_image_size()
             x -= dx / 2
             y -= dy / 2
-        self._window.blit(image, (x, y))
+        self._mark(self._window.blit(image, (x, y)))
 
     def text(self, x: int, y: int, text: str) -> None:
         """
@@ -1094,9 +1597,39 @@ class Renderer:
             text : str
                 the text to display
         """
-        color = self.text_color
-        text_label = self.font.render(text, True, color)
-        self._window.blit(text_label, (x, y))
+        text_label = self._text_cache.render(self.font, text, self._text_color)
+        self._mark(self._window.blit(text_label, (x, y)))
+
+    def render_text(self,
+                    text: str,
+                    color: tuple[int, int, int] = None) -> pygame.Surface:
+        """
+        gets the rendered surface of some text without drawing it\\
+        uses the current font, surfaces are cached and shared so do not draw on them
+
+        Parameters
+        ----------
+            text : str
+                the text to render
+            color : tuple[int, int, int], (optional)
+                color of the text, uses text color if None
+                defaults to None
+
+        Returns
+        -------
+            pygame.Surface : the rendered text
+        """
+        if color is None:
+            color = self._text_color
+        return self._text_cache.render(self.font, text, color)
+
+    @property
+    def text_cache(self) -> TextCache:
+        """
+        gets the cache of fonts and rendered texts\\
+        exposes ``hits``, ``misses``, ``size`` and a configurable ``budget`` in bytes
+        """
+        return self._text_cache
 
     def background(self, *color: Union[int, str]) -> None:
         """
@@ -1132,10 +1665,12 @@ class Renderer:
             color = 51, 51, 51
         self._bg = color
         self._window.fill(color)
+        self._mark_all()
 
     def translate(self, x: float = 0, y: float = 0) -> None:
         """
-        translates the axes origin, additive
+        translates the axes origin, additive\\
+        composed with the current matrix so previous rotations and scales apply
 
         Parameters
         ----------
@@ -1144,17 +1679,8 @@ class Renderer:
             y : float
                 translation for y-axis
         """
-        if self._has_scale:
-            x, y = self._scale_point((x, y))
-        if self._has_rotation:
-            x, y = self._rotate_point((x, y))
-
-        self._x_offset += x
-        self._y_offset += y
-        if self._x_offset == 0 and self._y_offset == 0:
-            self._has_translation = False
-        else:
-            self._has_translation = True
+        translation = np.array([[1., 0., x], [0., 1., y], [0., 0., 1.]])
+        self._set_matrix(self._matrix @ translation)
 
     def rotate(self, angle: float) -> None:
         """
@@ -1165,11 +1691,9 @@ class Renderer:
             angle : float
                 angle in randians
         """
-        self._rot_angle += angle
-        if self._rot_angle == 0:
-            self._has_rotation = False
-        else:
-            self._has_rotation = True
+        c, s = m.cos(angle), m.sin(angle)
+        rotation = np.array([[c, -s, 0.], [s, c, 0.], [0., 0., 1.]])
+        self._set_matrix(self._matrix @ rotation)
 
     def rotate_display(self, angle: float) -> None:
         """
@@ -1185,6 +1709,7 @@ class Renderer:
         x = (self.win_width - surface.get_width()) / 2
         y = (self.win_height - surface.get_height()) / 2
         self._window.blit(surface, (x, y))
+        self._mark_all()
 
     def scale(self, scale: float) -> None:
         """
@@ -1201,11 +1726,8 @@ class Renderer:
                 f"WARNING [renderer] : scale of {scale} is not allowed, nothing happened"
             )
             return
-        self._scale_factor *= scale
-        if self._scale_factor == 1:
-            self._has_scale = False
-        else:
-            self._has_scale = True
+        scaling = np.array([[scale, 0., 0.], [0., scale, 0.], [0., 0., 1.]])
+        self._set_matrix(self._matrix @ scaling)
 
     def scale_display(self, scale: float) -> None:
         """
@@ -1221,6 +1743,7 @@ class Renderer:
         x = (self.win_width - surface.get_width()) / 2
         y = (self.win_height - surface.get_height()) / 2
         self._window.blit(surface, (x, y))
+        self._mark_all()
 
     def reset_matrix(self) -> None:
         """
@@ -1236,27 +1759,48 @@ class Renderer:
         self.rotation_behavior = RESET
         self.scale_behavior = RESET
 
+    @property
+    def matrix(self) -> np.ndarray:
+        """
+        gets a copy of the current 3x3 affine transformation matrix
+        """
+        return self._matrix.copy()
+
+    def _screen_translate(self, x: float = 0, y: float = 0) -> None:
+        """
+        translates the whole view in screen coordinates\\
+        unlike ``translate``, not affected by rotations and scales
+        """
+        matrix = self._matrix.copy()
+        matrix[0, 2] += x
+        matrix[1, 2] += y
+        self._set_matrix(matrix)
+
     def _reset_translation(self) -> None:
         """
         resets the axis origin back to normal
         """
-        self._has_translation = False
-        self._x_offset = 0
-        self._y_offset = 0
+        matrix = self._matrix.copy()
+        matrix[:2, 2] = 0
+        self._set_matrix(matrix)
 
     def _reset_rotation(self) -> None:
         """
-        resets rotation angle back to 0
+        resets rotation angle back to 0, keeps the scale factor
         """
-        self._has_rotation = False
-        self._rot_angle = 0
+        matrix = self._matrix.copy()
+        matrix[:2, :2] = self._matrix_scale * np.identity(2)
+        self._set_matrix(matrix)
 
     def _reset_scale(self) -> None:
         """
-        resets scale factor back to 1
+        resets scale factor back to 1, keeps the rotation angle
         """
-        self._has_scale = False
-        self._scale_factor = 1
+        if self._matrix_scale == 0:
+            return
+        matrix = self._matrix.copy()
+        matrix[:2, :2] /= self._matrix_scale
+        self._set_matrix(matrix)
 
     @property
     def translation_behavior(self) -> str:
@@ -1960,14 +2504,7 @@ class Renderer:
         does not affect outer objects\\
         use ``pop`` to reset the state
         """
-        self._save.append([
-            self.fill, self._fill, self.stroke, self.stroke_weight,
-            self._stroke, self._has_translation, self._x_offset,
-            self._y_offset, self._has_rotation, self._rot_angle,
-            self._has_scale, self._scale_factor, self.rect_mode,
-            self.translation_behavior, self.rotation_behavior,
-            self.scale_behavior, self.text_color, self.text_size
-        ])
+        self._save.append(_State(self))
         self._has_save = True
 
     def pop(self) -> None:
@@ -1979,8 +2516,7 @@ class Renderer:
         if not self._has_save:
             warn("WARNING [renderer] : no save was found, nothing changed")
             return
-        self.fill, self._fill, self.stroke, self.stroke_weight, self._stroke, self._has_translation,self._x_offset, self._y_offset, self._has_rotation, self._rot_angle, self._has_scale, self._scale_factor,self.rect_mode, self.translation_behavior, self.rotation_behavior, self.scale_behavior, self.text_color, self.text_size =\
-            self._save.pop()
+        self._save.pop().restore(self)
         self._has_save = len(self._save) >= 1
 
     @property
@@ -2109,6 +2645,7 @@ class Renderer:
             return
         self._is_p_loaded = False
         self._pixels.close()
+        self._mark_all()
 
     def set_at(self, x: int, y: int) -> None:
         """
@@ -2117,26 +2654,31 @@ class Renderer:
         """
         color = self.stroke
         self._window.set_at((x, y), color)
+        self._mark(pygame.Rect(x, y, 1, 1))
 
     def flip(self) -> None:
         """
         updates window\\
         used for interractive drawing without the draw main loop
         """
-        pygame.display.flip()
+        if not self._headless:
+            pygame.display.flip()
+        if self._recorder is not None:
+            self._recorder.push(self.get_frame())
 
     def start(self) -> None:
         """
         opens a new window if the sketch is closed\\
         used for interractive drawing without the draw main loop
         """
-        self._window = pygame.display.set_mode((self._width, self._height))
-        pygame.display.set_caption(self._title)
+        self._window = self._open_window()
 
     def quit(self) -> None:
         """
-        quits the sketch by closing the window
+        quits the sketch by closing the window\\
+        also stops the recording if any
         """
+        self.stop_record()
         pygame.quit()
 
     def set_bench_mode(self, bench: bool) -> None:
@@ -2158,6 +2700,90 @@ class Renderer:
             return
         self._benchmark = bench
 
+    def set_dirty_rects(self, dirty: bool) -> None:
+        """
+        sets the dirty rectangles mode of the Renderer\\
+        setting this to True means only the areas drawn on during the last two frames are
+        cleared (if a background is set with ``set_background``) and updated on the screen\\
+        best for mostly static scenes on big windows, calling ``background`` in ``draw``
+        still updates the whole window
+
+        Parameters
+        ----------
+            dirty : bool
+                True to only update the areas that changed
+        """
+        if dirty == self._dirty_mode:
+            warn(
+                f"WARNING [renderer] : dirty rectangles mode is already at {dirty}, nothing changed"
+            )
+            return
+        self._dirty_mode = dirty
+        self._full_redraw = True
+        self._dirty_rects = []
+        self._prev_dirty_rects = []
+
+    def set_idle(self,
+                 idle: Callable[[], bool],
+                 fps: int = 10,
+                 redraw: bool = True) -> None:
+        """
+        sets a condition checked before each frame, under which the Renderer slows down\\
+        like a SandBox with all its bodies asleep : ``renderer.set_idle(lambda: sandbox.is_idle)``\\
+        setting this to None will disable this feature
+
+        Parameters
+        ----------
+            idle : python function
+                returns True while nothing changes on the screen
+            fps : int, (optional)
+                frame rate while idle
+                defaults to 10
+            redraw : bool, (optional)
+                if the background and the draw function still run while idle\\
+                if False, the last drawn frame is shown again (events, buttons, sliders
+                and menus are still managed, on top of it) : something else than the draw
+                function (an ``update`` function given to ``run``, buttons or keys) must then end it
+                defaults to True
+        """
+        self._idle = idle
+        self._idle_fps = fps
+        self._idle_redraw = redraw
+
+    @property
+    def is_idle(self) -> bool:
+        """
+        gets if the last frame was run in idle mode, see ``set_idle``
+        """
+        return self._is_idle
+
+    def _clear(self) -> None:
+        """
+        fills the window with the automated background\\
+        only fills last frame areas in dirty rectangles mode
+        """
+        if self._dirty_mode and not self._full_redraw:
+            fill, bg = self._window.fill, self._bg
+            for rect in self._prev_dirty_rects:
+                fill(bg, rect)
+        else:
+            self._window.fill(self._bg)
+
+    def _present(self) -> None:
+        """
+        updates the window at the end of a frame\\
+        only updates this frame and last frame areas in dirty rectangles mode
+        """
+        if self._headless:
+            pass
+        elif self._dirty_mode and not self._full_redraw:
+            pygame.display.update(self._prev_dirty_rects + self._dirty_rects)
+        else:
+            pygame.display.flip()
+        self._prev_dirty_rects = self._dirty_rects
+        self._dirty_rects = []
+        self._full_redraw = False
+
     def set_background(self, *color: Union[None, int, str]) -> None:
         """
         sets an automated background every time through draw\\
@@ -2199,9 +2825,155 @@ class Renderer:
             color = 51, 51, 51
         self._bg = color
 
+    def _draw_elements(self) -> None:
+        """
+        draws buttons, sliders, menus and the scrollbar\\
+        also moves the view field based on the scrollbar value
+        """
+        prof = self._profiler
+        if prof is not None:
+            t = time.perf_counter_ns()
+
+        # button management
+        if self._has_buttons:
+            for button in self._all_buttons:
+                if not button.is_hidden:
+                    button.draw()
+                    self._mark(button.bounds)
+            if prof is not None:
+                t = prof.lap("ui:button", t)
+
+        # slider management
+        if self._has_sliders:
+            for slider in self._all_sliders:
+                if not slider.is_hidden:
+                    slider.draw()
+                    self._mark(slider.bounds)
+            if prof is not None:
+                t = prof.lap("ui:slider", t)
+
+        # menu management
+        if self._has_left_menu or self._has_right_menu:
+            for menu in self._all_menus:
+                if not menu.is_hidden:
+                    menu.draw()
+                    self._mark(menu.bounds)
+            if prof is not None:
+                t = prof.lap("ui:menu", t)
+
+        # scrollbar management
+        if self._has_scrollbar:
+            scrollbar = self._scrollbar
+            if not scrollbar.is_hidden:
+                scrollbar.draw()
+                self._mark(scrollbar.bounds)
+                value = scrollbar.value
+                if self.translation_behavior == RESET:
+                    self._screen_translate(0, -value)
+                elif self.translation_behavior == KEEP:
+                    self._screen_translate(0, self._ps_value - value)
+                self._ps_value = value
+            if prof is not None:
+                prof.lap("ui:scrollbar", t)
+
+    def _trigger_elements(self) -> None:
+        """
+        triggers buttons, sliders, menus and the scrollbar based on the mouse
+        """
+        pos: tuple[int, int] = pygame.mouse.get_pos()
+        if pygame.mouse.get_pressed()[0] != 0:
+
+            if self._has_buttons:
+                for button in self._all_buttons:
+                    if not button.is_hidden and button.collide(
+                            pos) and button.check_click():
+                        button.on_press()
+                        button.reinit_click()
+
+            if self._has_sliders:
+                for slider in self._all_sliders:
+                    if not slider.is_hidden and slider.collide(pos):
+                        slider.set_value(pos)
+                        slider.reinit_click()
+
+            if self._has_left_menu or self._has_right_menu:
+                for menu in self._all_menus:
+                    if not menu.is_hidden and menu.check_click():
+                        menu.update_state(pos)
+                        if (i := menu.collide(pos)) is not None:
+                            menu.trigger(i)
+                        menu.reinit_click()
+
+            if self._has_scrollbar:
+                scrollbar = self._scrollbar
+                if not scrollbar.is_hidden and scrollbar.collide(pos):
+                    if not scrollbar.is_pinned():
+                        scrollbar.set_pin(pos)
+                    else:
+                        scrollbar.set_value_by_y(pos[1] - scrollbar.get_pin())
+
+        else:
+            if self._has_buttons:
+                for button in self._all_buttons:
+                    button.click()
+            if self._has_sliders:
+                for slider in self._all_sliders:
+                    slider.click()
+            if self._has_left_menu or self._has_right_menu:
+                for menu in self._all_menus:
+                    menu.click()
+            if self._has_scrollbar:
+                scrollbar = self._scrollbar
+                scrollbar.update_state(pos)
+                scrollbar.unpin()
+
+    def _handle_events(self) -> None:
+        """
+        loop trough events for the QUIT event, scrolling and keys
+        """
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self._is_running = False
+
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                if self._has_scrollbar:
+                    scrollbar = self._scrollbar
+                    if event.button == 4:
+                        scrollbar.scroll_up()
+                    if event.button == 5:
+                        scrollbar.scroll_down()
+
+            if event.type == pygame.KEYUP:
+                if (k := event.key) in self.key_binding:
+                    i = self._key_binding[k]
+
+                    if self._keys_behavior[i] == RELEASED:
+                        self._actions[i]()
+                    elif self._keys_behavior[i] == HOLD:
+                        self._pressed[k] = False
+
+            elif event.type == pygame.KEYDOWN:
+                if (k := event.key) in self.key_binding:
+                    i = self._key_binding[k]
+
+                    if self._keys_behavior[i] == PRESSED:
+                        self._actions[i]()
+                    elif self._keys_behavior[i] == HOLD:
+                        self._pressed[k] = True
+
+            for k in self._pressed:
+                if self._pressed[k]:
+                    i = self._key_binding[k]
+                    self._actions[i]()
+
     def run(self,
-            draw: Callable[[], None] = None,
-            setup: Callable[[], None] = None) -> None:
+            draw: Callable[..., None] = None,
+            setup: Callable[[], None] = None,
+            frames: int = None,
+            until: Callable[[], bool] = None,
+            update: Callable[[float], None] = None,
+            dt: float = 1 / 120,
+            max_steps: int = 8) -> None:
         """
         the main loop of the program\\
         will call draw over and over until ``QUIT`` event is triggered
@@ -2213,6 +2985,17 @@ class Renderer:
         parameters to this method. In that case the Renderer will not scan your main
         file.
 
+        In headless mode, events and mouse interactions are skipped and the frame rate
+        is not limited, so ``frames`` or ``until`` should be given. The recording is
+        stopped at the end but pygame is not, so ``run`` can be called again and
+        ``quit`` has to be called once done.
+
+        If an ``update`` function is given, it is called with ``dt`` at a fixed rate,
+        independently of the frame rate, and ``draw`` is called once per frame with the
+        interpolation factor between the last two updates (between 0 and 1). In headless
+        mode, each frame is assumed to last ``1 / fps`` seconds, or ``dt`` seconds if the
+        frame rate is unlocked (``fps <= 0``).
+
         Parameters
         ----------
             draw : python function, (optional)
@@ -2221,6 +3004,21 @@ class Renderer:
             setup : python function, (optional)
                 the setup function, will be called once
                 defaults to None
+            frames : int, (optional)
+                stops after this number of frames
+                defaults to None
+            until : python function, (optional)
+                stop condition, checked after each frame
+                defaults to None
+            update : python function, (optional)
+                the fixed timestep update function, takes the time step
+                defaults to None
+            dt : float, (optional)
+                time step of the update function, in seconds
+                defaults to 1/120
+            max_steps : int, (optional)
+                maximum number of updates per frame, late updates are dropped past this
+                defaults to 8
         """
         if setup is None:
             if hasattr(__main__, "setup"):
@@ -2236,11 +3034,57 @@ class Renderer:
                 )
         setup()
 
+        headless = self._headless
+        self._is_running = True
+        stop = self._frame_count + frames if frames is not None else None
+        accumulator, previous = 0., time.perf_counter()
         while self._is_running:
-            # drawing loop
-            if self._has_auto_bg:
-                self._window.fill(self._bg)
-            draw()
+            prof = self._profiler
+            if prof is not None:
+                t = time.perf_counter_ns()
+
+            # fixed timestep updates
+            if update is not None:
+                if headless:
+                    # one time step per frame if the frame rate is unlocked
+                    accumulator += 1 / self._fps if self._fps > 0 else dt
+                else:
+                    now = time.perf_counter()
+                    accumulator += now - previous
+                    previous = now
+                steps = 0
+                while accumulator >= dt and steps < max_steps:
+                    update(dt)
+                    accumulator -= dt
+                    steps += 1
+                if accumulator >= dt:
+                    accumulator %= dt
+                if prof is not None:
+                    t = prof.lap("update", t)
+
+            # drawing loop, replaced by the last drawn frame while idle if asked to
+            idle = self._is_idle = self._idle is not None and bool(
+                self._idle())
+            frozen = idle and not self._idle_redraw
+            if frozen and self._idle_frame is not None:
+                self._window.blit(self._idle_frame, (0, 0))
+            else:
+                if frozen or self._idle_frame is not None:
+                    # entering or leaving idle : the whole window is drawn again
+                    self._full_redraw = True
+                    self._idle_frame = None
+                if self._has_auto_bg:
+                    self._clear()
+                if update is None:
+                    draw()
+                else:
+                    draw(accumulator / dt)
+                if frozen:
+                    self._idle_frame = self._window.copy()
+            if frozen:
+                self._full_redraw = True
+            if prof is not None:
+                t = prof.lap("draw", t)
 
             # translation, rotation, scale management
             if self.translation_behavior == RESET:
@@ -2250,132 +3094,46 @@ class Renderer:
             if self.scale_behavior == RESET:
                 self._reset_scale()
 
-            # bench mode
-            if self._benchmark:
-                pygame.display.flip()
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        self._is_running = False
-                        break
-                continue
-
-            # button management
-            if self._has_buttons:
-                for button in self._all_buttons:
-                    if not button.is_hidden:
-                        button.draw()
-
-            # slider management
-            if self._has_sliders:
-                for slider in self._all_sliders:
-                    if not slider.is_hidden:
-                        slider.draw()
-
-            # menu management
-            if self._has_left_menu or self._has_right_menu:
-                for menu in self._all_menus:
-                    if not menu.is_hidden:
-                        menu.draw()
-
-            # scrollbar management
-            if self._has_scrollbar:
-                scrollbar = self._scrollbar
-                if not scrollbar.is_hidden:
-                    scrollbar.draw()
-                    self._has_translation = True
-                    value = scrollbar.value
-                    if self.translation_behavior == RESET:
-                        self._y_offset -= value
-                    elif self.translation_behavior == KEEP:
-                        self._y_offset += self._ps_value
-                        self._y_offset -= value
-                    self._ps_value = value
-
-            # trigerring buttons, sliders and menus
-            pos: tuple[int, int] = pygame.mouse.get_pos()
-            if pygame.mouse.get_pressed()[0] != 0:
-
-                if self._has_buttons:
-                    for button in self._all_buttons:
-                        if not button.is_hidden and button.collide(
-                                pos) and button.check_click():
-                            button.on_press()
-                            button.reinit_click()
-
-                if self._has_sliders:
-                    for slider in self._all_sliders:
-                        if not slider.is_hidden and slider.collide(pos):
-                            slider.set_value(pos)
-                            slider.reinit_click()
-
-                if self._has_left_menu or self._has_right_menu:
-                    for menu in self._all_menus:
-                        if not menu.is_hidden and menu.check_click():
-                            menu.update_state(pos)
-                            if (i := menu.collide(pos)) is not None:
-                                menu.trigger(i)
-                            menu.reinit_click()
-
-                if self._has_scrollbar:
-                    scrollbar = self._scrollbar
-                    if not scrollbar.is_hidden and scrollbar.collide(pos):
-                        if not scrollbar.is_pinned():
-                            scrollbar.set_pin(pos)
-                        else:
-                            scrollbar.set_value_by_y(pos[1] -
-                                                     scrollbar.get_pin())
-
-            else:
-                if self._has_buttons:
-                    for button in self._all_buttons:
-                        button.click()
-                if self._has_sliders:
-                    for slider in self._all_sliders:
-                        slider.click()
-                if self._has_left_menu or self._has_right_menu:
-                    for menu in self._all_menus:
-                        menu.click()
-                if self._has_scrollbar:
-                    scrollbar = self._scrollbar
-                    scrollbar.update_state(pos)
-                    scrollbar.unpin()
+            if not self._benchmark:
+                # buttons, sliders, menus and scrollbar
+                self._draw_elements()
+                if prof is not None:
+                    t = prof.lap("elements", t)
+                if not headless:
+                    self._trigger_elements()
+                    if prof is not None:
+                        t = prof.lap("triggers", t)
 
             # quit event and keys
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self._is_running = False
-
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    if self._has_scrollbar:
-                        scrollbar = self._scrollbar
-                        if event.button == 4:
-                            scrollbar.scroll_up()
-                        if event.button == 5:
-                            scrollbar.scroll_down()
-
-                if event.type == pygame.KEYUP:
-                    if (k := event.key) in self.key_binding:
-                        i = self._key_binding[k]
-
-                        if self._keys_behavior[i] == RELEASED:
-                            self._actions[i]()
-                        elif self._keys_behavior[i] == HOLD:
-                            self._pressed[k] = False
-
-                elif event.type == pygame.KEYDOWN:
-                    if (k := event.key) in self.key_binding:
-                        i = self._key_binding[k]
-
-                        if self._keys_behavior[i] == PRESSED:
-                            self._actions[i]()
-                        elif self._keys_behavior[i] == HOLD:
-                            self._pressed[k] = True
-
-                for k in self._pressed:
-                    if self._pressed[k]:
-                        i = self._key_binding[k]
-                        self._actions[i]()
+            if not headless:
+                self._handle_events()
+                if prof is not None:
+                    t = prof.lap("events", t)
 
-            self._clock.tick(self._fps)
-            pygame.display.flip()
-        self.quit()
+            if self._benchmark or headless:
+                self._clock.tick()
+            else:
+                self._clock.tick(self._idle_fps if idle else self._fps)
+            if prof is not None:
+                t = prof.lap("tick", t)
+                if prof.overlay:
+                    prof.draw(self)
+                    t = prof.lap("overlay", t)
+            self._present()
+            if prof is not None:
+                t = prof.lap("present", t)
+            if self._recorder is not None:
+                self._recorder.push(self.get_frame())
+                if prof is not None:
+                    prof.lap("record", t)
+
+            self._frame_count += 1
+            if stop is not None and self._frame_count >= stop:
+                self._is_running = False
+            if until is not None and until():
+                self._is_running = False
+        if headless:
+            # the renderer stays usable (run again, draw, get_frame) until quit
+            self.stop_record()
+        else:
+            self.quit()
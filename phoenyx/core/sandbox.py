@@ -1,11 +1,21 @@
-from typing import Union
+from typing import Callable, Union
+import math as m
+import numpy as np
 
 from . import Renderer
+from .shapegroup import ShapeGroup
 
 import pymunk
 import pymunk.pygame_util
+try:
+    import pymunk.batch
+    _HAS_BATCH = True
+except ImportError:  # pymunk < 6.6
+    _HAS_BATCH = False
+# pymunk >= 7 replaced the collision handler objects by Space.on_collision
+_HAS_ON_COLLISION = hasattr(pymunk.Space, "on_collision")
 
-__all__ = ["SandBox"]
+__all__ = ["SandBox", "SandBoxSnapshot"]
 
 from ..data import *
 from ..pmath import *
@@ -26,6 +36,72 @@ def _constrain(x: float, mn: float, mx: float) -> int:
     return mn if x < mn else mx if x > mx else x
 
 
+if _HAS_BATCH:
+    _STATE_FIELDS = (pymunk.batch.BodyFields.BODY_ID
+                     | pymunk.batch.BodyFields.POSITION
+                     | pymunk.batch.BodyFields.ANGLE
+                     | pymunk.batch.BodyFields.VELOCITY
+                     | pymunk.batch.BodyFields.ANGULAR_VELOCITY)
+
+
+class SandBoxSnapshot:
+    """
+    State of a SandBox at some point in time\\
+    created by ``SandBox.snapshot`` and given back to ``SandBox.restore``
+
+    ``positions``, ``velocities``, ``angles`` and ``angular_velocities`` are
+    contiguous arrays with one row per body, in the order of ``bodies``
+    """
+    __slots__ = ("ids", "positions", "velocities", "angles",
+                 "angular_velocities", "_bodies", "_static_body", "_shapes",
+                 "_constraints", "_all_shapes")
+
+    def __init__(self, sandbox: "SandBox", ids: np.ndarray,
+                 state: np.ndarray) -> None:
+        """
+        new snapshot of ``sandbox``
+
+        Parameters
+        ----------
+            sandbox : SandBox
+                the SandBox
+            ids : np.ndarray
+                pymunk ids of the bodies
+            state : np.ndarray
+                (N, 6) array of x, y, angle, vx, vy and angular velocity of the bodies
+        """
+        space = sandbox._space
+        self.ids = ids
+        self.positions = np.ascontiguousarray(state[:, 0:2])
+        self.angles = np.ascontiguousarray(state[:, 2])
+        self.velocities = np.ascontiguousarray(state[:, 3:5])
+        self.angular_velocities = np.ascontiguousarray(state[:, 5])
+        self._bodies = list(space.bodies)
+        self._static_body = space.static_body
+        self._shapes = list(space.shapes)
+        self._constraints = list(space.constraints)
+        self._all_shapes = set(sandbox._all_shapes)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def bodies(self) -> list[pymunk.Body]:
+        """
+        gets the bodies, in the same order as the arrays
+        """
+        by_id = {b.id: b for b in self._bodies}
+        by_id[self._static_body.id] = self._static_body
+        return [by_id[i] for i in self.ids.tolist()]
+
+    def state(self) -> np.ndarray:
+        """
+        gets a (N, 6) array of x, y, angle, vx, vy and angular velocity of the bodies
+        """
+        return np.column_stack((self.positions, self.angles, self.velocities,
+                                self.angular_velocities))
+
+
 class SandBox:
     """
     Phoenyx SandBox
@@ -39,38 +115,59 @@ class SandBox:
                  renderer: Renderer,
                  width: int = None,
                  height: int = None,
-                 bounce: bool = False) -> None:
+                 bounce: bool = False,
+                 cull_every: int = 1,
+                 sleep_time_threshold: float = None,
+                 idle_speed_threshold: float = None) -> None:
         """
         new SandBox instance
 
         Parameters
         ----------
             renderer : Renderer
-                main renderer
+                main renderer, None for a headless SandBox that can't be drawn
             width : int, (optional)
-                width of the world from the center
+                width of the world from the center, required without renderer
                 defaults to None
             height : int, (optional)
-                height of the world from the center
+                height of the world from the center, required without renderer
                 defaults to None
             bounce : bool, (optional)
                 if bodies bounce on the edges of the world
                 defaults to False
+            cull_every : int, (optional)
+                number of steps between two removals of the bodies far away from the world
+                defaults to 1
+            sleep_time_threshold : float, (optional)
+                seconds a group of bodies must stay idle before falling asleep, None to never sleep
+                defaults to None
+            idle_speed_threshold : float, (optional)
+                speed under which a body is idle, None to let pymunk guess it from the gravity
+                defaults to None
 
         Note
         ----
             The center of the SandBox is the center of the Renderer window ;\\
+            Without renderer, the world spans from (0, 0) to (2 * width, 2 * height) ;\\
             The default size of the SandBox is set to fill the Renderer window ;\\
-            The default gravitational constant is set to 900 downwards.
+            The default gravitational constant is set to 900 downwards ;\\
+            Sleeping bodies are not simulated until touched, or woken up with ``body.activate()``.
         """
         self._renderer = renderer
 
         self._buffer = 10
         self._bounce = bounce
 
-        self._x, self._y = self._renderer.win_width / 2, self._renderer.win_height / 2
-        self._width = width if width is not None else self._renderer.win_width / 2
-        self._height = height if height is not None else self._renderer.win_height / 2
+        if renderer is None:
+            if width is None or height is None:
+                raise ValueError(
+                    "a SandBox without renderer needs a width and a height")
+            self._x, self._y = width, height
+            self._width, self._height = width, height
+        else:
+            self._x, self._y = self._renderer.win_width / 2, self._renderer.win_height / 2
+            self._width = width if width is not None else self._renderer.win_width / 2
+            self._height = height if height is not None else self._renderer.win_height / 2
 
         self._sum_of_forces = Vector()
         self._gravity = Vector(0, 900)
@@ -79,8 +176,25 @@ class SandBox:
         self._all_shapes: set[pymunk.Shape] = set()
         self._space = pymunk.Space()
         self._space.gravity = self._gravity.x, self._gravity.y
-
-        self._draw_options = pymunk.pygame_util.DrawOptions(renderer._window)
+        if sleep_time_threshold is not None:
+            self._space.sleep_time_threshold = sleep_time_threshold
+        if idle_speed_threshold is not None:
+            self._space.idle_speed_threshold = idle_speed_threshold
+
+        self._draw_options = pymunk.pygame_util.DrawOptions(
+            renderer._window) if renderer is not None else None
+
+        self._cull_every = max(int(cull_every), 1)
+        self._steps = 0
+        self._substeps = 0
+        self._batch = pymunk.batch.Buffer() if _HAS_BATCH else None
+
+        self._collision_callbacks: dict[tuple[int, int], tuple[Callable,
+                                                               Callable]] = {}
+        self._log_capacity = 0
+        self._log_count = 0
+        self._log_ids = np.empty((0, 4), dtype=np.int64)
+        self._log_values = np.empty((0, 7), dtype=np.float64)
 
         if bounce:
             self._add_borders()
@@ -99,6 +213,30 @@ class SandBox:
         """
         return self._height
 
+    @property
+    def substeps(self) -> int:
+        """
+        gets the number of sub-steps performed by the last call to ``step``
+        """
+        return self._substeps
+
+    @property
+    def is_idle(self) -> bool:
+        """
+        gets if all dynamic bodies are asleep (or if there are none) and no kinematic body moves\\
+        nothing moves until one wakes up, so drawing can be throttled (see ``Renderer.set_idle``)
+        """
+        dynamic, kinematic = pymunk.Body.DYNAMIC, pymunk.Body.KINEMATIC
+        for body in self._space.bodies:
+            body_type = body.body_type
+            if body_type == dynamic:
+                if not body.is_sleeping:
+                    return False
+            elif body_type == kinematic and (body.velocity != (0, 0)
+                                             or body.angular_velocity != 0):
+                return False
+        return True
+
     @property
     def bodies(self) -> list[pymunk.Body]:
         """
@@ -189,6 +327,56 @@ class SandBox:
         return not ((self._x - w <= x <= self._x + w)\
                and (self._y - h <= y <= self._y + h))
 
+    def _out_bbs(self) -> tuple[pymunk.BB, ...]:
+        """
+        gets four boxes covering everything outside of the culling limits
+        """
+        far = 1e12
+        w = 10 * self.width + self._buffer
+        h = 10 * self.height + self._buffer
+        left, right = self._x - w, self._x + w
+        top, bottom = self._y - h, self._y + h
+        return (
+            pymunk.BB(-far, -far, left, far),
+            pymunk.BB(right, -far, far, far),
+            pymunk.BB(left, -far, right, top),
+            pymunk.BB(left, bottom, right, far),
+        )
+
+    def _cull(self) -> None:
+        """
+        removes the shapes whose body went far away from the world\\
+        only the shapes found outside by bounding box queries are checked
+        """
+        shapes_to_remove: set[pymunk.Shape] = set()
+        shape_filter = pymunk.ShapeFilter()
+        for bb in self._out_bbs():
+            for s in self._space.bb_query(bb, shape_filter):
+                if s in self._all_shapes and self._is_out(s.body.position):
+                    shapes_to_remove.add(s)
+
+        for s in shapes_to_remove:
+            self._space.remove(s, s.body)
+            self._all_shapes.discard(s)
+
+    def _max_speed(self) -> float:
+        """
+        gets the highest speed among the bodies, kinematic ones included since
+        they can go through the dynamic ones as well (static ones never move)
+        """
+        if self._batch is None:
+            return max((b.velocity.length for b in self._space.bodies),
+                       default=0.)
+        self._batch.clear()
+        pymunk.batch.get_space_bodies(self._space,
+                                      pymunk.batch.BodyFields.VELOCITY,
+                                      self._batch)
+        velocities = np.frombuffer(self._batch.float_buf(), dtype=np.float64)
+        if not velocities.size:
+            return 0.
+        return float(np.sqrt(np.max(velocities[0::2]**2 +
+                                    velocities[1::2]**2)))
+
     def _get_center(self, *points: tuple[int, int]) -> tuple[int, int]:
         """
         
@@ -209,7 +397,8 @@ class SandBox:
                  radius: int,
                  friction: float = .99,
                  elasticity: float = 0,
-                 is_static: bool = False) -> pymunk.Circle:
+                 is_static: bool = False,
+                 collision_type: int = 0) -> pymunk.Circle:
         """
         new circular body with uniform mass repartition
 
@@ -232,6 +421,9 @@ class SandBox:
                 defaults to 0
             is_static : bool, (optional)
                 defaults to False
+            collision_type : int, (optional)
+                type used to select the callbacks, see ``on_collision``
+                defaults to 0
         """
         inertia = pymunk.moment_for_circle(mass, 0, radius, (0, 0))
 
@@ -245,6 +437,7 @@ class SandBox:
         shape = pymunk.Circle(body, radius, (0, 0))
         shape.friction = friction
         shape.elasticity = elasticity
+        shape.collision_type = collision_type
 
         self._space.add(body, shape)
         self._all_shapes.add(shape)
@@ -257,7 +450,8 @@ class SandBox:
                     radius: float,
                     friction: float = .99,
                     elasticity: float = 0,
-                    is_static: bool = False) -> pymunk.Segment:
+                    is_static: bool = False,
+                    collision_type: int = 0) -> pymunk.Segment:
         """
         new static Segment body with uniform mass repartition
 
@@ -280,6 +474,9 @@ class SandBox:
                 defaults to 0
             is_static : bool, (optional)
                 defaults to False
+            collision_type : int, (optional)
+                type used to select the callbacks, see ``on_collision``
+                defaults to 0
         """
         a = p1[0], p1[1]
         b = p2[0], p2[1]
@@ -294,6 +491,7 @@ class SandBox:
         shape = pymunk.Segment(body, a, b, radius)
         shape.friction = friction
         shape.elasticity = elasticity
+        shape.collision_type = collision_type
 
         if not is_static:
             body.position = self._get_center(a, b)
@@ -309,7 +507,8 @@ class SandBox:
                  radius: float = .01,
                  friction: float = .99,
                  elasticity: float = 0,
-                 is_static: bool = False) -> pymunk.Poly:
+                 is_static: bool = False,
+                 collision_type: int = 0) -> pymunk.Poly:
         """
         new convex Polygon body with uniform mass repartition
 
@@ -330,6 +529,9 @@ class SandBox:
                 defaults to 0
             is_static : bool, (optional)
                 defaults to False
+            collision_type : int, (optional)
+                type used to select the callbacks, see ``on_collision``
+                defaults to 0
 
         Note
         ----
@@ -347,6 +549,7 @@ class SandBox:
         shape = pymunk.Poly(body, points, radius=radius)
         shape.friction = friction
         shape.elasticity = elasticity
+        shape.collision_type = collision_type
 
         body.position = self._get_center(*points)
         body.center_of_gravity = shape.center_of_gravity
@@ -355,6 +558,218 @@ class SandBox:
         self._all_shapes.add(shape)
         return shape
 
+    @staticmethod
+    def _as_points(points: np.ndarray) -> np.ndarray:
+        """
+        converts an array-like of points to a (N, 2) float array, extra coordinates are dropped
+        """
+        points = np.asarray(points, dtype=np.float64)
+        return points.reshape(-1, points.shape[-1])[:, :2]
+
+    @staticmethod
+    def _per_shape(values: Union[float, np.ndarray], n: int) -> list[float]:
+        """
+        broadcasts a single value or an array-like to one value per shape
+        """
+        return np.broadcast_to(np.asarray(values, dtype=np.float64),
+                               (n, )).tolist()
+
+    def _add_group(self, objects: list,
+                   shapes: list[pymunk.Shape]) -> ShapeGroup:
+        """
+        adds new bodies and shapes to the space in one call
+        """
+        self._space.add(*objects)
+        self._all_shapes.update(shapes)
+        return ShapeGroup(self, shapes)
+
+    def add_balls(self,
+                  positions: np.ndarray,
+                  masses: Union[float, np.ndarray],
+                  radii: Union[float, np.ndarray],
+                  friction: Union[float, np.ndarray] = .99,
+                  elasticity: Union[float, np.ndarray] = 0,
+                  is_static: bool = False,
+                  collision_type: int = 0) -> ShapeGroup:
+        """
+        many new circular bodies with uniform mass repartition, added to the space at once
+
+        Parameters
+        ----------
+            positions : np.ndarray
+                (N, 2) array-like of the locations of the Bodies
+            masses : float | np.ndarray
+                mass of all Bodies or of each Body
+            radii : float | np.ndarray
+                outer radius of all circles or of each circle
+
+        Options
+        -------
+            fiction : float | np.ndarray, (optional)
+                defaults to .99
+            elasticity : float | np.ndarray, (optional)
+                defaults to 0
+            is_static : bool, (optional)
+                defaults to False
+            collision_type : int, (optional)
+                type of all the shapes, see ``on_collision``
+                defaults to 0
+
+        Returns
+        -------
+            ShapeGroup : handle on the new shapes
+        """
+        positions = self._as_points(positions)
+        n = len(positions)
+        masses = np.broadcast_to(np.asarray(masses, dtype=np.float64), (n, ))
+        radii = np.broadcast_to(np.asarray(radii, dtype=np.float64), (n, ))
+        # pymunk.moment_for_circle(mass, 0, radius, (0, 0))
+        inertias = masses * radii**2 / 2
+        body_type = pymunk.Body.STATIC if is_static else pymunk.Body.DYNAMIC
+
+        objects, shapes = [], []
+        for position, mass, inertia, radius, f, e in zip(
+                positions.tolist(), masses.tolist(), inertias.tolist(),
+                radii.tolist(), self._per_shape(friction, n),
+                self._per_shape(elasticity, n)):
+            body = pymunk.Body(mass, inertia, body_type)
+            body.position = position
+            shape = pymunk.Circle(body, radius)
+            shape.friction = f
+            shape.elasticity = e
+            shape.collision_type = collision_type
+            objects.append(body)
+            objects.append(shape)
+            shapes.append(shape)
+        return self._add_group(objects, shapes)
+
+    def add_segments(self,
+                     p1: np.ndarray,
+                     p2: np.ndarray,
+                     masses: Union[float, np.ndarray],
+                     radii: Union[float, np.ndarray],
+                     friction: Union[float, np.ndarray] = .99,
+                     elasticity: Union[float, np.ndarray] = 0,
+                     is_static: bool = False,
+                     collision_type: int = 0) -> ShapeGroup:
+        """
+        many new Segment bodies with uniform mass repartition, added to the space at once
+
+        Parameters
+        ----------
+            p1 : np.ndarray
+                (N, 2) array-like of the positions of the first vertexes
+            p2 : np.ndarray
+                (N, 2) array-like of the positions of the second vertexes\
+                raises a ValueError if p1 and p2 have different lengths
+            masses : float | np.ndarray
+                mass of all segments or of each segment
+            radii : float | np.ndarray
+                radius of all segments or of each segment
+
+        Options
+        -------
+            fiction : float | np.ndarray, (optional)
+                defaults to .99
+            elasticity : float | np.ndarray, (optional)
+                defaults to 0
+            is_static : bool, (optional)
+                defaults to False
+            collision_type : int, (optional)
+                type of all the shapes, see ``on_collision``
+                defaults to 0
+
+        Returns
+        -------
+            ShapeGroup : handle on the new shapes
+        """
+        p1 = self._as_points(p1)
+        p2 = self._as_points(p2)
+        n = len(p1)
+        if len(p2) != n:
+            raise ValueError(
+                f"p1 and p2 have different lengths ({n} and {len(p2)})")
+        body_type = pymunk.Body.STATIC if is_static else pymunk.Body.DYNAMIC
+
+        objects, shapes = [], []
+        for a, b, mass, radius, f, e in zip(p1.tolist(), p2.tolist(),
+                                            self._per_shape(masses, n),
+                                            self._per_shape(radii, n),
+                                            self._per_shape(friction, n),
+                                            self._per_shape(elasticity, n)):
+            inertia = pymunk.moment_for_segment(mass, a, b, radius)
+            body = pymunk.Body(mass, inertia, body_type)
+            shape = pymunk.Segment(body, a, b, radius)
+            shape.friction = f
+            shape.elasticity = e
+            shape.collision_type = collision_type
+            if not is_static:
+                body.position = self._get_center(a, b)
+            body.center_of_gravity = shape.center_of_gravity
+            objects.append(body)
+            objects.append(shape)
+            shapes.append(shape)
+        return self._add_group(objects, shapes)
+
+    def add_polys(self,
+                  polygons: list[np.ndarray],
+                  masses: Union[float, np.ndarray],
+                  radius: Union[float, np.ndarray] = .01,
+                  friction: Union[float, np.ndarray] = .99,
+                  elasticity: Union[float, np.ndarray] = 0,
+                  is_static: bool = False,
+                  collision_type: int = 0) -> ShapeGroup:
+        """
+        many new convex Polygon bodies with uniform mass repartition, added to the space at once
+
+        Parameters
+        ----------
+            polygons : list[np.ndarray]
+                (K, 2) array-like of the positions of the vertexes of each polygon\\
+                or a (N, K, 2) array if they all have K vertexes
+            masses : float | np.ndarray
+                mass of all polygons or of each polygon
+
+        Options
+        -------
+            radius : float | np.ndarray, (optional)
+                defaults to .01
+            fiction : float | np.ndarray, (optional)
+                defaults to .99
+            elasticity : float | np.ndarray, (optional)
+                defaults to 0
+            is_static : bool, (optional)
+                defaults to False
+            collision_type : int, (optional)
+                type of all the shapes, see ``on_collision``
+                defaults to 0
+
+        Returns
+        -------
+            ShapeGroup : handle on the new shapes
+        """
+        n = len(polygons)
+        body_type = pymunk.Body.STATIC if is_static else pymunk.Body.DYNAMIC
+
+        objects, shapes = [], []
+        for points, mass, r, f, e in zip(polygons, self._per_shape(masses, n),
+                                         self._per_shape(radius, n),
+                                         self._per_shape(friction, n),
+                                         self._per_shape(elasticity, n)):
+            points = [tuple(p) for p in self._as_points(points).tolist()]
+            inertia = pymunk.moment_for_poly(mass, points, radius=r)
+            body = pymunk.Body(mass, inertia, body_type)
+            shape = pymunk.Poly(body, points, radius=r)
+            shape.friction = f
+            shape.elasticity = e
+            shape.collision_type = collision_type
+            body.position = self._get_center(*points)
+            body.center_of_gravity = shape.center_of_gravity
+            objects.append(body)
+            objects.append(shape)
+            shapes.append(shape)
+        return self._add_group(objects, shapes)
+
     def extend_segment(self,
                        segment: pymunk.Segment,
                        pos: Union[tuple[float, float], Vector],
@@ -467,17 +882,114 @@ class SandBox:
 
     def clear(self) -> None:
         """
-        clear space : will delete all shapes and bodies
+        clear space : will delete all shapes, bodies and joints
+        """
+        self._space.remove(*self._space.shapes, *self._space.bodies,
+                           *self._space.constraints)
+        self._all_shapes.clear()
+
+    def _body_ids(self) -> np.ndarray:
+        """
+        gets the pymunk ids of the bodies, in the order used by pymunk.batch
+        """
+        if self._batch is None:
+            return np.array([b.id for b in self._space.bodies], dtype=np.uintp)
+        self._batch.clear()
+        pymunk.batch.get_space_bodies(self._space,
+                                      pymunk.batch.BodyFields.BODY_ID,
+                                      self._batch)
+        return np.frombuffer(self._batch.int_buf(), dtype=np.uintp).copy()
+
+    def snapshot(self) -> SandBoxSnapshot:
+        """
+        saves the positions, velocities, angles and angular velocities of all bodies\\
+        along with the bodies, shapes and joints in the space
+
+        Returns
+        -------
+            SandBoxSnapshot : arrays with one row per body, give it to ``restore``
+        """
+        if self._batch is None:
+            bodies = self._space.bodies
+            ids = np.array([b.id for b in bodies], dtype=np.uintp)
+            state = np.array(
+                [(*b.position, b.angle, *b.velocity, b.angular_velocity)
+                 for b in bodies],
+                dtype=np.float64).reshape(-1, 6)
+        else:
+            self._batch.clear()
+            pymunk.batch.get_space_bodies(self._space, _STATE_FIELDS,
+                                          self._batch)
+            ids = np.frombuffer(self._batch.int_buf(), dtype=np.uintp).copy()
+            state = np.frombuffer(self._batch.float_buf(),
+                                  dtype=np.float64).reshape(-1, 6)
+        return SandBoxSnapshot(self, ids, state)
+
+    def _restore_objects(self, snap: SandBoxSnapshot) -> None:
+        """
+        puts back the bodies, shapes and joints of a snapshot into the space\\
+        and removes the ones added since
+        """
+        space = self._space
+        objects = (snap._bodies, snap._shapes, snap._constraints)
+        current = (space.bodies, space.shapes, space.constraints)
+        to_remove, to_add = [], []
+        for saved, now in zip(objects, current):
+            saved_set, now_set = set(saved), set(now)
+            to_remove.extend(o for o in now if o not in saved_set)
+            to_add.extend(o for o in saved if o not in now_set)
+        # joints first when removing, bodies first when adding
+        if to_remove:
+            space.remove(*reversed(to_remove))
+        if to_add:
+            space.add(*to_add)
+        self._all_shapes = set(snap._all_shapes)
+
+    def restore(self, snap: SandBoxSnapshot) -> None:
         """
-        to_remove: set[Union[pymunk.Body, pymunk.Shape]] = set()
-        for b in self._space.bodies:
-            to_remove.add(b)
-        for s in self._space.shapes:
-            to_remove.add(s)
+        brings the SandBox back to a snapshot, without rebuilding the space\\
+        bodies removed since are added back and bodies added since are removed
 
-        for e in to_remove:
-            self._space.remove(e)
-            self._all_shapes.discard(e)
+        Parameters
+        ----------
+            snap : SandBoxSnapshot
+                state to restore, from ``snapshot``
+
+        Note
+        ----
+            contact data cached by pymunk is not part of the snapshot, so replaying
+            from a snapshot may slightly differ from the original run
+        """
+        if len(self._space.shapes) != len(snap._shapes) or not np.array_equal(
+                self._body_ids(), snap.ids):
+            self._restore_objects(snap)
+
+        # the angle is set before the position, as the position of a body
+        # with an offset center of gravity depends on its angle
+        if self._batch is not None and np.array_equal(self._body_ids(),
+                                                      snap.ids):
+            fields = pymunk.batch.BodyFields
+            buffer = pymunk.batch.Buffer()
+            buffer.set_float_buf(snap.angles)
+            pymunk.batch.set_space_bodies(self._space, fields.ANGLE, buffer)
+            buffer.set_float_buf(
+                np.column_stack((snap.positions, snap.velocities,
+                                 snap.angular_velocities)))
+            pymunk.batch.set_space_bodies(
+                self._space,
+                fields.POSITION | fields.VELOCITY | fields.ANGULAR_VELOCITY,
+                buffer)
+        else:
+            by_id = {b.id: b for b in self._space.bodies}
+            by_id[self._space.static_body.id] = self._space.static_body
+            for i, (x, y, a, vx, vy, w) in zip(snap.ids.tolist(),
+                                               snap.state().tolist()):
+                body = by_id[i]
+                body.angle = a
+                body.position = x, y
+                body.velocity = vx, vy
+                body.angular_velocity = w
+        self._space.reindex_static()
 
     def discard(self, shape: pymunk.Shape) -> None:
         """
@@ -494,10 +1006,351 @@ class SandBox:
             pass
         self._all_shapes.discard(shape)
 
-    def step(self, fps: int = 60, iter: int = 10) -> None:
+    def use_spatial_hash(self, cell_size: float, count: int = 1000) -> None:
+        """
+        switches the spatial index of the space from the default bounding box tree to a spatial hash\\
+        faster when there are many shapes of about the same size, slower otherwise\\
+        there is no way back to the bounding box tree
+
+        Parameters
+        ----------
+            cell_size : float
+                width and height of the cells, about the size of the shapes
+            count : int, (optional)
+                minimal number of cells, about the number of shapes
+                defaults to 1000
+        """
+        if cell_size <= 0 or count <= 0:
+            warn(
+                f"ERROR [sandbox] : spatial hash needs positive cell size and count, got {cell_size} and {count}, nothing changed"
+            )
+            return
+        self._space.use_spatial_hash(cell_size, count)
+
+    @staticmethod
+    def _filter(shape_filter: pymunk.ShapeFilter) -> pymunk.ShapeFilter:
+        """
+        gets the filter of a query, one letting everything through if None
+        """
+        return pymunk.ShapeFilter() if shape_filter is None else shape_filter
+
+    def query_point(
+        self,
+        pos: Union[tuple[float, float], Vector],
+        radius: float = 0,
+        shape_filter: pymunk.ShapeFilter = None
+    ) -> tuple[list[pymunk.Shape], np.ndarray, np.ndarray]:
+        """
+        gets the shapes at most ``radius`` away from a point, nearest first\\
+        the edges of the world are left out
+
+        Parameters
+        ----------
+            pos : tuple[float, float] | Vector
+                the point, like the mouse position
+            radius : float, (optional)
+                maximum distance to the shapes, 0 for the shapes containing the point
+                defaults to 0
+            shape_filter : pymunk.ShapeFilter, (optional)
+                categories of shapes to look for
+                defaults to None
+
+        Returns
+        -------
+            tuple : the shapes, (N, 2) array of the nearest points of the shapes
+            and (N, ) array of distances (negative inside the shapes)
+        """
+        hits = [
+            h for h in self._space.point_query((
+                pos[0], pos[1]), radius, self._filter(shape_filter))
+            if h.shape not in self._borders
+        ]
+        hits.sort(key=lambda h: h.distance)
+        return ([h.shape for h in hits],
+                np.array([tuple(h.point) for h in hits],
+                         dtype=np.float64).reshape(-1, 2),
+                np.array([h.distance for h in hits], dtype=np.float64))
+
+    def query_bb(
+        self,
+        rect: Union[tuple[float, float, float, float], pymunk.BB],
+        shape_filter: pymunk.ShapeFilter = None
+    ) -> tuple[list[pymunk.Shape], np.ndarray]:
+        """
+        gets the shapes whose bounding box overlaps a rectangle\\
+        the edges of the world are left out
+
+        Parameters
+        ----------
+            rect : tuple[float, float, float, float] | pymunk.BB
+                ``(x, y, width, height)`` of the rectangle (as in ``Renderer.rect``), or a pymunk BB
+            shape_filter : pymunk.ShapeFilter, (optional)
+                categories of shapes to look for
+                defaults to None
+
+        Returns
+        -------
+            tuple : the shapes and (N, 2) array of the positions of their bodies
+        """
+        if not isinstance(rect, pymunk.BB):
+            x, y, w, h = rect[:4]
+            rect = pymunk.BB(min(x, x + w), min(y, y + h), max(x, x + w),
+                             max(y, y + h))
+        shapes = [
+            s for s in self._space.bb_query(rect, self._filter(shape_filter))
+            if s not in self._borders
+        ]
+        return shapes, np.array([tuple(s.body.position) for s in shapes],
+                                dtype=np.float64).reshape(-1, 2)
+
+    def query_segment(
+        self,
+        a: Union[tuple[float, float], Vector],
+        b: Union[tuple[float, float], Vector],
+        radius: float = 0,
+        shape_filter: pymunk.ShapeFilter = None
+    ) -> tuple[list[pymunk.Shape], np.ndarray, np.ndarray, np.ndarray]:
+        """
+        gets the shapes crossed by a segment, from ``a`` to ``b``\\
+        the edges of the world are left out
+
+        Parameters
+        ----------
+            a : tuple[float, float] | Vector
+                start of the segment
+            b : tuple[float, float] | Vector
+                end of the segment
+            radius : float, (optional)
+                thickness of the segment, from its center line
+                defaults to 0
+            shape_filter : pymunk.ShapeFilter, (optional)
+                categories of shapes to look for
+                defaults to None
+
+        Returns
+        -------
+            tuple : the shapes, (N, 2) array of the hit points, (N, 2) array of the normals of the
+            shapes at those points and (N, ) array of the fractions of the segment (0 at ``a``, 1 at ``b``)
+        """
+        hits = [
+            h for h in self._space.segment_query((a[0], a[1]), (
+                b[0], b[1]), radius, self._filter(shape_filter))
+            if h.shape not in self._borders
+        ]
+        hits.sort(key=lambda h: h.alpha)
+        return ([h.shape for h in hits],
+                np.array([tuple(h.point) for h in hits],
+                         dtype=np.float64).reshape(-1, 2),
+                np.array([tuple(h.normal) for h in hits],
+                         dtype=np.float64).reshape(-1, 2),
+                np.array([h.alpha for h in hits], dtype=np.float64))
+
+    def query_shape(
+        self, shape: pymunk.Shape
+    ) -> tuple[list[pymunk.Shape], np.ndarray, np.ndarray, np.ndarray]:
+        """
+        gets the shapes overlapping a shape, in the space or not\\
+        the edges of the world and the shape itself are left out
+
+        Parameters
+        ----------
+            shape : pymunk.Shape
+                the shape, attached to a body (like a kinematic body that is not in the space)
+
+        Returns
+        -------
+            tuple : the shapes, (N, 2) array of contact points on them, (N, 2) array of the normals
+            (from the given shape to the others) and (N, ) array of penetration depths
+        """
+        if shape.body is None:
+            warn(f"ERROR [sandbox] : queried shape has no body, nothing found")
+            shape_hits = []
+        else:
+            shape_hits = [
+                h for h in self._space.shape_query(shape)
+                if h.shape is not shape and h.shape not in self._borders
+                and h.contact_point_set.points
+            ]
+        contacts = [(h.contact_point_set.normal, h.contact_point_set.points[0])
+                    for h in shape_hits]
+        return ([h.shape for h in shape_hits],
+                np.array([tuple(c.point_b) for _, c in contacts],
+                         dtype=np.float64).reshape(-1, 2),
+                np.array([tuple(n) for n, _ in contacts],
+                         dtype=np.float64).reshape(-1, 2),
+                np.array([-c.distance for _, c in contacts], dtype=np.float64))
+
+    def on_collision(
+            self,
+            type_a: int = None,
+            type_b: int = None,
+            begin: Callable[[pymunk.Arbiter], bool] = None,
+            separate: Callable[[pymunk.Arbiter], None] = None) -> None:
+        """
+        sets the functions called when shapes of two collision types start and stop touching\\
+        a new call for the same types replaces the previous functions
+
+        Parameters
+        ----------
+            type_a : int, (optional)
+                collision type of the first shape, None for any type
+                defaults to None
+            type_b : int, (optional)
+                collision type of the second shape, None for any type
+                defaults to None
+            begin : Callable[[pymunk.Arbiter], bool], (optional)
+                called with the arbiter when two shapes start touching\\
+                returning False ignores this collision until the shapes separate
+                defaults to None
+            separate : Callable[[pymunk.Arbiter], None], (optional)
+                called with the arbiter when two shapes stop touching (or one is removed)
+                defaults to None
+
+        Note
+        ----
+            ``arbiter.shapes`` gives the two shapes, in the order of the collision types ;\\
+            Collision types are given to the shapes by the ``add_*`` methods ;\\
+            The space must not be modified from the callbacks, use ``space.add_post_step_callback``.
+        """
+        if type_a is None:
+            type_a, type_b = type_b, None
+        key = type_a, type_b
+        self._collision_callbacks[key] = begin, separate
+        self._set_collision_handler(key)
+
+    def _set_collision_handler(self, key: tuple[int, int]) -> None:
+        """
+        gives the callbacks of a pair of collision types to pymunk\\
+        the event log is fed by the handler of any types with pymunk >= 7, which calls
+        every matching handler, and by all handlers before, which only call the most specific one
+        """
+        begin, separate = self._collision_callbacks.get(key, (None, None))
+        log = self._log_capacity > 0 and (key == (None, None)
+                                          or not _HAS_ON_COLLISION)
+        log_contact = self._log_contact
+
+        if _HAS_ON_COLLISION:
+
+            def on_begin(arbiter: pymunk.Arbiter, space: pymunk.Space,
+                         data: dict) -> None:
+                if begin(arbiter) is False:
+                    arbiter.process_collision = False
+
+            def on_separate(arbiter: pymunk.Arbiter, space: pymunk.Space,
+                            data: dict) -> None:
+                separate(arbiter)
+
+            def on_post_solve(arbiter: pymunk.Arbiter, space: pymunk.Space,
+                              data: dict) -> None:
+                log_contact(arbiter)
+
+            self._space.on_collision(
+                *key,
+                begin=on_begin if begin is not None else None,
+                separate=on_separate if separate is not None else None,
+                post_solve=on_post_solve if log else None)
+            return
+
+        type_a, type_b = key
+        if type_a is None:
+            handler = self._space.add_default_collision_handler()
+        elif type_b is None:
+            handler = self._space.add_wildcard_collision_handler(type_a)
+        else:
+            handler = self._space.add_collision_handler(type_a, type_b)
+        if begin is not None:
+            handler.begin = lambda arbiter, space, data: begin(arbiter
+                                                               ) is not False
+        if separate is not None:
+            handler.separate = lambda arbiter, space, data: separate(arbiter)
+        if log:
+            handler.post_solve = lambda arbiter, space, data: log_contact(
+                arbiter)
+
+    def record_collisions(self, capacity: int = 1024) -> None:
+        """
+        starts or stops logging the collisions, see ``drain_collisions``\\
+        each pair of shapes starting to touch is logged once, after its impulse is solved\\
+        the log is a ring buffer : the oldest collisions are overwritten when it is full
+
+        Parameters
+        ----------
+            capacity : int, (optional)
+                number of collisions kept between two drains, 0 stops logging
+                defaults to 1024
+        """
+        capacity = max(int(capacity), 0)
+        self._log_capacity = capacity
+        self._log_count = 0
+        self._log_ids = np.zeros((capacity, 4), dtype=np.int64)
+        self._log_values = np.zeros((capacity, 7), dtype=np.float64)
+        keys = {(None, None)}
+        if not _HAS_ON_COLLISION:
+            keys.update(self._collision_callbacks)
+        for key in keys:
+            self._set_collision_handler(key)
+
+    def _log_contact(self, arbiter: pymunk.Arbiter) -> None:
+        """
+        writes a new collision to the event log
+        """
+        capacity = self._log_capacity
+        if not capacity or not arbiter.is_first_contact:
+            return
+        contacts = arbiter.contact_point_set.points
+        if not contacts:
+            return
+        a, b = arbiter.shapes
+        i = self._log_count % capacity
+        self._log_ids[i] = (a.body.id, b.body.id, a.collision_type,
+                            b.collision_type)
+        self._log_values[i] = (*contacts[0].point_a, *arbiter.normal,
+                               *arbiter.total_impulse, self._steps)
+        self._log_count += 1
+
+    def drain_collisions(self) -> dict[str, np.ndarray]:
+        """
+        gets the collisions logged since the last drain, oldest first, and empties the log\\
+        see ``record_collisions``
+
+        Returns
+        -------
+            dict[str, np.ndarray] : one row per collision
+             * ``ids`` : (N, 2) ids of the bodies of the two shapes (as in ``SandBoxSnapshot.ids``)
+             * ``types`` : (N, 2) collision types of the two shapes
+             * ``points`` : (N, 2) contact points
+             * ``normals`` : (N, 2) normals of the contacts, from the first shape to the second
+             * ``impulses`` : (N, 2) impulses applied to solve the collisions
+             * ``steps`` : (N, ) number of steps done before each collision
+        """
+        capacity = self._log_capacity
+        count = self._log_count
+        if count > capacity:
+            order = np.roll(np.arange(capacity), -(count % capacity))
+        else:
+            order = np.arange(count)
+        ids = self._log_ids[order]
+        values = self._log_values[order]
+        self._log_count = 0
+        return {
+            "ids": ids[:, 0:2].astype(np.uintp),
+            "types": ids[:, 2:4],
+            "points": values[:, 0:2],
+            "normals": values[:, 2:4],
+            "impulses": values[:, 4:6],
+            "steps": values[:, 6].astype(np.int64),
+        }
+
+    def step(self,
+             fps: int = 60,
+             iter: int = 10,
+             adaptive: bool = False,
+             max_travel: float = 5) -> None:
         """
         go forward in time by one step\\
-        the dt used for computation is based on the parameters
+        the dt used for computation is based on the parameters\\
+        bodies far away from the world are removed every ``cull_every`` steps\\
+        nothing is computed while all bodies are asleep, see ``is_idle``
 
         Parameters
         ----------
@@ -505,25 +1358,136 @@ class SandBox:
                 number of frames per second
                 defaults to 60
             iter : int, (optional)
-                number of iterations to perform, could increase accuracy
+                number of iterations to perform, could increase accuracy\\
+                maximum number of iterations if ``adaptive`` is True
                 defaults to 10
+            adaptive : bool, (optional)
+                if the number of iterations depends on the fastest body (dynamic or kinematic)\\
+                so that no body moves more than ``max_travel`` in one iteration
+                defaults to False
+            max_travel : float, (optional)
+                distance a body may travel in one iteration when ``adaptive`` is True
+                defaults to 5
         """
+        if self._space.sleep_time_threshold != m.inf and self.is_idle:
+            self._substeps = 0
+            self._steps += 1
+            return
+
+        if adaptive:
+            travel = self._max_speed() / fps
+            iter = _constrain(m.ceil(travel / max_travel), 1, iter)
+        self._substeps = iter
+
         dt = 1 / (fps*iter)
+        step = self._space.step
         for _ in range(iter):
-            self._space.step(dt)
+            step(dt)
 
-        shapes_to_remove: set[pymunk.Shape] = set()
-        for s in self._all_shapes:
-            if self._is_out(s.body.position):
-                shapes_to_remove.add(s)
+        self._steps += 1
+        if self._steps % self._cull_every == 0:
+            self._cull()
 
-        for s in shapes_to_remove:
-            self._space.remove(s, s.body)
-            self._all_shapes.discard(s)
+    @staticmethod
+    def _to_world(positions: np.ndarray, angles: np.ndarray,
+                  local: np.ndarray) -> np.ndarray:
+        """
+        transforms points from body to world coordinates, one body per point
+        """
+        cos, sin = np.cos(angles), np.sin(angles)
+        x, y = local[:, 0], local[:, 1]
+        return positions + np.column_stack((x*cos - y*sin, x*sin + y*cos))
 
     def draw(self) -> None:
         """
-        default drawing method for the physics engine\\
-        usefull for debuging
+        draws all shapes with the Renderer, through its batch drawing methods\\
+        follows the current fill, stroke, translation, rotation and scale of the Renderer
+
+        circles and polygons use the fill color (or the stroke color if filling is disabled)
+        and segments use the stroke color, unless a shape has its own ``color`` attribute
+        (as used by pymunk, like ``shape.color = (255, 0, 0, 255)``)\\
+        segments are as thick as their radius
+        """
+        if self._renderer is None:
+            warn(
+                f"ERROR [sandbox] : this SandBox has no renderer, nothing drawn"
+            )
+            return
+        renderer = self._renderer
+        default = renderer.fill if renderer._fill else renderer.stroke
+        line = renderer.stroke
+
+        # one python pass to gather the data, the maths are done on arrays
+        circles, segments, polys, vertexes = [], [], [], []
+        circle_colors, segment_colors, poly_colors = [], [], []
+        counts = []
+        for shape in self._space.shapes:
+            body = shape.body
+            color = getattr(shape, "color", None)
+            t = type(shape)
+            if t is pymunk.Circle:
+                circles.append(
+                    (*body.position, body.angle, *shape.offset, shape.radius))
+                circle_colors.append(default if color is None else color[:3])
+            elif t is pymunk.Segment:
+                segments.append((*body.position, body.angle, *shape.a,
+                                 *shape.b, shape.radius))
+                segment_colors.append(line if color is None else color[:3])
+            elif t is pymunk.Poly:
+                local = shape.get_vertices()
+                polys.append((*body.position, body.angle))
+                vertexes.extend(local)
+                counts.append(len(local))
+                poly_colors.append(default if color is None else color[:3])
+
+        if circles:
+            data = np.array(circles)
+            centers = self._to_world(data[:, 0:2], data[:, 2], data[:, 3:5])
+            renderer.circles(centers, data[:, 5],
+                             self._group_colors(circle_colors, default))
+        if segments:
+            data = np.array(segments)
+            a = self._to_world(data[:, 0:2], data[:, 2], data[:, 3:5])
+            b = self._to_world(data[:, 0:2], data[:, 2], data[:, 5:7])
+            weights = np.maximum(
+                np.rint(2 * data[:, 7] * renderer._matrix_scale), 1)
+            colors = np.array(segment_colors)
+            renderer.push()
+            for weight in np.unique(weights).tolist():
+                group = weights == weight
+                renderer.stroke_weight = int(weight)
+                renderer.line_segments(a[group], b[group], colors[group])
+            renderer.pop()
+        if polys:
+            counts = np.array(counts)
+            bodies = np.repeat(np.array(polys), counts, axis=0)
+            vertexes = self._to_world(bodies[:, 0:2], bodies[:, 2],
+                                      np.array(vertexes))
+            ends = np.cumsum(counts).tolist()
+            renderer.polygons([
+                vertexes[end - count:end]
+                for end, count in zip(ends, counts.tolist())
+            ], self._group_colors(poly_colors, default))
+
+    @staticmethod
+    def _group_colors(colors: list[tuple[int, int, int]],
+                      default: tuple[int, int, int]) -> np.ndarray:
+        """
+        gets per shape colors for the batch drawing methods\\
+        None when all shapes use the default color
+        """
+        if all(c is default for c in colors):
+            return None
+        return np.array(colors)
+
+    def debug_draw(self) -> None:
+        """
+        pymunk debug drawing of the physics engine, directly on the window\\
+        ignores the state of the Renderer, usefull for debuging
         """
+        if self._draw_options is None:
+            warn(
+                f"ERROR [sandbox] : this SandBox has no renderer, nothing drawn"
+            )
+            return
         self._space.debug_draw(self._draw_options)
@@ -0,0 +1,213 @@
+from typing import Iterator, Union
+import pymunk
+import numpy as np
+
+__all__ = ["ShapeGroup"]
+
+
+class ShapeGroup:
+    """
+    Phoenyx ShapeGroup
+    ==================
+    created by ``SandBox.add_balls``, ``SandBox.add_segments`` and ``SandBox.add_polys``
+
+    Handle on many shapes of a SandBox at once.
+    1. positions, velocities, angles and angular velocities of the bodies are read
+       and written as numpy arrays
+    2. friction and elasticity of the shapes can be set to a single value or to one
+       value per shape
+    3. ``remove`` takes all the shapes and their bodies out of the space in one call
+    """
+    def __init__(self, sandbox, shapes: list[pymunk.Shape]) -> None:
+        """
+        new ShapeGroup instance
+
+        Parameters
+        ----------
+            sandbox : SandBox
+                the SandBox the shapes belong to
+            shapes : list[pymunk.Shape]
+                the shapes, one body each
+        """
+        self._sandbox = sandbox
+        self._shapes = shapes
+
+    def __len__(self) -> int:
+        return len(self._shapes)
+
+    def __iter__(self) -> Iterator[pymunk.Shape]:
+        return iter(self._shapes)
+
+    def __getitem__(self, index: int) -> pymunk.Shape:
+        return self._shapes[index]
+
+    @property
+    def shapes(self) -> list[pymunk.Shape]:
+        """
+        gets the shapes of the group
+        """
+        return self._shapes
+
+    @property
+    def bodies(self) -> list[pymunk.Body]:
+        """
+        gets the bodies of the group, in the same order as the shapes
+        """
+        return [s.body for s in self._shapes]
+
+    def _values(self, values: Union[float, np.ndarray],
+                shape: tuple[int, ...]) -> np.ndarray:
+        """
+        broadcasts values to one row per shape
+        """
+        return np.broadcast_to(np.asarray(values, dtype=np.float64),
+                               (len(self._shapes), ) + shape)
+
+    def _reindex(self) -> None:
+        """
+        updates the collision data of static shapes after their bodies moved
+        """
+        space = self._sandbox._space
+        for s in self._shapes:
+            if s.body.body_type == pymunk.Body.STATIC and s.space is space:
+                space.reindex_shapes_for_body(s.body)
+
+    @property
+    def positions(self) -> np.ndarray:
+        """
+        gets the positions of the bodies as a (N, 2) array
+        """
+        return np.array([tuple(s.body.position) for s in self._shapes],
+                        dtype=np.float64).reshape(-1, 2)
+
+    @positions.setter
+    def positions(self, positions: np.ndarray) -> None:
+        """
+        sets the positions of the bodies
+
+        Parameters
+        ----------
+            positions : np.ndarray
+                (N, 2) array-like, or a single position for all bodies
+        """
+        for s, p in zip(self._shapes, self._values(positions, (2, )).tolist()):
+            s.body.position = p
+        self._reindex()
+
+    @property
+    def velocities(self) -> np.ndarray:
+        """
+        gets the velocities of the bodies as a (N, 2) array
+        """
+        return np.array([tuple(s.body.velocity) for s in self._shapes],
+                        dtype=np.float64).reshape(-1, 2)
+
+    @velocities.setter
+    def velocities(self, velocities: np.ndarray) -> None:
+        """
+        sets the velocities of the bodies
+
+        Parameters
+        ----------
+            velocities : np.ndarray
+                (N, 2) array-like, or a single velocity for all bodies
+        """
+        for s, v in zip(self._shapes,
+                        self._values(velocities, (2, )).tolist()):
+            s.body.velocity = v
+
+    @property
+    def angles(self) -> np.ndarray:
+        """
+        gets the angles of the bodies in radians
+        """
+        return np.array([s.body.angle for s in self._shapes], dtype=np.float64)
+
+    @angles.setter
+    def angles(self, angles: Union[float, np.ndarray]) -> None:
+        """
+        sets the angles of the bodies in radians
+
+        Parameters
+        ----------
+            angles : float | np.ndarray
+                one angle for all bodies or one per body
+        """
+        for s, a in zip(self._shapes, self._values(angles, ()).tolist()):
+            s.body.angle = a
+        self._reindex()
+
+    @property
+    def angular_velocities(self) -> np.ndarray:
+        """
+        gets the angular velocities of the bodies in radians per second
+        """
+        return np.array([s.body.angular_velocity for s in self._shapes],
+                        dtype=np.float64)
+
+    @angular_velocities.setter
+    def angular_velocities(self, velocities: Union[float, np.ndarray]) -> None:
+        """
+        sets the angular velocities of the bodies in radians per second
+
+        Parameters
+        ----------
+            velocities : float | np.ndarray
+                one angular velocity for all bodies or one per body
+        """
+        for s, w in zip(self._shapes, self._values(velocities, ()).tolist()):
+            s.body.angular_velocity = w
+
+    @property
+    def friction(self) -> np.ndarray:
+        """
+        gets the friction of the shapes
+        """
+        return np.array([s.friction for s in self._shapes], dtype=np.float64)
+
+    @friction.setter
+    def friction(self, friction: Union[float, np.ndarray]) -> None:
+        """
+        sets the friction of the shapes
+
+        Parameters
+        ----------
+            friction : float | np.ndarray
+                one value for all shapes or one per shape
+        """
+        for s, f in zip(self._shapes, self._values(friction, ()).tolist()):
+            s.friction = f
+
+    @property
+    def elasticity(self) -> np.ndarray:
+        """
+        gets the elasticity of the shapes
+        """
+        return np.array([s.elasticity for s in self._shapes], dtype=np.float64)
+
+    @elasticity.setter
+    def elasticity(self, elasticity: Union[float, np.ndarray]) -> None:
+        """
+        sets the elasticity of the shapes
+
+        Parameters
+        ----------
+            elasticity : float | np.ndarray
+                one value for all shapes or one per shape
+        """
+        for s, e in zip(self._shapes, self._values(elasticity, ()).tolist()):
+            s.elasticity = e
+
+    def remove(self) -> None:
+        """
+        removes all the shapes of the group and their bodies from the space\\
+        shapes already removed (discarded or gone out of the world) are skipped\\
+        the group is empty afterwards
+        """
+        space = self._sandbox._space
+        shapes = [s for s in self._shapes if s.space is space]
+        bodies = {s.body for s in shapes if s.body.space is space}
+        if shapes or bodies:
+            space.remove(*shapes, *bodies)
+        self._sandbox._all_shapes.difference_update(self._shapes)
+        self._shapes = []
@@ -0,0 +1,152 @@
+from collections import OrderedDict
+import pygame
+
+__all__ = ["TextCache"]
+
+from ..data import *
+
+
+class TextCache:
+    """
+    Phoenyx TextCache
+    =================
+    created by ``Renderer``
+
+    Keeps fonts and rendered text surfaces around so static labels (fps counter,
+    buttons, sliders, menus...) are only rendered once.
+    1. fonts are cached by (face, size, is system font)
+    2. text surfaces are cached by (font, color, string) in a least recently used
+       fashion, up to a budget in bytes
+    """
+    def __init__(self, budget: int = 4 * 1024 * 1024) -> None:
+        """
+        new TextCache instance
+
+        Parameters
+        ----------
+            budget : int, (optional)
+                maximum number of bytes used by cached text surfaces
+                defaults to 4 MiB
+        """
+        self._fonts: dict[tuple[str, int, bool], pygame.font.Font] = {}
+        self._surfaces: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        self._budget = budget
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def budget(self) -> int:
+        """
+        gets the maximum number of bytes used by cached text surfaces
+        """
+        return self._budget
+
+    @budget.setter
+    def budget(self, budget: int) -> None:
+        """
+        sets the maximum number of bytes used by cached text surfaces\\
+        setting this to 0 disables text surface caching
+
+        Parameters
+        ----------
+            budget : int
+                new budget in bytes
+        """
+        if budget < 0:
+            warn(
+                f"ERROR [text cache] : budget can't be {budget}, nothing changed"
+            )
+            return
+        self._budget = budget
+        self._evict()
+
+    @property
+    def size(self) -> int:
+        """
+        gets the number of bytes currently used by cached text surfaces
+        """
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def get_font(self,
+                 name: str,
+                 size: int,
+                 is_sys: bool = True) -> pygame.font.Font:
+        """
+        gets a font, only loads it the first time
+
+        Parameters
+        ----------
+            name : str
+                name of the system font or path to the font file
+            size : int
+                size of the font
+            is_sys : bool, (optional)
+                if ``name`` is a system font name
+                defaults to True
+        """
+        key = name, size, is_sys
+        try:
+            return self._fonts[key]
+        except KeyError:
+            if is_sys:
+                font = pygame.font.SysFont(name, size)
+            else:
+                font = pygame.font.Font(name, size)
+            self._fonts[key] = font
+            return font
+
+    def render(self, font: pygame.font.Font, text: str,
+               color: tuple[int, int, int]) -> pygame.Surface:
+        """
+        gets the anti-aliased surface of some text, only renders it on a miss\\
+        the returned surface is shared, do not draw on it
+
+        Parameters
+        ----------
+            font : pygame.font.Font
+                font to render with
+            text : str
+                the text to render
+            color : tuple[int, int, int]
+                color of the text
+        """
+        key = font, color, text
+        surfaces = self._surfaces
+        try:
+            surface = surfaces[key]
+        except KeyError:
+            self.misses += 1
+            surface = font.render(text, True, color)
+            nbytes = surface.get_pitch() * surface.get_height()
+            if nbytes <= self._budget:
+                surfaces[key] = surface
+                self._bytes += nbytes
+                self._evict()
+            return surface
+        self.hits += 1
+        surfaces.move_to_end(key)
+        return surface
+
+    def _evict(self) -> None:
+        """
+        drops least recently used surfaces until the budget is respected
+        """
+        surfaces = self._surfaces
+        while self._bytes > self._budget and surfaces:
+            _, surface = surfaces.popitem(last=False)
+            self._bytes -= surface.get_pitch() * surface.get_height()
+
+    def clear(self) -> None:
+        """
+        empties the cache and resets hit and miss counters\\
+        loaded fonts are kept
+        """
+        self._surfaces.clear()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
@@ -28,6 +28,10 @@ HOLD = "HOLD"
 LEFT = "LEFT"
 RIGHT = "RIGHT"
 
+# recording policy
+BLOCK = "BLOCK"
+DROP = "DROP"
+
 # some math
 E = m.e
 PI = m.pi
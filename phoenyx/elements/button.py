@@ -462,6 +462,14 @@ class Button:
         warn(f"INFO [button {self._name}] : action changed")
         self._action = action
 
+    @property
+    def bounds(self) -> pygame.Rect:
+        """
+        gets the area of the window the button box is drawn on\\
+        the label is accounted for by the Renderer when drawing text
+        """
+        return pygame.Rect(self._x, self._y, self._width, self._height)
+
     def collide(self, pos: tuple[int, int]) -> bool:
         """
         collision check
@@ -480,7 +488,7 @@ class Button:
         renderer.no_fill()
         renderer.no_stroke()
 
-        name_label = renderer.font.render(self.name, True, (0, 0, 0))
+        name_label = renderer.render_text(self.name)
 
         x = self._x + (self._width // 2)
         y = self._y + (self._height // 2)
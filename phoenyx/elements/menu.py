@@ -597,16 +597,15 @@ class Menu:
 
         self._renderer.push()
         self._renderer.text_size = self.text_size
-        font = self._renderer.font
         for item in self._all_items:
-            label = font.render(item, True, (0, 0, 0))
+            label = self._renderer.render_text(item)
             width = label.get_width()
             if width > max_width:
                 if width > cap:
                     max_width = cap
                     break
                 max_width = width
-        label = font.render(self.name, True, (0, 0, 0))
+        label = self._renderer.render_text(self.name)
         self._namew = label.get_width() + 10
         self._renderer.pop()
 
@@ -850,6 +849,19 @@ class Menu:
             self.tick_count = 1
             self.is_playing = False
 
+    @property
+    def bounds(self) -> pygame.Rect:
+        """
+        gets the area of the window the menu might draw on, whatever its animation state\\
+        texts are accounted for by the Renderer when drawing text
+        """
+        h = 25 + len(self._all_items) * 30
+        if self.length is not None:
+            h = max(h, 5 + self.length)
+        w = self.width + 21
+        x = (0, self._renderer.win_width - w)[self.side == RIGHT]
+        return pygame.Rect(x, 0, w, h + 2)
+
     def collide(self, pos: tuple[int, int]) -> int:
         """
         gets index of item under pos\\
@@ -279,6 +279,14 @@ class ScrollBar:
         fps = self._renderer.fps
         self._max_ticks = round(fps * sec)
 
+    @property
+    def bounds(self) -> pygame.Rect:
+        """
+        gets the area of the window the scrollbar is drawn on
+        """
+        width = self._renderer.win_width
+        return pygame.Rect(width - 15, 0, 15, self._renderer.win_height)
+
     def collide(self, pos: tuple[int, int]) -> bool:
         """
         if mouse is inside
@@ -654,6 +654,16 @@ class Slider:
             val = _map(x_rel, 0, self.length, self.min_val, self.max_val)
             self.value = round(val, self._incr)
 
+    @property
+    def bounds(self) -> pygame.Rect:
+        """
+        gets the area of the window the slider bar and cursor are drawn on\\
+        labels are accounted for by the Renderer when drawing text
+        """
+        pad = max(self.radius, self.thickness) + 1
+        return pygame.Rect(self._x - pad, self._y - pad, self.length + 2*pad,
+                           2 * pad)
+
     def collide(self, pos: tuple[int, int]) -> bool:
         """
         collision check
@@ -674,12 +684,10 @@ class Slider:
         renderer = self._renderer
         renderer.push()
 
-        name_label = renderer.font.render(self.name, True, (0, 0, 0))
-        min_label = renderer.font.render(str(round(self.min_val, self._incr)),
-                                         True, (0, 0, 0))
-        max_label = renderer.font.render(str(round(self.max_val, self._incr)),
-                                         True, (0, 0, 0))
-        val_label = renderer.font.render(str(self.value), True, (0, 0, 0))
+        name_label = renderer.render_text(self.name)
+        min_label = renderer.render_text(str(round(self.min_val, self._incr)))
+        max_label = renderer.render_text(str(round(self.max_val, self._incr)))
+        val_label = renderer.render_text(str(self.value))
 
         # renderer.stroke_weight = self.thickness
         # renderer.stroke = self.color
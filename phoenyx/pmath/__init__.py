@@ -1,3 +1,7 @@
+from .fastvector import *
+from .noisefield import *
 from .opensimplexnoise import *
 from .perlinnoise import *
+from .spatialhash import *
 from .vector import *
+from .vectorarray import *
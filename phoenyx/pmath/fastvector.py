@@ -0,0 +1,673 @@
+import random
+import math as m
+from typing import Union
+import numpy as np
+
+__all__ = ["Vec2", "Vec3"]
+
+from .vector import Vector, EPSILON
+
+
+class Vec2:
+    """
+    Vec2
+    ====
+    2D vector stored as two python floats
+
+    Same methods as ``Vector`` without going through numpy, for hot loops that
+    handle a few vectors at a time (several times faster than ``Vector`` there).
+    It can be given to any drawing method of the ``Renderer`` and converts to
+    ``Vector`` or ``np.ndarray`` with ``to_vector`` or ``np.asarray``.
+
+    Examples
+    --------
+        >>> v = Vec2(3, 4)
+        >>> v
+        Vec2(3.00, 4.00)
+        >>> v.magnitude
+        5.0
+        >>> v.to_vector()
+        Vector(3.00, 4.00, 0.00)
+    """
+    __slots__ = ("x", "y")
+
+    def __init__(self, x: float = 0, y: float = 0) -> None:
+        """
+        new Vec2 instance
+
+        Parameters
+        ----------
+            x : float, (optional)
+                the x-component of the vector
+                defaults to 0
+            y : float, (optional)
+                the y-component of the vector
+                defaults to 0
+        """
+        self.x = float(x)
+        self.y = float(y)
+
+    @classmethod
+    def from_vector(cls, vector: Union[Vector, tuple, list]) -> "Vec2":
+        """
+        Creates a Vec2 from the first two coordinates of a Vector or a sequence
+        """
+        return cls(vector[0], vector[1])
+
+    def to_vector(self) -> Vector:
+        """
+        Returns a new ``Vector`` with the same coordinates
+        """
+        return Vector(self.x, self.y)
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        return np.array((self.x, self.y), dtype=dtype)
+
+    def __repr__(self) -> str:
+        return "Vec2({:.2f}, {:.2f})".format(self.x, self.y)
+
+    def __len__(self) -> int:
+        return 2
+
+    def __iter__(self):
+        yield self.x
+        yield self.y
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[float, tuple]:
+        return (self.x, self.y)[key]
+
+    def __setitem__(self, key: int, value: float) -> None:
+        if key in (0, -2):
+            self.x = float(value)
+        elif key in (1, -1):
+            self.y = float(value)
+        else:
+            raise IndexError("Vec2 index out of range")
+
+    def __eq__(self, other: "Vec2") -> bool:
+        if isinstance(other, Vec2):
+            return abs(self.x - other.x) <= EPSILON and abs(self.y -
+                                                            other.y) <= EPSILON
+        return NotImplemented
+
+    def __ne__(self, other: "Vec2") -> bool:
+        if isinstance(other, Vec2):
+            return not self == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __add__(self, other: "Vec2") -> "Vec2":
+        if isinstance(other, Vec2):
+            return Vec2(self.x + other.x, self.y + other.y)
+        return NotImplemented
+
+    def __sub__(self, other: "Vec2") -> "Vec2":
+        if isinstance(other, Vec2):
+            return Vec2(self.x - other.x, self.y - other.y)
+        return NotImplemented
+
+    def __iadd__(self, other: "Vec2") -> "Vec2":
+        if isinstance(other, Vec2):
+            self.x += other.x
+            self.y += other.y
+            return self
+        return NotImplemented
+
+    def __isub__(self, other: "Vec2") -> "Vec2":
+        if isinstance(other, Vec2):
+            self.x -= other.x
+            self.y -= other.y
+            return self
+        return NotImplemented
+
+    def __mul__(self, other: Union[float, int, "Vec2"]) -> "Vec2":
+        if isinstance(other, (int, float)):
+            return Vec2(self.x * other, self.y * other)
+        if isinstance(other, Vec2):
+            return Vec2(self.x * other.x, self.y * other.y)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __imul__(self, other: Union[float, int, "Vec2"]) -> "Vec2":
+        if isinstance(other, (int, float)):
+            self.x *= other
+            self.y *= other
+            return self
+        if isinstance(other, Vec2):
+            self.x *= other.x
+            self.y *= other.y
+            return self
+        return NotImplemented
+
+    def __truediv__(self, other: Union[float, int, "Vec2"]) -> "Vec2":
+        if isinstance(other, (int, float)):
+            return Vec2(self.x / other, self.y / other)
+        if isinstance(other, Vec2):
+            return Vec2(self.x / other.x, self.y / other.y)
+        return NotImplemented
+
+    def __itruediv__(self, other: Union[float, int, "Vec2"]) -> "Vec2":
+        if isinstance(other, (int, float)):
+            self.x /= other
+            self.y /= other
+            return self
+        if isinstance(other, Vec2):
+            self.x /= other.x
+            self.y /= other.y
+            return self
+        return NotImplemented
+
+    def __neg__(self) -> "Vec2":
+        return Vec2(-self.x, -self.y)
+
+    def __matmul__(self, other: "Vec2") -> float:
+        return self.dot(other)
+
+    def __abs__(self) -> float:
+        return m.hypot(self.x, self.y)
+
+    def copy(self) -> "Vec2":
+        """
+        Return a copy of the current vector
+        """
+        return Vec2(self.x, self.y)
+
+    @property
+    def magnitude(self) -> float:
+        """
+        The magnitude of the vector
+        """
+        return m.hypot(self.x, self.y)
+
+    @magnitude.setter
+    def magnitude(self, value: float) -> None:
+        if not (mag := m.hypot(self.x, self.y)) == 0:
+            f = abs(value) / mag
+            self.x *= f
+            self.y *= f
+
+    @property
+    def magnitude_sq(self) -> float:
+        """
+        The squared magnitude of the vector
+        """
+        return self.x * self.x + self.y * self.y
+
+    @magnitude_sq.setter
+    def magnitude_sq(self, value: float) -> None:
+        self.magnitude = m.sqrt(value)
+
+    def normalize(self) -> None:
+        """
+        Sets the magnitude of the vector to 1
+        """
+        assert not self.magnitude == 0, "vector has magnitude 0, can't normalize"
+        self.magnitude = 1
+
+    def normalized(self) -> "Vec2":
+        """
+        Returns a copy of the current vector with a magnitude of 1
+        """
+        other = self.copy()
+        other.normalize()
+        return other
+
+    def limit(self, upper: float = None, lower: float = None) -> None:
+        """
+        Keeps the vector magnitude under or above a given limit
+        """
+        mag = self.magnitude
+        if lower is not None and mag < lower:
+            self.magnitude = lower
+        elif upper is not None and mag > upper:
+            self.magnitude = upper
+
+    def limited(self, upper: float = None, lower: float = None) -> "Vec2":
+        """
+        Returns a new vector whom magnitude has been keeped under or above a given limit
+        """
+        other = self.copy()
+        other.limit(upper, lower)
+        return other
+
+    def dot(self, other: "Vec2") -> float:
+        """
+        Computes the dot product of two vectors
+        """
+        return self.x * other.x + self.y * other.y
+
+    def cross(self, other: "Vec2") -> "Vec3":
+        """
+        Return the cross product of the two vectors, along the z-axis
+        """
+        return Vec3(0, 0, self.x * other.y - self.y * other.x)
+
+    def distance(self, other: "Vec2") -> float:
+        """
+        Return the distance between two points
+        """
+        return m.hypot(self.x - other.x, self.y - other.y)
+
+    def distance_sq(self, other: "Vec2") -> float:
+        """
+        Return the squared distance between two points
+        """
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx*dx + dy*dy
+
+    def lerp(self, other: "Vec2", amount: float) -> "Vec2":
+        """
+        Linearly interpolate from one point to another
+
+        Parameters
+        ----------
+            other : Vec2
+                Point to be interpolate to
+            amount: float
+                Amount by which to interpolate.
+        """
+        return Vec2(self.x + amount * (other.x - self.x),
+                    self.y + amount * (other.y - self.y))
+
+    @property
+    def angle(self) -> float:
+        """
+        The angle of rotation of the vector (in radians)
+        """
+        return m.atan2(self.y, self.x)
+
+    @angle.setter
+    def angle(self, theta: float) -> None:
+        mag = m.hypot(self.x, self.y)
+        self.x = mag * m.cos(theta)
+        self.y = mag * m.sin(theta)
+
+    def rotate(self, theta: float) -> None:
+        """
+        Rotates the vector by an angle
+
+        Parameters
+        ----------
+            theta : float or int
+                angle in radians
+        """
+        c, s = m.cos(theta), m.sin(theta)
+        self.x, self.y = self.x * c - self.y * s, self.x * s + self.y * c
+
+    def rotated(self, theta: float) -> "Vec2":
+        """
+        Returns a new vector which has been rotated by an angle
+        """
+        c, s = m.cos(theta), m.sin(theta)
+        return Vec2(self.x * c - self.y * s, self.x * s + self.y * c)
+
+    def angle_between(self, other: "Vec2") -> float:
+        """
+        Calculate the angle between two vectors (in radians)
+        """
+        return m.acos(self.dot(other) / (self.magnitude * other.magnitude))
+
+    @classmethod
+    def random2d(cls, mag: float = 1) -> "Vec2":
+        """
+        Generates a random 2d vector with an optional desired magnitude
+        """
+        return cls.from_angle(random.uniform(-m.pi, m.pi), mag)
+
+    @classmethod
+    def from_angle(cls, angle: float, mag: float = 1) -> "Vec2":
+        """
+        Return a new vector with the given angle (in radians) and magnitude
+        """
+        return cls(mag * m.cos(angle), mag * m.sin(angle))
+
+    # aliases
+    __str__ = __repr__
+    mag = norm = magnitude
+    mag2 = magnitude_sq
+    dist = distance
+    dist_sq = distance_sq
+    heading = angle
+
+
+class Vec3:
+    """
+    Vec3
+    ====
+    3D vector stored as three python floats
+
+    Same methods as ``Vector`` without going through numpy, for hot loops that
+    handle a few vectors at a time (several times faster than ``Vector`` there).
+    It can be given to any drawing method of the ``Renderer`` and converts to
+    ``Vector`` or ``np.ndarray`` with ``to_vector`` or ``np.asarray``.
+
+    Examples
+    --------
+        >>> v = Vec3(2, 3, 6)
+        >>> v
+        Vec3(2.00, 3.00, 6.00)
+        >>> v.magnitude
+        7.0
+        >>> v.cross(Vec3(0, 0, 1))
+        Vec3(3.00, -2.00, 0.00)
+    """
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, x: float = 0, y: float = 0, z: float = 0) -> None:
+        """
+        new Vec3 instance
+
+        Parameters
+        ----------
+            x : float, (optional)
+                the x-component of the vector
+                defaults to 0
+            y : float, (optional)
+                the y-component of the vector
+                defaults to 0
+            z : float, (optional)
+                the z-component of the vector
+                defaults to 0
+        """
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
+
+    @classmethod
+    def from_vector(cls, vector: Union[Vector, tuple, list]) -> "Vec3":
+        """
+        Creates a Vec3 from a Vector or a sequence, missing coordinates are 0
+        """
+        return cls(*vector[:3])
+
+    def to_vector(self) -> Vector:
+        """
+        Returns a new ``Vector`` with the same coordinates
+        """
+        return Vector(self.x, self.y, self.z)
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        return np.array((self.x, self.y, self.z), dtype=dtype)
+
+    def __repr__(self) -> str:
+        return "Vec3({:.2f}, {:.2f}, {:.2f})".format(self.x, self.y, self.z)
+
+    def __len__(self) -> int:
+        return 3
+
+    def __iter__(self):
+        yield self.x
+        yield self.y
+        yield self.z
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[float, tuple]:
+        return (self.x, self.y, self.z)[key]
+
+    def __setitem__(self, key: int, value: float) -> None:
+        if key in (0, -3):
+            self.x = float(value)
+        elif key in (1, -2):
+            self.y = float(value)
+        elif key in (2, -1):
+            self.z = float(value)
+        else:
+            raise IndexError("Vec3 index out of range")
+
+    def __eq__(self, other: "Vec3") -> bool:
+        if isinstance(other, Vec3):
+            return abs(self.x - other.x) <= EPSILON and abs(
+                self.y - other.y) <= EPSILON and abs(self.z -
+                                                     other.z) <= EPSILON
+        return NotImplemented
+
+    def __ne__(self, other: "Vec3") -> bool:
+        if isinstance(other, Vec3):
+            return not self == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __add__(self, other: "Vec3") -> "Vec3":
+        if isinstance(other, Vec3):
+            return Vec3(self.x + other.x, self.y + other.y, self.z + other.z)
+        return NotImplemented
+
+    def __sub__(self, other: "Vec3") -> "Vec3":
+        if isinstance(other, Vec3):
+            return Vec3(self.x - other.x, self.y - other.y, self.z - other.z)
+        return NotImplemented
+
+    def __iadd__(self, other: "Vec3") -> "Vec3":
+        if isinstance(other, Vec3):
+            self.x += other.x
+            self.y += other.y
+            self.z += other.z
+            return self
+        return NotImplemented
+
+    def __isub__(self, other: "Vec3") -> "Vec3":
+        if isinstance(other, Vec3):
+            self.x -= other.x
+            self.y -= other.y
+            self.z -= other.z
+            return self
+        return NotImplemented
+
+    def __mul__(self, other: Union[float, int, "Vec3"]) -> "Vec3":
+        if isinstance(other, (int, float)):
+            return Vec3(self.x * other, self.y * other, self.z * other)
+        if isinstance(other, Vec3):
+            return Vec3(self.x * other.x, self.y * other.y, self.z * other.z)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __imul__(self, other: Union[float, int, "Vec3"]) -> "Vec3":
+        if isinstance(other, (int, float)):
+            self.x *= other
+            self.y *= other
+            self.z *= other
+            return self
+        if isinstance(other, Vec3):
+            self.x *= other.x
+            self.y *= other.y
+            self.z *= other.z
+            return self
+        return NotImplemented
+
+    def __truediv__(self, other: Union[float, int, "Vec3"]) -> "Vec3":
+        if isinstance(other, (int, float)):
+            return Vec3(self.x / other, self.y / other, self.z / other)
+        if isinstance(other, Vec3):
+            return Vec3(self.x / other.x, self.y / other.y, self.z / other.z)
+        return NotImplemented
+
+    def __itruediv__(self, other: Union[float, int, "Vec3"]) -> "Vec3":
+        if isinstance(other, (int, float)):
+            self.x /= other
+            self.y /= other
+            self.z /= other
+            return self
+        if isinstance(other, Vec3):
+            self.x /= other.x
+            self.y /= other.y
+            self.z /= other.z
+            return self
+        return NotImplemented
+
+    def __neg__(self) -> "Vec3":
+        return Vec3(-self.x, -self.y, -self.z)
+
+    def __matmul__(self, other: "Vec3") -> float:
+        return self.dot(other)
+
+    def __abs__(self) -> float:
+        return m.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+    def copy(self) -> "Vec3":
+        """
+        Return a copy of the current vector
+        """
+        return Vec3(self.x, self.y, self.z)
+
+    @property
+    def magnitude(self) -> float:
+        """
+        The magnitude of the vector
+        """
+        return m.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+    @magnitude.setter
+    def magnitude(self, value: float) -> None:
+        if not (mag := self.magnitude) == 0:
+            f = abs(value) / mag
+            self.x *= f
+            self.y *= f
+            self.z *= f
+
+    @property
+    def magnitude_sq(self) -> float:
+        """
+        The squared magnitude of the vector
+        """
+        return self.x * self.x + self.y * self.y + self.z * self.z
+
+    @magnitude_sq.setter
+    def magnitude_sq(self, value: float) -> None:
+        self.magnitude = m.sqrt(value)
+
+    def normalize(self) -> None:
+        """
+        Sets the magnitude of the vector to 1
+        """
+        assert not self.magnitude == 0, "vector has magnitude 0, can't normalize"
+        self.magnitude = 1
+
+    def normalized(self) -> "Vec3":
+        """
+        Returns a copy of the current vector with a magnitude of 1
+        """
+        other = self.copy()
+        other.normalize()
+        return other
+
+    def limit(self, upper: float = None, lower: float = None) -> None:
+        """
+        Keeps the vector magnitude under or above a given limit
+        """
+        mag = self.magnitude
+        if lower is not None and mag < lower:
+            self.magnitude = lower
+        elif upper is not None and mag > upper:
+            self.magnitude = upper
+
+    def limited(self, upper: float = None, lower: float = None) -> "Vec3":
+        """
+        Returns a new vector whom magnitude has been keeped under or above a given limit
+        """
+        other = self.copy()
+        other.limit(upper, lower)
+        return other
+
+    def dot(self, other: "Vec3") -> float:
+        """
+        Computes the dot product of two vectors
+        """
+        return self.x * other.x + self.y * other.y + self.z * other.z
+
+    def cross(self, other: "Vec3") -> "Vec3":
+        """
+        Return the cross product of the two vectors
+        """
+        return Vec3(self.y * other.z - self.z * other.y,
+                    self.z * other.x - self.x * other.z,
+                    self.x * other.y - self.y * other.x)
+
+    def distance(self, other: "Vec3") -> float:
+        """
+        Return the distance between two points
+        """
+        return m.sqrt(self.distance_sq(other))
+
+    def distance_sq(self, other: "Vec3") -> float:
+        """
+        Return the squared distance between two points
+        """
+        dx = self.x - other.x
+        dy = self.y - other.y
+        dz = self.z - other.z
+        return dx*dx + dy*dy + dz*dz
+
+    def lerp(self, other: "Vec3", amount: float) -> "Vec3":
+        """
+        Linearly interpolate from one point to another
+
+        Parameters
+        ----------
+            other : Vec3
+                Point to be interpolate to
+            amount: float
+                Amount by which to interpolate.
+        """
+        return Vec3(self.x + amount * (other.x - self.x),
+                    self.y + amount * (other.y - self.y),
+                    self.z + amount * (other.z - self.z))
+
+    @property
+    def angle(self) -> float:
+        """
+        The angle of rotation of the vector (in radians)\\
+        This attribute isn't available for three dimensional vectors
+        """
+        assert not abs(self.z) > EPSILON, "can't compute angle for 3d vectors"
+        return m.atan2(self.y, self.x)
+
+    @angle.setter
+    def angle(self, theta: float) -> None:
+        self.rotate(theta - self.angle)
+
+    def rotate(self, theta: float) -> None:
+        """
+        Rotates the vector by an angle around the z-axis
+
+        Parameters
+        ----------
+            theta : float or int
+                angle in radians
+        """
+        c, s = m.cos(theta), m.sin(theta)
+        self.x, self.y = self.x * c - self.y * s, self.x * s + self.y * c
+
+    def rotated(self, theta: float) -> "Vec3":
+        """
+        Returns a new vector which has been rotated by an angle around the z-axis
+        """
+        c, s = m.cos(theta), m.sin(theta)
+        return Vec3(self.x * c - self.y * s, self.x * s + self.y * c, self.z)
+
+    def angle_between(self, other: "Vec3") -> float:
+        """
+        Calculate the angle between two vectors (in radians)
+        """
+        return m.acos(self.dot(other) / (self.magnitude * other.magnitude))
+
+    @classmethod
+    def random3d(cls, mag: float = 1) -> "Vec3":
+        """
+        Generates a random 3d vector with an optional desired magnitude
+        """
+        z = random.uniform(-1, 1)
+        r = m.sqrt(1 - z*z)
+        theta = random.uniform(-m.pi, m.pi)
+        return cls(mag * r * m.cos(theta), mag * r * m.sin(theta), mag * z)
+
+    # aliases
+    __str__ = __repr__
+    mag = norm = magnitude
+    mag2 = magnitude_sq
+    dist = distance
+    dist_sq = distance_sq
+    heading = angle
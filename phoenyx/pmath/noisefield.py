@@ -0,0 +1,247 @@
+import hashlib
+import json
+import os
+from itertools import product
+from typing import Union
+import numpy as np
+
+__all__ = ["NoiseField"]
+
+from .opensimplexnoise import OpenSimplexNoise
+from .perlinnoise import PerlinNoise
+
+
+class NoiseField:
+    """
+    Noise Field
+    ===========
+    Precomputed tileable 2D or 3D noise texture.
+     * built once from a ``PerlinNoise`` or an ``OpenSimplexNoise`` object
+     * sampled with bilinear or trilinear interpolation, wrapping around the edges
+     * 2D slices of a 3D field are served without copy
+     * can be cached to a ``.npy`` file, memory-mapped on the next start if it was
+       made from the same noise, shape and size (kept in a ``.json`` file next to it)
+
+    The field covers the box ``[0, size[0]) x [0, size[1]) (x [0, size[2]))`` of
+    noise space with ``shape`` samples along each axis. A ``PerlinNoise`` whose
+    ``tile`` matches ``size`` is periodic already, any other noise is made
+    tileable by cross-fading it with itself shifted by ``size`` along each axis.
+
+    Examples
+    --------
+    >>> field = NoiseField(PerlinNoise(3), (120, 120, 64), (6, 6, 4), path="noise.npy")
+    >>> field.sample([[0.5, 1.2, 3.9]])
+    ... # trilinear lookup, returns an array with one value per point
+    >>> field.slice(1.5)
+    ... # (120, 120) view of the layer closest to t = 1.5
+    """
+    def __init__(self,
+                 noise: Union[PerlinNoise, OpenSimplexNoise],
+                 shape: tuple[int, ...],
+                 size: tuple[float, ...] = None,
+                 path: str = None) -> None:
+        """
+        Precomputes the field, or loads it from ``path`` if it was cached there
+        with the same noise, shape and size.
+
+        Parameters
+        ----------
+            noise : PerlinNoise | OpenSimplexNoise
+                the noise to sample, a PerlinNoise must have the same dimension as ``shape``
+            shape : tuple[int, ...]
+                number of samples along each of the 2 or 3 axes
+            size : tuple[float, ...], (optional)
+                extent of the field along each axis, in noise space
+                defaults to one unit per 16 samples
+            path : str, (optional)
+                ``.npy`` file the field is cached to, its parameters go to ``path + ".json"``
+                defaults to None
+        """
+        if len(shape) not in (2, 3):
+            raise ValueError(f"Expected 2 or 3 axes, got {len(shape)}")
+        if isinstance(noise, PerlinNoise) and noise.dimension != len(shape):
+            raise ValueError(
+                f"Expected a PerlinNoise of dimension {len(shape)}, got {noise.dimension}"
+            )
+        if size is None:
+            size = tuple(n / 16 for n in shape)
+        if len(size) != len(shape):
+            raise ValueError(f"Expected {len(shape)} sizes, got {len(size)}")
+
+        self.noise = noise
+        self.shape = tuple(shape)
+        self.size = tuple(float(s) for s in size)
+        self.path = path
+
+        # Samples are stored with the last axis first so that a 2D slice at
+        # a given last coordinate is a contiguous view.
+        stored_shape = self.shape[-1:] + self.shape[:-1]
+        data = None
+        key = self._key()
+        if path is not None and os.path.exists(path) and self._cached_key(
+                path) == key:
+            data = np.load(path, mmap_mode="r")
+            if data.shape != stored_shape:
+                data = None
+        if data is None:
+            data = np.ascontiguousarray(np.moveaxis(self._compute(), -1, 0))
+            if path is not None:
+                np.save(path, data)
+                with open(path + ".json", "w") as file:
+                    json.dump(key, file)
+        self._data: np.ndarray = data
+
+    def _key(self) -> dict:
+        """
+        Parameters the samples depend on, compared to the cached ones before
+        loading a cached field. The gradient and permutation tables stand for
+        the seed, as a noise may be seeded from the global ``random`` module.
+        """
+        noise = self.noise
+        digest = hashlib.sha1()
+        if isinstance(noise, PerlinNoise):
+            params = {
+                "dimension": noise.dimension,
+                "octaves": noise.octaves,
+                "tile": list(noise.tile),
+                "unbias": noise.unbias,
+                "cache_size": noise.cache_size,
+                # fields cached before lattice coordinates were mixed differ
+                "lattice_hash": "murmur3",
+            }
+            digest.update(np.ascontiguousarray(noise._grad_table).tobytes())
+            digest.update(noise._perm.tobytes())
+        else:
+            params = {}
+            digest.update(np.asarray(noise._perm, dtype=np.int64).tobytes())
+        return {
+            "noise": type(noise).__name__,
+            "params": params,
+            "tables": digest.hexdigest(),
+            "shape": list(self.shape),
+            "size": list(self.size),
+        }
+
+    @staticmethod
+    def _cached_key(path: str) -> dict:
+        """
+        Parameters of the field cached at ``path``, None if unknown.
+        """
+        try:
+            with open(path + ".json") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def _evaluate(self, axes: list[np.ndarray]) -> np.ndarray:
+        """
+        Noise on the grid spanned by one array of coordinates per axis.
+        """
+        if isinstance(self.noise, PerlinNoise):
+            return self.noise.grid(*axes)
+        mesh = np.ix_(*axes)
+        if len(axes) == 2:
+            return self.noise.noise2d_array(*mesh)
+        return self.noise.noise3d_array(*mesh)
+
+    def _compute(self) -> np.ndarray:
+        """
+        Samples the noise, cross-fading it with its shifted copies unless it
+        already tiles with the size of the field.
+        """
+        axes = [np.arange(n) * (s/n) for n, s in zip(self.shape, self.size)]
+        if isinstance(self.noise, PerlinNoise) and all(
+                t == s for t, s in zip(self.noise.tile, self.size)):
+            return self._evaluate(axes)
+
+        # weights of the unshifted and shifted copies along each axis
+        weights = []
+        for i, (axis, s) in enumerate(zip(axes, self.size)):
+            shape = [1] * len(axes)
+            shape[i] = -1
+            weights.append(
+                ((s - axis).reshape(shape) / s, axis.reshape(shape) / s))
+
+        field = 0
+        for corner in product((0, 1), repeat=len(axes)):
+            shifted = [
+                axis - c*s for axis, c, s in zip(axes, corner, self.size)
+            ]
+            weight = 1
+            for w, c in zip(weights, corner):
+                weight = weight * w[c]
+            field = field + weight * self._evaluate(shifted)
+        return field
+
+    @property
+    def texture(self) -> np.ndarray:
+        """
+        Gets a read-only view of the samples, indexed like ``shape``.
+        """
+        view = np.moveaxis(self._data, 0, -1)
+        view.flags.writeable = False
+        return view
+
+    def sample(self, points: np.ndarray) -> np.ndarray:
+        """
+        Gets the value of the field at each of the given points, with bilinear
+        or trilinear interpolation between samples. Points outside of the field
+        wrap around.
+
+        Parameters
+        ----------
+            points : np.ndarray
+                array of shape (..., 2) or (..., 3) in noise space
+
+        Returns
+        -------
+            np.ndarray : array of shape (...)
+        """
+        points = np.asarray(points, dtype=np.float64)
+        dim = len(self.shape)
+        if points.shape[-1] != dim:
+            raise ValueError(f"Expected {dim} values, got {points.shape[-1]}")
+
+        # texel coordinates, in the stored axes order
+        order = [dim-1] + list(range(dim - 1))
+        low, frac, high = [], [], []
+        for i in order:
+            u = points[..., i] * (self.shape[i] / self.size[i])
+            floor = np.floor(u)
+            frac.append(u - floor)
+            floor = floor.astype(np.intp) % self.shape[i]
+            low.append(floor)
+            high.append((floor+1) % self.shape[i])
+
+        # interpolate the corners, collapsing the last axis first
+        data = self._data
+        values = [
+            data[tuple(h if c else l for l, h, c in zip(low, high, corner))]
+            for corner in product((0, 1), repeat=dim)
+        ]
+        for t in reversed(frac):
+            values = [
+                a + t * (b-a) for a, b in zip(values[0::2], values[1::2])
+            ]
+        return values[0]
+
+    def slice(self, t: float) -> np.ndarray:
+        """
+        Gets the 2D layer of a 3D field closest to ``t`` along the last axis,
+        as a read-only view (no copy). ``t`` wraps around.
+
+        Parameters
+        ----------
+            t : float
+                coordinate along the last axis, in noise space
+
+        Returns
+        -------
+            np.ndarray : array of shape ``shape[:2]``
+        """
+        if len(self.shape) != 3:
+            raise ValueError("Only 3D fields can be sliced")
+        k = int(np.floor(t * (self.shape[2] / self.size[2]) + 0.5))
+        view = self._data[k % self.shape[2]]
+        view.flags.writeable = False
+        return view
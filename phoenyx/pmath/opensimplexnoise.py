@@ -1,5 +1,6 @@
 from ctypes import c_int64
 from math import floor
+import numpy as np
 
 __all__ = ["OpenSimplexNoise"]
 
@@ -62,6 +63,11 @@ GRADIENTS_4D = (3, 1, 1, 1, 1, 3, 1, 1, 1, 1, 3, 1, 1, 1, 1, 3, -3, 1, 1, 1,
                 -3, -1, 1, -1, -1, -3, -3, -1, -1, -1, -1, -3, -1, -1, -1, -1,
                 -3, -1, -1, -1, -1, -3)
 
+# Gradients as float arrays for the array functions
+_GRADIENTS_2D = np.array(GRADIENTS_2D, dtype=np.float64)
+_GRADIENTS_3D = np.array(GRADIENTS_3D, dtype=np.float64)
+_GRADIENTS_4D = np.array(GRADIENTS_4D, dtype=np.float64)
+
 
 def overflow(x: int) -> int:
     # Since normal python ints and longs can be quite humongous we have to use
@@ -87,6 +93,8 @@ class OpenSimplexNoise:
     ... # default seed to 0
     >>> noise.noise2d(x=..., y=...)
     ... # evaluates the noise object at (x, y) and returns a floating point number between -1 and 1
+    >>> noise.noise2d_array(x=..., y=...)
+    ... # same for numpy arrays of coordinates, broadcast against each other
     """
     def __init__(self, seed: int = DEFAULT_SEED) -> None:
         """
@@ -114,6 +122,11 @@ class OpenSimplexNoise:
                 (perm[i] % (len(GRADIENTS_3D) / 3)) * 3)
             source[r] = source[i]
 
+        # Same tables as numpy arrays for the array functions
+        self._perm_array = np.array(perm, dtype=np.int64)
+        self._perm_grad_index_3D_array = np.array(perm_grad_index_3D,
+                                                  dtype=np.int64)
+
     def _extrapolate2d(self, xsb, ysb, dx, dy):
         perm = self._perm
         index = perm[(perm[xsb & 0xFF] + ysb) & 0xFF] & 0x0E
@@ -906,115 +919,15 @@ class OpenSimplexNoise:
                 c = (
                     b_po if (b_score > a_score) else a_po
                 )  # Our other closest vertex is the closest out of a and b.
-                if (c & 0x01) == 0:
-                    xsv_ext0 = xsb - 1
-                    xsv_ext1 = xsv_ext2 = xsb
-                    dx_ext0 = dx0 + 1
-                    dx_ext1 = dx_ext2 = dx0
-                else:
-                    xsv_ext0 = xsv_ext1 = xsv_ext2 = xsb + 1
-                    dx_ext0 = dx_ext1 = dx_ext2 = dx0 - 1
-
-                if (c & 0x02) == 0:
-                    ysv_ext0 = ysv_ext1 = ysv_ext2 = ysb
-                    dy_ext0 = dy_ext1 = dy_ext2 = dy0
-                    if (c & 0x01) == 0x01:
-                        ysv_ext0 -= 1
-                        dy_ext0 += 1
-                    else:
-                        ysv_ext1 -= 1
-                        dy_ext1 += 1
-
-                else:
-                    ysv_ext0 = ysv_ext1 = ysv_ext2 = ysb + 1
-                    dy_ext0 = dy_ext1 = dy_ext2 = dy0 - 1
-
-                if (c & 0x04) == 0:
-                    zsv_ext0 = zsv_ext1 = zsv_ext2 = zsb
-                    dz_ext0 = dz_ext1 = dz_ext2 = dz0
-                    if (c & 0x03) != 0:
-                        if (c & 0x03) == 0x03:
-                            zsv_ext0 -= 1
-                            dz_ext0 += 1
-                        else:
-                            zsv_ext1 -= 1
-                            dz_ext1 += 1
-
-                    else:
-                        zsv_ext2 -= 1
-                        dz_ext2 += 1
-
-                else:
-                    zsv_ext0 = zsv_ext1 = zsv_ext2 = zsb + 1
-                    dz_ext0 = dz_ext1 = dz_ext2 = dz0 - 1
-
-                if (c & 0x08) == 0:
-                    wsv_ext0 = wsv_ext1 = wsb
-                    wsv_ext2 = wsb - 1
-                    dw_ext0 = dw_ext1 = dw0
-                    dw_ext2 = dw0 + 1
-                else:
-                    wsv_ext0 = wsv_ext1 = wsv_ext2 = wsb + 1
-                    dw_ext0 = dw_ext1 = dw_ext2 = dw0 - 1
+                ext = self._extra4d_near_origin(c, xsb, ysb, zsb, wsb, dx0,
+                                                dy0, dz0, dw0)
 
             else:  # (0,0,0,0) is not one of the closest two pentachoron vertices.
                 c = (
                     a_po | b_po
                 )  # Our three extra vertices are determined by the closest two.
-
-                if (c & 0x01) == 0:
-                    xsv_ext0 = xsv_ext2 = xsb
-                    xsv_ext1 = xsb - 1
-                    dx_ext0 = dx0 - 2*SQUISH_CONSTANT_4D
-                    dx_ext1 = dx0 + 1 - SQUISH_CONSTANT_4D
-                    dx_ext2 = dx0 - SQUISH_CONSTANT_4D
-                else:
-                    xsv_ext0 = xsv_ext1 = xsv_ext2 = xsb + 1
-                    dx_ext0 = dx0 - 1 - 2*SQUISH_CONSTANT_4D
-                    dx_ext1 = dx_ext2 = dx0 - 1 - SQUISH_CONSTANT_4D
-
-                if (c & 0x02) == 0:
-                    ysv_ext0 = ysv_ext1 = ysv_ext2 = ysb
-                    dy_ext0 = dy0 - 2*SQUISH_CONSTANT_4D
-                    dy_ext1 = dy_ext2 = dy0 - SQUISH_CONSTANT_4D
-                    if (c & 0x01) == 0x01:
-                        ysv_ext1 -= 1
-                        dy_ext1 += 1
-                    else:
-                        ysv_ext2 -= 1
-                        dy_ext2 += 1
-
-                else:
-                    ysv_ext0 = ysv_ext1 = ysv_ext2 = ysb + 1
-                    dy_ext0 = dy0 - 1 - 2*SQUISH_CONSTANT_4D
-                    dy_ext1 = dy_ext2 = dy0 - 1 - SQUISH_CONSTANT_4D
-
-                if (c & 0x04) == 0:
-                    zsv_ext0 = zsv_ext1 = zsv_ext2 = zsb
-                    dz_ext0 = dz0 - 2*SQUISH_CONSTANT_4D
-                    dz_ext1 = dz_ext2 = dz0 - SQUISH_CONSTANT_4D
-                    if (c & 0x03) == 0x03:
-                        zsv_ext1 -= 1
-                        dz_ext1 += 1
-                    else:
-                        zsv_ext2 -= 1
-                        dz_ext2 += 1
-
-                else:
-                    zsv_ext0 = zsv_ext1 = zsv_ext2 = zsb + 1
-                    dz_ext0 = dz0 - 1 - 2*SQUISH_CONSTANT_4D
-                    dz_ext1 = dz_ext2 = dz0 - 1 - SQUISH_CONSTANT_4D
-
-                if (c & 0x08) == 0:
-                    wsv_ext0 = wsv_ext1 = wsb
-                    wsv_ext2 = wsb - 1
-                    dw_ext0 = dw0 - 2*SQUISH_CONSTANT_4D
-                    dw_ext1 = dw0 - SQUISH_CONSTANT_4D
-                    dw_ext2 = dw0 + 1 - SQUISH_CONSTANT_4D
-                else:
-                    wsv_ext0 = wsv_ext1 = wsv_ext2 = wsb + 1
-                    dw_ext0 = dw0 - 1 - 2*SQUISH_CONSTANT_4D
-                    dw_ext1 = dw_ext2 = dw0 - 1 - SQUISH_CONSTANT_4D
+                ext = self._extra4d_far_origin(c, xsb, ysb, zsb, wsb, dx0, dy0,
+                                               dz0, dw0)
 
             # Contribution (0,0,0,0)
             attn0 = 2 - dx0*dx0 - dy0*dy0 - dz0*dz0 - dw0*dw0
@@ -1095,116 +1008,15 @@ class OpenSimplexNoise:
                 c = (
                     b_po if (b_score < a_score) else a_po
                 )  # Our other closest vertex is the closest out of a and b.
-
-                if (c & 0x01) != 0:
-                    xsv_ext0 = xsb + 2
-                    xsv_ext1 = xsv_ext2 = xsb + 1
-                    dx_ext0 = dx0 - 2 - 4*SQUISH_CONSTANT_4D
-                    dx_ext1 = dx_ext2 = dx0 - 1 - 4*SQUISH_CONSTANT_4D
-                else:
-                    xsv_ext0 = xsv_ext1 = xsv_ext2 = xsb
-                    dx_ext0 = dx_ext1 = dx_ext2 = dx0 - 4*SQUISH_CONSTANT_4D
-
-                if (c & 0x02) != 0:
-                    ysv_ext0 = ysv_ext1 = ysv_ext2 = ysb + 1
-                    dy_ext0 = dy_ext1 = dy_ext2 = dy0 - 1 - 4*SQUISH_CONSTANT_4D
-                    if (c & 0x01) != 0:
-                        ysv_ext1 += 1
-                        dy_ext1 -= 1
-                    else:
-                        ysv_ext0 += 1
-                        dy_ext0 -= 1
-
-                else:
-                    ysv_ext0 = ysv_ext1 = ysv_ext2 = ysb
-                    dy_ext0 = dy_ext1 = dy_ext2 = dy0 - 4*SQUISH_CONSTANT_4D
-
-                if (c & 0x04) != 0:
-                    zsv_ext0 = zsv_ext1 = zsv_ext2 = zsb + 1
-                    dz_ext0 = dz_ext1 = dz_ext2 = dz0 - 1 - 4*SQUISH_CONSTANT_4D
-                    if (c & 0x03) != 0x03:
-                        if (c & 0x03) == 0:
-                            zsv_ext0 += 1
-                            dz_ext0 -= 1
-                        else:
-                            zsv_ext1 += 1
-                            dz_ext1 -= 1
-
-                    else:
-                        zsv_ext2 += 1
-                        dz_ext2 -= 1
-
-                else:
-                    zsv_ext0 = zsv_ext1 = zsv_ext2 = zsb
-                    dz_ext0 = dz_ext1 = dz_ext2 = dz0 - 4*SQUISH_CONSTANT_4D
-
-                if (c & 0x08) != 0:
-                    wsv_ext0 = wsv_ext1 = wsb + 1
-                    wsv_ext2 = wsb + 2
-                    dw_ext0 = dw_ext1 = dw0 - 1 - 4*SQUISH_CONSTANT_4D
-                    dw_ext2 = dw0 - 2 - 4*SQUISH_CONSTANT_4D
-                else:
-                    wsv_ext0 = wsv_ext1 = wsv_ext2 = wsb
-                    dw_ext0 = dw_ext1 = dw_ext2 = dw0 - 4*SQUISH_CONSTANT_4D
+                ext = self._extra4d_near_corner(c, xsb, ysb, zsb, wsb, dx0,
+                                                dy0, dz0, dw0)
 
             else:  # (1,1,1,1) is not one of the closest two pentachoron vertices.
                 c = (
                     a_po & b_po
                 )  # Our three extra vertices are determined by the closest two.
-
-                if (c & 0x01) != 0:
-                    xsv_ext0 = xsv_ext2 = xsb + 1
-                    xsv_ext1 = xsb + 2
-                    dx_ext0 = dx0 - 1 - 2*SQUISH_CONSTANT_4D
-                    dx_ext1 = dx0 - 2 - 3*SQUISH_CONSTANT_4D
-                    dx_ext2 = dx0 - 1 - 3*SQUISH_CONSTANT_4D
-                else:
-                    xsv_ext0 = xsv_ext1 = xsv_ext2 = xsb
-                    dx_ext0 = dx0 - 2*SQUISH_CONSTANT_4D
-                    dx_ext1 = dx_ext2 = dx0 - 3*SQUISH_CONSTANT_4D
-
-                if (c & 0x02) != 0:
-                    ysv_ext0 = ysv_ext1 = ysv_ext2 = ysb + 1
-                    dy_ext0 = dy0 - 1 - 2*SQUISH_CONSTANT_4D
-                    dy_ext1 = dy_ext2 = dy0 - 1 - 3*SQUISH_CONSTANT_4D
-                    if (c & 0x01) != 0:
-                        ysv_ext2 += 1
-                        dy_ext2 -= 1
-                    else:
-                        ysv_ext1 += 1
-                        dy_ext1 -= 1
-
-                else:
-                    ysv_ext0 = ysv_ext1 = ysv_ext2 = ysb
-                    dy_ext0 = dy0 - 2*SQUISH_CONSTANT_4D
-                    dy_ext1 = dy_ext2 = dy0 - 3*SQUISH_CONSTANT_4D
-
-                if (c & 0x04) != 0:
-                    zsv_ext0 = zsv_ext1 = zsv_ext2 = zsb + 1
-                    dz_ext0 = dz0 - 1 - 2*SQUISH_CONSTANT_4D
-                    dz_ext1 = dz_ext2 = dz0 - 1 - 3*SQUISH_CONSTANT_4D
-                    if (c & 0x03) != 0:
-                        zsv_ext2 += 1
-                        dz_ext2 -= 1
-                    else:
-                        zsv_ext1 += 1
-                        dz_ext1 -= 1
-
-                else:
-                    zsv_ext0 = zsv_ext1 = zsv_ext2 = zsb
-                    dz_ext0 = dz0 - 2*SQUISH_CONSTANT_4D
-                    dz_ext1 = dz_ext2 = dz0 - 3*SQUISH_CONSTANT_4D
-
-                if (c & 0x08) != 0:
-                    wsv_ext0 = wsv_ext1 = wsb + 1
-                    wsv_ext2 = wsb + 2
-                    dw_ext0 = dw0 - 1 - 2*SQUISH_CONSTANT_4D
-                    dw_ext1 = dw0 - 1 - 3*SQUISH_CONSTANT_4D
-                    dw_ext2 = dw0 - 2 - 3*SQUISH_CONSTANT_4D
-                else:
-                    wsv_ext0 = wsv_ext1 = wsv_ext2 = wsb
-                    dw_ext0 = dw0 - 2*SQUISH_CONSTANT_4D
-                    dw_ext1 = dw_ext2 = dw0 - 3*SQUISH_CONSTANT_4D
+                ext = self._extra4d_far_corner(c, xsb, ysb, zsb, wsb, dx0, dy0,
+                                               dz0, dw0)
 
             # Contribution (1,1,1,0)
             dx4 = dx0 - 1 - 3*SQUISH_CONSTANT_4D
@@ -1347,127 +1159,14 @@ class OpenSimplexNoise:
                 if a_is_bigger_side:  # Both closest pos on the bigger side
                     c1 = a_po | b_po
                     c2 = a_po & b_po
-                    if (c1 & 0x01) == 0:
-                        xsv_ext0 = xsb
-                        xsv_ext1 = xsb - 1
-                        dx_ext0 = dx0 - 3*SQUISH_CONSTANT_4D
-                        dx_ext1 = dx0 + 1 - 2*SQUISH_CONSTANT_4D
-                    else:
-                        xsv_ext0 = xsv_ext1 = xsb + 1
-                        dx_ext0 = dx0 - 1 - 3*SQUISH_CONSTANT_4D
-                        dx_ext1 = dx0 - 1 - 2*SQUISH_CONSTANT_4D
-
-                    if (c1 & 0x02) == 0:
-                        ysv_ext0 = ysb
-                        ysv_ext1 = ysb - 1
-                        dy_ext0 = dy0 - 3*SQUISH_CONSTANT_4D
-                        dy_ext1 = dy0 + 1 - 2*SQUISH_CONSTANT_4D
-                    else:
-                        ysv_ext0 = ysv_ext1 = ysb + 1
-                        dy_ext0 = dy0 - 1 - 3*SQUISH_CONSTANT_4D
-                        dy_ext1 = dy0 - 1 - 2*SQUISH_CONSTANT_4D
-
-                    if (c1 & 0x04) == 0:
-                        zsv_ext0 = zsb
-                        zsv_ext1 = zsb - 1
-                        dz_ext0 = dz0 - 3*SQUISH_CONSTANT_4D
-                        dz_ext1 = dz0 + 1 - 2*SQUISH_CONSTANT_4D
-                    else:
-                        zsv_ext0 = zsv_ext1 = zsb + 1
-                        dz_ext0 = dz0 - 1 - 3*SQUISH_CONSTANT_4D
-                        dz_ext1 = dz0 - 1 - 2*SQUISH_CONSTANT_4D
-
-                    if (c1 & 0x08) == 0:
-                        wsv_ext0 = wsb
-                        wsv_ext1 = wsb - 1
-                        dw_ext0 = dw0 - 3*SQUISH_CONSTANT_4D
-                        dw_ext1 = dw0 + 1 - 2*SQUISH_CONSTANT_4D
-                    else:
-                        wsv_ext0 = wsv_ext1 = wsb + 1
-                        dw_ext0 = dw0 - 1 - 3*SQUISH_CONSTANT_4D
-                        dw_ext1 = dw0 - 1 - 2*SQUISH_CONSTANT_4D
-
-                    # One combination is a _permutation of (0,0,0,2) based on c2
-                    xsv_ext2 = xsb
-                    ysv_ext2 = ysb
-                    zsv_ext2 = zsb
-                    wsv_ext2 = wsb
-                    dx_ext2 = dx0 - 2*SQUISH_CONSTANT_4D
-                    dy_ext2 = dy0 - 2*SQUISH_CONSTANT_4D
-                    dz_ext2 = dz0 - 2*SQUISH_CONSTANT_4D
-                    dw_ext2 = dw0 - 2*SQUISH_CONSTANT_4D
-                    if (c2 & 0x01) != 0:
-                        xsv_ext2 += 2
-                        dx_ext2 -= 2
-                    elif (c2 & 0x02) != 0:
-                        ysv_ext2 += 2
-                        dy_ext2 -= 2
-                    elif (c2 & 0x04) != 0:
-                        zsv_ext2 += 2
-                        dz_ext2 -= 2
-                    else:
-                        wsv_ext2 += 2
-                        dw_ext2 -= 2
+                    ext = self._extra4d_first_bigger(c1, c2, xsb, ysb, zsb,
+                                                     wsb, dx0, dy0, dz0, dw0)
 
                 else:  # Both closest pos on the smaller side
-                    # One of the two extra pos is (0,0,0,0)
-                    xsv_ext2 = xsb
-                    ysv_ext2 = ysb
-                    zsv_ext2 = zsb
-                    wsv_ext2 = wsb
-                    dx_ext2 = dx0
-                    dy_ext2 = dy0
-                    dz_ext2 = dz0
-                    dw_ext2 = dw0
-
                     # Other two pos are based on the omitted axes.
                     c = a_po | b_po
-
-                    if (c & 0x01) == 0:
-                        xsv_ext0 = xsb - 1
-                        xsv_ext1 = xsb
-                        dx_ext0 = dx0 + 1 - SQUISH_CONSTANT_4D
-                        dx_ext1 = dx0 - SQUISH_CONSTANT_4D
-                    else:
-                        xsv_ext0 = xsv_ext1 = xsb + 1
-                        dx_ext0 = dx_ext1 = dx0 - 1 - SQUISH_CONSTANT_4D
-
-                    if (c & 0x02) == 0:
-                        ysv_ext0 = ysv_ext1 = ysb
-                        dy_ext0 = dy_ext1 = dy0 - SQUISH_CONSTANT_4D
-                        if (c & 0x01) == 0x01:
-                            ysv_ext0 -= 1
-                            dy_ext0 += 1
-                        else:
-                            ysv_ext1 -= 1
-                            dy_ext1 += 1
-
-                    else:
-                        ysv_ext0 = ysv_ext1 = ysb + 1
-                        dy_ext0 = dy_ext1 = dy0 - 1 - SQUISH_CONSTANT_4D
-
-                    if (c & 0x04) == 0:
-                        zsv_ext0 = zsv_ext1 = zsb
-                        dz_ext0 = dz_ext1 = dz0 - SQUISH_CONSTANT_4D
-                        if (c & 0x03) == 0x03:
-                            zsv_ext0 -= 1
-                            dz_ext0 += 1
-                        else:
-                            zsv_ext1 -= 1
-                            dz_ext1 += 1
-
-                    else:
-                        zsv_ext0 = zsv_ext1 = zsb + 1
-                        dz_ext0 = dz_ext1 = dz0 - 1 - SQUISH_CONSTANT_4D
-
-                    if (c & 0x08) == 0:
-                        wsv_ext0 = wsb
-                        wsv_ext1 = wsb - 1
-                        dw_ext0 = dw0 - SQUISH_CONSTANT_4D
-                        dw_ext1 = dw0 + 1 - SQUISH_CONSTANT_4D
-                    else:
-                        wsv_ext0 = wsv_ext1 = wsb + 1
-                        dw_ext0 = dw_ext1 = dw0 - 1 - SQUISH_CONSTANT_4D
+                    ext = self._extra4d_first_smaller(c, xsb, ysb, zsb, wsb,
+                                                      dx0, dy0, dz0, dw0)
 
             else:  # One po on each "side"
                 if a_is_bigger_side:
@@ -1476,75 +1175,8 @@ class OpenSimplexNoise:
                 else:
                     c1 = b_po
                     c2 = a_po
-
-                # Two contributions are the bigger-sided po with each 0 replaced with -1.
-                if (c1 & 0x01) == 0:
-                    xsv_ext0 = xsb - 1
-                    xsv_ext1 = xsb
-                    dx_ext0 = dx0 + 1 - SQUISH_CONSTANT_4D
-                    dx_ext1 = dx0 - SQUISH_CONSTANT_4D
-                else:
-                    xsv_ext0 = xsv_ext1 = xsb + 1
-                    dx_ext0 = dx_ext1 = dx0 - 1 - SQUISH_CONSTANT_4D
-
-                if (c1 & 0x02) == 0:
-                    ysv_ext0 = ysv_ext1 = ysb
-                    dy_ext0 = dy_ext1 = dy0 - SQUISH_CONSTANT_4D
-                    if (c1 & 0x01) == 0x01:
-                        ysv_ext0 -= 1
-                        dy_ext0 += 1
-                    else:
-                        ysv_ext1 -= 1
-                        dy_ext1 += 1
-
-                else:
-                    ysv_ext0 = ysv_ext1 = ysb + 1
-                    dy_ext0 = dy_ext1 = dy0 - 1 - SQUISH_CONSTANT_4D
-
-                if (c1 & 0x04) == 0:
-                    zsv_ext0 = zsv_ext1 = zsb
-                    dz_ext0 = dz_ext1 = dz0 - SQUISH_CONSTANT_4D
-                    if (c1 & 0x03) == 0x03:
-                        zsv_ext0 -= 1
-                        dz_ext0 += 1
-                    else:
-                        zsv_ext1 -= 1
-                        dz_ext1 += 1
-
-                else:
-                    zsv_ext0 = zsv_ext1 = zsb + 1
-                    dz_ext0 = dz_ext1 = dz0 - 1 - SQUISH_CONSTANT_4D
-
-                if (c1 & 0x08) == 0:
-                    wsv_ext0 = wsb
-                    wsv_ext1 = wsb - 1
-                    dw_ext0 = dw0 - SQUISH_CONSTANT_4D
-                    dw_ext1 = dw0 + 1 - SQUISH_CONSTANT_4D
-                else:
-                    wsv_ext0 = wsv_ext1 = wsb + 1
-                    dw_ext0 = dw_ext1 = dw0 - 1 - SQUISH_CONSTANT_4D
-
-                # One contribution is a _permutation of (0,0,0,2) based on the smaller-sided po
-                xsv_ext2 = xsb
-                ysv_ext2 = ysb
-                zsv_ext2 = zsb
-                wsv_ext2 = wsb
-                dx_ext2 = dx0 - 2*SQUISH_CONSTANT_4D
-                dy_ext2 = dy0 - 2*SQUISH_CONSTANT_4D
-                dz_ext2 = dz0 - 2*SQUISH_CONSTANT_4D
-                dw_ext2 = dw0 - 2*SQUISH_CONSTANT_4D
-                if (c2 & 0x01) != 0:
-                    xsv_ext2 += 2
-                    dx_ext2 -= 2
-                elif (c2 & 0x02) != 0:
-                    ysv_ext2 += 2
-                    dy_ext2 -= 2
-                elif (c2 & 0x04) != 0:
-                    zsv_ext2 += 2
-                    dz_ext2 -= 2
-                else:
-                    wsv_ext2 += 2
-                    dw_ext2 -= 2
+                ext = self._extra4d_first_mixed(c1, c2, xsb, ysb, zsb, wsb,
+                                                dx0, dy0, dz0, dw0)
 
             # Contribution (1,0,0,0)
             dx1 = dx0 - 1 - SQUISH_CONSTANT_4D
@@ -1743,121 +1375,14 @@ class OpenSimplexNoise:
                 if a_is_bigger_side:  # Both closest pos on the bigger side
                     c1 = a_po & b_po
                     c2 = a_po | b_po
-
-                    # Two contributions are _permutations of (0,0,0,1) and (0,0,0,2) based on c1
-                    xsv_ext0 = xsv_ext1 = xsb
-                    ysv_ext0 = ysv_ext1 = ysb
-                    zsv_ext0 = zsv_ext1 = zsb
-                    wsv_ext0 = wsv_ext1 = wsb
-                    dx_ext0 = dx0 - SQUISH_CONSTANT_4D
-                    dy_ext0 = dy0 - SQUISH_CONSTANT_4D
-                    dz_ext0 = dz0 - SQUISH_CONSTANT_4D
-                    dw_ext0 = dw0 - SQUISH_CONSTANT_4D
-                    dx_ext1 = dx0 - 2*SQUISH_CONSTANT_4D
-                    dy_ext1 = dy0 - 2*SQUISH_CONSTANT_4D
-                    dz_ext1 = dz0 - 2*SQUISH_CONSTANT_4D
-                    dw_ext1 = dw0 - 2*SQUISH_CONSTANT_4D
-                    if (c1 & 0x01) != 0:
-                        xsv_ext0 += 1
-                        dx_ext0 -= 1
-                        xsv_ext1 += 2
-                        dx_ext1 -= 2
-                    elif (c1 & 0x02) != 0:
-                        ysv_ext0 += 1
-                        dy_ext0 -= 1
-                        ysv_ext1 += 2
-                        dy_ext1 -= 2
-                    elif (c1 & 0x04) != 0:
-                        zsv_ext0 += 1
-                        dz_ext0 -= 1
-                        zsv_ext1 += 2
-                        dz_ext1 -= 2
-                    else:
-                        wsv_ext0 += 1
-                        dw_ext0 -= 1
-                        wsv_ext1 += 2
-                        dw_ext1 -= 2
-
-                    # One contribution is a _permutation of (1,1,1,-1) based on c2
-                    xsv_ext2 = xsb + 1
-                    ysv_ext2 = ysb + 1
-                    zsv_ext2 = zsb + 1
-                    wsv_ext2 = wsb + 1
-                    dx_ext2 = dx0 - 1 - 2*SQUISH_CONSTANT_4D
-                    dy_ext2 = dy0 - 1 - 2*SQUISH_CONSTANT_4D
-                    dz_ext2 = dz0 - 1 - 2*SQUISH_CONSTANT_4D
-                    dw_ext2 = dw0 - 1 - 2*SQUISH_CONSTANT_4D
-                    if (c2 & 0x01) == 0:
-                        xsv_ext2 -= 2
-                        dx_ext2 += 2
-                    elif (c2 & 0x02) == 0:
-                        ysv_ext2 -= 2
-                        dy_ext2 += 2
-                    elif (c2 & 0x04) == 0:
-                        zsv_ext2 -= 2
-                        dz_ext2 += 2
-                    else:
-                        wsv_ext2 -= 2
-                        dw_ext2 += 2
+                    ext = self._extra4d_second_bigger(c1, c2, xsb, ysb, zsb,
+                                                      wsb, dx0, dy0, dz0, dw0)
 
                 else:  # Both closest pos on the smaller side
-                    # One of the two extra pos is (1,1,1,1)
-                    xsv_ext2 = xsb + 1
-                    ysv_ext2 = ysb + 1
-                    zsv_ext2 = zsb + 1
-                    wsv_ext2 = wsb + 1
-                    dx_ext2 = dx0 - 1 - 4*SQUISH_CONSTANT_4D
-                    dy_ext2 = dy0 - 1 - 4*SQUISH_CONSTANT_4D
-                    dz_ext2 = dz0 - 1 - 4*SQUISH_CONSTANT_4D
-                    dw_ext2 = dw0 - 1 - 4*SQUISH_CONSTANT_4D
-
                     # Other two pos are based on the shared axes.
                     c = a_po & b_po
-                    if (c & 0x01) != 0:
-                        xsv_ext0 = xsb + 2
-                        xsv_ext1 = xsb + 1
-                        dx_ext0 = dx0 - 2 - 3*SQUISH_CONSTANT_4D
-                        dx_ext1 = dx0 - 1 - 3*SQUISH_CONSTANT_4D
-                    else:
-                        xsv_ext0 = xsv_ext1 = xsb
-                        dx_ext0 = dx_ext1 = dx0 - 3*SQUISH_CONSTANT_4D
-
-                    if (c & 0x02) != 0:
-                        ysv_ext0 = ysv_ext1 = ysb + 1
-                        dy_ext0 = dy_ext1 = dy0 - 1 - 3*SQUISH_CONSTANT_4D
-                        if (c & 0x01) == 0:
-                            ysv_ext0 += 1
-                            dy_ext0 -= 1
-                        else:
-                            ysv_ext1 += 1
-                            dy_ext1 -= 1
-
-                    else:
-                        ysv_ext0 = ysv_ext1 = ysb
-                        dy_ext0 = dy_ext1 = dy0 - 3*SQUISH_CONSTANT_4D
-
-                    if (c & 0x04) != 0:
-                        zsv_ext0 = zsv_ext1 = zsb + 1
-                        dz_ext0 = dz_ext1 = dz0 - 1 - 3*SQUISH_CONSTANT_4D
-                        if (c & 0x03) == 0:
-                            zsv_ext0 += 1
-                            dz_ext0 -= 1
-                        else:
-                            zsv_ext1 += 1
-                            dz_ext1 -= 1
-
-                    else:
-                        zsv_ext0 = zsv_ext1 = zsb
-                        dz_ext0 = dz_ext1 = dz0 - 3*SQUISH_CONSTANT_4D
-
-                    if (c & 0x08) != 0:
-                        wsv_ext0 = wsb + 1
-                        wsv_ext1 = wsb + 2
-                        dw_ext0 = dw0 - 1 - 3*SQUISH_CONSTANT_4D
-                        dw_ext1 = dw0 - 2 - 3*SQUISH_CONSTANT_4D
-                    else:
-                        wsv_ext0 = wsv_ext1 = wsb
-                        dw_ext0 = dw_ext1 = dw0 - 3*SQUISH_CONSTANT_4D
+                    ext = self._extra4d_second_smaller(c, xsb, ysb, zsb, wsb,
+                                                       dx0, dy0, dz0, dw0)
 
             else:  # One po on each "side"
                 if a_is_bigger_side:
@@ -1866,75 +1391,8 @@ class OpenSimplexNoise:
                 else:
                     c1 = b_po
                     c2 = a_po
-
-                # Two contributions are the bigger-sided po with each 1 replaced with 2.
-                if (c1 & 0x01) != 0:
-                    xsv_ext0 = xsb + 2
-                    xsv_ext1 = xsb + 1
-                    dx_ext0 = dx0 - 2 - 3*SQUISH_CONSTANT_4D
-                    dx_ext1 = dx0 - 1 - 3*SQUISH_CONSTANT_4D
-                else:
-                    xsv_ext0 = xsv_ext1 = xsb
-                    dx_ext0 = dx_ext1 = dx0 - 3*SQUISH_CONSTANT_4D
-
-                if (c1 & 0x02) != 0:
-                    ysv_ext0 = ysv_ext1 = ysb + 1
-                    dy_ext0 = dy_ext1 = dy0 - 1 - 3*SQUISH_CONSTANT_4D
-                    if (c1 & 0x01) == 0:
-                        ysv_ext0 += 1
-                        dy_ext0 -= 1
-                    else:
-                        ysv_ext1 += 1
-                        dy_ext1 -= 1
-
-                else:
-                    ysv_ext0 = ysv_ext1 = ysb
-                    dy_ext0 = dy_ext1 = dy0 - 3*SQUISH_CONSTANT_4D
-
-                if (c1 & 0x04) != 0:
-                    zsv_ext0 = zsv_ext1 = zsb + 1
-                    dz_ext0 = dz_ext1 = dz0 - 1 - 3*SQUISH_CONSTANT_4D
-                    if (c1 & 0x03) == 0:
-                        zsv_ext0 += 1
-                        dz_ext0 -= 1
-                    else:
-                        zsv_ext1 += 1
-                        dz_ext1 -= 1
-
-                else:
-                    zsv_ext0 = zsv_ext1 = zsb
-                    dz_ext0 = dz_ext1 = dz0 - 3*SQUISH_CONSTANT_4D
-
-                if (c1 & 0x08) != 0:
-                    wsv_ext0 = wsb + 1
-                    wsv_ext1 = wsb + 2
-                    dw_ext0 = dw0 - 1 - 3*SQUISH_CONSTANT_4D
-                    dw_ext1 = dw0 - 2 - 3*SQUISH_CONSTANT_4D
-                else:
-                    wsv_ext0 = wsv_ext1 = wsb
-                    dw_ext0 = dw_ext1 = dw0 - 3*SQUISH_CONSTANT_4D
-
-                # One contribution is a _permutation of (1,1,1,-1) based on the smaller-sided po
-                xsv_ext2 = xsb + 1
-                ysv_ext2 = ysb + 1
-                zsv_ext2 = zsb + 1
-                wsv_ext2 = wsb + 1
-                dx_ext2 = dx0 - 1 - 2*SQUISH_CONSTANT_4D
-                dy_ext2 = dy0 - 1 - 2*SQUISH_CONSTANT_4D
-                dz_ext2 = dz0 - 1 - 2*SQUISH_CONSTANT_4D
-                dw_ext2 = dw0 - 1 - 2*SQUISH_CONSTANT_4D
-                if (c2 & 0x01) == 0:
-                    xsv_ext2 -= 2
-                    dx_ext2 += 2
-                elif (c2 & 0x02) == 0:
-                    ysv_ext2 -= 2
-                    dy_ext2 += 2
-                elif (c2 & 0x04) == 0:
-                    zsv_ext2 -= 2
-                    dz_ext2 += 2
-                else:
-                    wsv_ext2 -= 2
-                    dw_ext2 += 2
+                ext = self._extra4d_second_mixed(c1, c2, xsb, ysb, zsb, wsb,
+                                                 dx0, dy0, dz0, dw0)
 
             # Contribution (1,1,1,0)
             dx4 = dx0 - 1 - 3*SQUISH_CONSTANT_4D
@@ -2047,31 +1505,1515 @@ class OpenSimplexNoise:
                           extrapolate(xsb + 0, ysb + 0, zsb + 1, wsb + 1, dx10,
                                       dy10, dz10, dw10))
 
-        # First extra vertex
-        attn_ext0 = (2 - dx_ext0*dx_ext0 - dy_ext0*dy_ext0 - dz_ext0*dz_ext0 -
-                     dw_ext0*dw_ext0)
-        if attn_ext0 > 0:
-            attn_ext0 *= attn_ext0
-            value += (attn_ext0 * attn_ext0 *
-                      extrapolate(xsv_ext0, ysv_ext0, zsv_ext0, wsv_ext0,
-                                  dx_ext0, dy_ext0, dz_ext0, dw_ext0))
-
-        # Second extra vertex
-        attn_ext1 = (2 - dx_ext1*dx_ext1 - dy_ext1*dy_ext1 - dz_ext1*dz_ext1 -
-                     dw_ext1*dw_ext1)
-        if attn_ext1 > 0:
-            attn_ext1 *= attn_ext1
-            value += (attn_ext1 * attn_ext1 *
-                      extrapolate(xsv_ext1, ysv_ext1, zsv_ext1, wsv_ext1,
-                                  dx_ext1, dy_ext1, dz_ext1, dw_ext1))
-
-        # Third extra vertex
-        attn_ext2 = (2 - dx_ext2*dx_ext2 - dy_ext2*dy_ext2 - dz_ext2*dz_ext2 -
-                     dw_ext2*dw_ext2)
-        if attn_ext2 > 0:
-            attn_ext2 *= attn_ext2
-            value += (attn_ext2 * attn_ext2 *
-                      extrapolate(xsv_ext2, ysv_ext2, zsv_ext2, wsv_ext2,
-                                  dx_ext2, dy_ext2, dz_ext2, dw_ext2))
+        # Extra vertices
+        for xsv, ysv, zsv, wsv, dx_ext, dy_ext, dz_ext, dw_ext in zip(*ext):
+            attn_ext = (2 - dx_ext*dx_ext - dy_ext*dy_ext - dz_ext*dz_ext -
+                        dw_ext*dw_ext)
+            if attn_ext > 0:
+                attn_ext *= attn_ext
+                value += (attn_ext * attn_ext * extrapolate(
+                    xsv, ysv, zsv, wsv, dx_ext, dy_ext, dz_ext, dw_ext))
 
         return value / NORM_CONSTANT_4D
+
+    # The extra vertices of noise4d, as (xsv, ysv, zsv, wsv, dx, dy, dz, dw)
+    # triples. They only branch on the closest points (c, c1 and c2), so
+    # noise4d_array runs them as well on groups of points sharing those.
+
+    @staticmethod
+    def _extra4d_near_origin(c, xsb, ysb, zsb, wsb, dx0, dy0, dz0, dw0):
+        # The extra vertices of noise4d when (0,0,0,0) is one of the closest
+        # two pentachoron vertices
+        if (c & 0x01) == 0:
+            xsv_ext0 = xsb - 1
+            xsv_ext1 = xsv_ext2 = xsb
+            dx_ext0 = dx0 + 1
+            dx_ext1 = dx_ext2 = dx0
+        else:
+            xsv_ext0 = xsv_ext1 = xsv_ext2 = xsb + 1
+            dx_ext0 = dx_ext1 = dx_ext2 = dx0 - 1
+
+        if (c & 0x02) == 0:
+            ysv_ext0 = ysv_ext1 = ysv_ext2 = ysb
+            dy_ext0 = dy_ext1 = dy_ext2 = dy0
+            if (c & 0x01) == 0x01:
+                ysv_ext0 = ysv_ext0 - 1
+                dy_ext0 = dy_ext0 + 1
+            else:
+                ysv_ext1 = ysv_ext1 - 1
+                dy_ext1 = dy_ext1 + 1
+
+        else:
+            ysv_ext0 = ysv_ext1 = ysv_ext2 = ysb + 1
+            dy_ext0 = dy_ext1 = dy_ext2 = dy0 - 1
+
+        if (c & 0x04) == 0:
+            zsv_ext0 = zsv_ext1 = zsv_ext2 = zsb
+            dz_ext0 = dz_ext1 = dz_ext2 = dz0
+            if (c & 0x03) != 0:
+                if (c & 0x03) == 0x03:
+                    zsv_ext0 = zsv_ext0 - 1
+                    dz_ext0 = dz_ext0 + 1
+                else:
+                    zsv_ext1 = zsv_ext1 - 1
+                    dz_ext1 = dz_ext1 + 1
+
+            else:
+                zsv_ext2 = zsv_ext2 - 1
+                dz_ext2 = dz_ext2 + 1
+
+        else:
+            zsv_ext0 = zsv_ext1 = zsv_ext2 = zsb + 1
+            dz_ext0 = dz_ext1 = dz_ext2 = dz0 - 1
+
+        if (c & 0x08) == 0:
+            wsv_ext0 = wsv_ext1 = wsb
+            wsv_ext2 = wsb - 1
+            dw_ext0 = dw_ext1 = dw0
+            dw_ext2 = dw0 + 1
+        else:
+            wsv_ext0 = wsv_ext1 = wsv_ext2 = wsb + 1
+            dw_ext0 = dw_ext1 = dw_ext2 = dw0 - 1
+
+        return ((xsv_ext0, xsv_ext1, xsv_ext2), (ysv_ext0, ysv_ext1, ysv_ext2),
+                (zsv_ext0, zsv_ext1, zsv_ext2), (wsv_ext0, wsv_ext1, wsv_ext2),
+                (dx_ext0, dx_ext1, dx_ext2), (dy_ext0, dy_ext1, dy_ext2),
+                (dz_ext0, dz_ext1, dz_ext2), (dw_ext0, dw_ext1, dw_ext2))
+
+    @staticmethod
+    def _extra4d_far_origin(c, xsb, ysb, zsb, wsb, dx0, dy0, dz0, dw0):
+        # The extra vertices of noise4d when (0,0,0,0) is not one of the
+        # closest two pentachoron vertices
+        if (c & 0x01) == 0:
+            xsv_ext0 = xsv_ext2 = xsb
+            xsv_ext1 = xsb - 1
+            dx_ext0 = dx0 - 2*SQUISH_CONSTANT_4D
+            dx_ext1 = dx0 + 1 - SQUISH_CONSTANT_4D
+            dx_ext2 = dx0 - SQUISH_CONSTANT_4D
+        else:
+            xsv_ext0 = xsv_ext1 = xsv_ext2 = xsb + 1
+            dx_ext0 = dx0 - 1 - 2*SQUISH_CONSTANT_4D
+            dx_ext1 = dx_ext2 = dx0 - 1 - SQUISH_CONSTANT_4D
+
+        if (c & 0x02) == 0:
+            ysv_ext0 = ysv_ext1 = ysv_ext2 = ysb
+            dy_ext0 = dy0 - 2*SQUISH_CONSTANT_4D
+            dy_ext1 = dy_ext2 = dy0 - SQUISH_CONSTANT_4D
+            if (c & 0x01) == 0x01:
+                ysv_ext1 = ysv_ext1 - 1
+                dy_ext1 = dy_ext1 + 1
+            else:
+                ysv_ext2 = ysv_ext2 - 1
+                dy_ext2 = dy_ext2 + 1
+
+        else:
+            ysv_ext0 = ysv_ext1 = ysv_ext2 = ysb + 1
+            dy_ext0 = dy0 - 1 - 2*SQUISH_CONSTANT_4D
+            dy_ext1 = dy_ext2 = dy0 - 1 - SQUISH_CONSTANT_4D
+
+        if (c & 0x04) == 0:
+            zsv_ext0 = zsv_ext1 = zsv_ext2 = zsb
+            dz_ext0 = dz0 - 2*SQUISH_CONSTANT_4D
+            dz_ext1 = dz_ext2 = dz0 - SQUISH_CONSTANT_4D
+            if (c & 0x03) == 0x03:
+                zsv_ext1 = zsv_ext1 - 1
+                dz_ext1 = dz_ext1 + 1
+            else:
+                zsv_ext2 = zsv_ext2 - 1
+                dz_ext2 = dz_ext2 + 1
+
+        else:
+            zsv_ext0 = zsv_ext1 = zsv_ext2 = zsb + 1
+            dz_ext0 = dz0 - 1 - 2*SQUISH_CONSTANT_4D
+            dz_ext1 = dz_ext2 = dz0 - 1 - SQUISH_CONSTANT_4D
+
+        if (c & 0x08) == 0:
+            wsv_ext0 = wsv_ext1 = wsb
+            wsv_ext2 = wsb - 1
+            dw_ext0 = dw0 - 2*SQUISH_CONSTANT_4D
+            dw_ext1 = dw0 - SQUISH_CONSTANT_4D
+            dw_ext2 = dw0 + 1 - SQUISH_CONSTANT_4D
+        else:
+            wsv_ext0 = wsv_ext1 = wsv_ext2 = wsb + 1
+            dw_ext0 = dw0 - 1 - 2*SQUISH_CONSTANT_4D
+            dw_ext1 = dw_ext2 = dw0 - 1 - SQUISH_CONSTANT_4D
+
+        return ((xsv_ext0, xsv_ext1, xsv_ext2), (ysv_ext0, ysv_ext1, ysv_ext2),
+                (zsv_ext0, zsv_ext1, zsv_ext2), (wsv_ext0, wsv_ext1, wsv_ext2),
+                (dx_ext0, dx_ext1, dx_ext2), (dy_ext0, dy_ext1, dy_ext2),
+                (dz_ext0, dz_ext1, dz_ext2), (dw_ext0, dw_ext1, dw_ext2))
+
+    @staticmethod
+    def _extra4d_near_corner(c, xsb, ysb, zsb, wsb, dx0, dy0, dz0, dw0):
+        # The extra vertices of noise4d when (1,1,1,1) is one of the closest
+        # two pentachoron vertices
+        if (c & 0x01) != 0:
+            xsv_ext0 = xsb + 2
+            xsv_ext1 = xsv_ext2 = xsb + 1
+            dx_ext0 = dx0 - 2 - 4*SQUISH_CONSTANT_4D
+            dx_ext1 = dx_ext2 = dx0 - 1 - 4*SQUISH_CONSTANT_4D
+        else:
+            xsv_ext0 = xsv_ext1 = xsv_ext2 = xsb
+            dx_ext0 = dx_ext1 = dx_ext2 = dx0 - 4*SQUISH_CONSTANT_4D
+
+        if (c & 0x02) != 0:
+            ysv_ext0 = ysv_ext1 = ysv_ext2 = ysb + 1
+            dy_ext0 = dy_ext1 = dy_ext2 = dy0 - 1 - 4*SQUISH_CONSTANT_4D
+            if (c & 0x01) != 0:
+                ysv_ext1 = ysv_ext1 + 1
+                dy_ext1 = dy_ext1 - 1
+            else:
+                ysv_ext0 = ysv_ext0 + 1
+                dy_ext0 = dy_ext0 - 1
+
+        else:
+            ysv_ext0 = ysv_ext1 = ysv_ext2 = ysb
+            dy_ext0 = dy_ext1 = dy_ext2 = dy0 - 4*SQUISH_CONSTANT_4D
+
+        if (c & 0x04) != 0:
+            zsv_ext0 = zsv_ext1 = zsv_ext2 = zsb + 1
+            dz_ext0 = dz_ext1 = dz_ext2 = dz0 - 1 - 4*SQUISH_CONSTANT_4D
+            if (c & 0x03) != 0x03:
+                if (c & 0x03) == 0:
+                    zsv_ext0 = zsv_ext0 + 1
+                    dz_ext0 = dz_ext0 - 1
+                else:
+                    zsv_ext1 = zsv_ext1 + 1
+                    dz_ext1 = dz_ext1 - 1
+
+            else:
+                zsv_ext2 = zsv_ext2 + 1
+                dz_ext2 = dz_ext2 - 1
+
+        else:
+            zsv_ext0 = zsv_ext1 = zsv_ext2 = zsb
+            dz_ext0 = dz_ext1 = dz_ext2 = dz0 - 4*SQUISH_CONSTANT_4D
+
+        if (c & 0x08) != 0:
+            wsv_ext0 = wsv_ext1 = wsb + 1
+            wsv_ext2 = wsb + 2
+            dw_ext0 = dw_ext1 = dw0 - 1 - 4*SQUISH_CONSTANT_4D
+            dw_ext2 = dw0 - 2 - 4*SQUISH_CONSTANT_4D
+        else:
+            wsv_ext0 = wsv_ext1 = wsv_ext2 = wsb
+            dw_ext0 = dw_ext1 = dw_ext2 = dw0 - 4*SQUISH_CONSTANT_4D
+
+        return ((xsv_ext0, xsv_ext1, xsv_ext2), (ysv_ext0, ysv_ext1, ysv_ext2),
+                (zsv_ext0, zsv_ext1, zsv_ext2), (wsv_ext0, wsv_ext1, wsv_ext2),
+                (dx_ext0, dx_ext1, dx_ext2), (dy_ext0, dy_ext1, dy_ext2),
+                (dz_ext0, dz_ext1, dz_ext2), (dw_ext0, dw_ext1, dw_ext2))
+
+    @staticmethod
+    def _extra4d_far_corner(c, xsb, ysb, zsb, wsb, dx0, dy0, dz0, dw0):
+        # The extra vertices of noise4d when (1,1,1,1) is not one of the
+        # closest two pentachoron vertices
+        if (c & 0x01) != 0:
+            xsv_ext0 = xsv_ext2 = xsb + 1
+            xsv_ext1 = xsb + 2
+            dx_ext0 = dx0 - 1 - 2*SQUISH_CONSTANT_4D
+            dx_ext1 = dx0 - 2 - 3*SQUISH_CONSTANT_4D
+            dx_ext2 = dx0 - 1 - 3*SQUISH_CONSTANT_4D
+        else:
+            xsv_ext0 = xsv_ext1 = xsv_ext2 = xsb
+            dx_ext0 = dx0 - 2*SQUISH_CONSTANT_4D
+            dx_ext1 = dx_ext2 = dx0 - 3*SQUISH_CONSTANT_4D
+
+        if (c & 0x02) != 0:
+            ysv_ext0 = ysv_ext1 = ysv_ext2 = ysb + 1
+            dy_ext0 = dy0 - 1 - 2*SQUISH_CONSTANT_4D
+            dy_ext1 = dy_ext2 = dy0 - 1 - 3*SQUISH_CONSTANT_4D
+            if (c & 0x01) != 0:
+                ysv_ext2 = ysv_ext2 + 1
+                dy_ext2 = dy_ext2 - 1
+            else:
+                ysv_ext1 = ysv_ext1 + 1
+                dy_ext1 = dy_ext1 - 1
+
+        else:
+            ysv_ext0 = ysv_ext1 = ysv_ext2 = ysb
+            dy_ext0 = dy0 - 2*SQUISH_CONSTANT_4D
+            dy_ext1 = dy_ext2 = dy0 - 3*SQUISH_CONSTANT_4D
+
+        if (c & 0x04) != 0:
+            zsv_ext0 = zsv_ext1 = zsv_ext2 = zsb + 1
+            dz_ext0 = dz0 - 1 - 2*SQUISH_CONSTANT_4D
+            dz_ext1 = dz_ext2 = dz0 - 1 - 3*SQUISH_CONSTANT_4D
+            if (c & 0x03) != 0:
+                zsv_ext2 = zsv_ext2 + 1
+                dz_ext2 = dz_ext2 - 1
+            else:
+                zsv_ext1 = zsv_ext1 + 1
+                dz_ext1 = dz_ext1 - 1
+
+        else:
+            zsv_ext0 = zsv_ext1 = zsv_ext2 = zsb
+            dz_ext0 = dz0 - 2*SQUISH_CONSTANT_4D
+            dz_ext1 = dz_ext2 = dz0 - 3*SQUISH_CONSTANT_4D
+
+        if (c & 0x08) != 0:
+            wsv_ext0 = wsv_ext1 = wsb + 1
+            wsv_ext2 = wsb + 2
+            dw_ext0 = dw0 - 1 - 2*SQUISH_CONSTANT_4D
+            dw_ext1 = dw0 - 1 - 3*SQUISH_CONSTANT_4D
+            dw_ext2 = dw0 - 2 - 3*SQUISH_CONSTANT_4D
+        else:
+            wsv_ext0 = wsv_ext1 = wsv_ext2 = wsb
+            dw_ext0 = dw0 - 2*SQUISH_CONSTANT_4D
+            dw_ext1 = dw_ext2 = dw0 - 3*SQUISH_CONSTANT_4D
+
+        return ((xsv_ext0, xsv_ext1, xsv_ext2), (ysv_ext0, ysv_ext1, ysv_ext2),
+                (zsv_ext0, zsv_ext1, zsv_ext2), (wsv_ext0, wsv_ext1, wsv_ext2),
+                (dx_ext0, dx_ext1, dx_ext2), (dy_ext0, dy_ext1, dy_ext2),
+                (dz_ext0, dz_ext1, dz_ext2), (dw_ext0, dw_ext1, dw_ext2))
+
+    @staticmethod
+    def _extra4d_first_bigger(c1, c2, xsb, ysb, zsb, wsb, dx0, dy0, dz0, dw0):
+        # The extra vertices of noise4d when inside the first dispentachoron
+        # with both closest points on the bigger side
+        if (c1 & 0x01) == 0:
+            xsv_ext0 = xsb
+            xsv_ext1 = xsb - 1
+            dx_ext0 = dx0 - 3*SQUISH_CONSTANT_4D
+            dx_ext1 = dx0 + 1 - 2*SQUISH_CONSTANT_4D
+        else:
+            xsv_ext0 = xsv_ext1 = xsb + 1
+            dx_ext0 = dx0 - 1 - 3*SQUISH_CONSTANT_4D
+            dx_ext1 = dx0 - 1 - 2*SQUISH_CONSTANT_4D
+
+        if (c1 & 0x02) == 0:
+            ysv_ext0 = ysb
+            ysv_ext1 = ysb - 1
+            dy_ext0 = dy0 - 3*SQUISH_CONSTANT_4D
+            dy_ext1 = dy0 + 1 - 2*SQUISH_CONSTANT_4D
+        else:
+            ysv_ext0 = ysv_ext1 = ysb + 1
+            dy_ext0 = dy0 - 1 - 3*SQUISH_CONSTANT_4D
+            dy_ext1 = dy0 - 1 - 2*SQUISH_CONSTANT_4D
+
+        if (c1 & 0x04) == 0:
+            zsv_ext0 = zsb
+            zsv_ext1 = zsb - 1
+            dz_ext0 = dz0 - 3*SQUISH_CONSTANT_4D
+            dz_ext1 = dz0 + 1 - 2*SQUISH_CONSTANT_4D
+        else:
+            zsv_ext0 = zsv_ext1 = zsb + 1
+            dz_ext0 = dz0 - 1 - 3*SQUISH_CONSTANT_4D
+            dz_ext1 = dz0 - 1 - 2*SQUISH_CONSTANT_4D
+
+        if (c1 & 0x08) == 0:
+            wsv_ext0 = wsb
+            wsv_ext1 = wsb - 1
+            dw_ext0 = dw0 - 3*SQUISH_CONSTANT_4D
+            dw_ext1 = dw0 + 1 - 2*SQUISH_CONSTANT_4D
+        else:
+            wsv_ext0 = wsv_ext1 = wsb + 1
+            dw_ext0 = dw0 - 1 - 3*SQUISH_CONSTANT_4D
+            dw_ext1 = dw0 - 1 - 2*SQUISH_CONSTANT_4D
+
+        # One combination is a _permutation of (0,0,0,2) based on c2
+        xsv_ext2 = xsb
+        ysv_ext2 = ysb
+        zsv_ext2 = zsb
+        wsv_ext2 = wsb
+        dx_ext2 = dx0 - 2*SQUISH_CONSTANT_4D
+        dy_ext2 = dy0 - 2*SQUISH_CONSTANT_4D
+        dz_ext2 = dz0 - 2*SQUISH_CONSTANT_4D
+        dw_ext2 = dw0 - 2*SQUISH_CONSTANT_4D
+        if (c2 & 0x01) != 0:
+            xsv_ext2 = xsv_ext2 + 2
+            dx_ext2 = dx_ext2 - 2
+        elif (c2 & 0x02) != 0:
+            ysv_ext2 = ysv_ext2 + 2
+            dy_ext2 = dy_ext2 - 2
+        elif (c2 & 0x04) != 0:
+            zsv_ext2 = zsv_ext2 + 2
+            dz_ext2 = dz_ext2 - 2
+        else:
+            wsv_ext2 = wsv_ext2 + 2
+            dw_ext2 = dw_ext2 - 2
+
+        return ((xsv_ext0, xsv_ext1, xsv_ext2), (ysv_ext0, ysv_ext1, ysv_ext2),
+                (zsv_ext0, zsv_ext1, zsv_ext2), (wsv_ext0, wsv_ext1, wsv_ext2),
+                (dx_ext0, dx_ext1, dx_ext2), (dy_ext0, dy_ext1, dy_ext2),
+                (dz_ext0, dz_ext1, dz_ext2), (dw_ext0, dw_ext1, dw_ext2))
+
+    @staticmethod
+    def _extra4d_first_smaller(c, xsb, ysb, zsb, wsb, dx0, dy0, dz0, dw0):
+        # The extra vertices of noise4d when inside the first dispentachoron
+        # with both closest points on the smaller side
+        # One of the two extra pos is (0,0,0,0)
+        xsv_ext2 = xsb
+        ysv_ext2 = ysb
+        zsv_ext2 = zsb
+        wsv_ext2 = wsb
+        dx_ext2 = dx0
+        dy_ext2 = dy0
+        dz_ext2 = dz0
+        dw_ext2 = dw0
+        if (c & 0x01) == 0:
+            xsv_ext0 = xsb - 1
+            xsv_ext1 = xsb
+            dx_ext0 = dx0 + 1 - SQUISH_CONSTANT_4D
+            dx_ext1 = dx0 - SQUISH_CONSTANT_4D
+        else:
+            xsv_ext0 = xsv_ext1 = xsb + 1
+            dx_ext0 = dx_ext1 = dx0 - 1 - SQUISH_CONSTANT_4D
+
+        if (c & 0x02) == 0:
+            ysv_ext0 = ysv_ext1 = ysb
+            dy_ext0 = dy_ext1 = dy0 - SQUISH_CONSTANT_4D
+            if (c & 0x01) == 0x01:
+                ysv_ext0 = ysv_ext0 - 1
+                dy_ext0 = dy_ext0 + 1
+            else:
+                ysv_ext1 = ysv_ext1 - 1
+                dy_ext1 = dy_ext1 + 1
+
+        else:
+            ysv_ext0 = ysv_ext1 = ysb + 1
+            dy_ext0 = dy_ext1 = dy0 - 1 - SQUISH_CONSTANT_4D
+
+        if (c & 0x04) == 0:
+            zsv_ext0 = zsv_ext1 = zsb
+            dz_ext0 = dz_ext1 = dz0 - SQUISH_CONSTANT_4D
+            if (c & 0x03) == 0x03:
+                zsv_ext0 = zsv_ext0 - 1
+                dz_ext0 = dz_ext0 + 1
+            else:
+                zsv_ext1 = zsv_ext1 - 1
+                dz_ext1 = dz_ext1 + 1
+
+        else:
+            zsv_ext0 = zsv_ext1 = zsb + 1
+            dz_ext0 = dz_ext1 = dz0 - 1 - SQUISH_CONSTANT_4D
+
+        if (c & 0x08) == 0:
+            wsv_ext0 = wsb
+            wsv_ext1 = wsb - 1
+            dw_ext0 = dw0 - SQUISH_CONSTANT_4D
+            dw_ext1 = dw0 + 1 - SQUISH_CONSTANT_4D
+        else:
+            wsv_ext0 = wsv_ext1 = wsb + 1
+            dw_ext0 = dw_ext1 = dw0 - 1 - SQUISH_CONSTANT_4D
+
+        return ((xsv_ext0, xsv_ext1, xsv_ext2), (ysv_ext0, ysv_ext1, ysv_ext2),
+                (zsv_ext0, zsv_ext1, zsv_ext2), (wsv_ext0, wsv_ext1, wsv_ext2),
+                (dx_ext0, dx_ext1, dx_ext2), (dy_ext0, dy_ext1, dy_ext2),
+                (dz_ext0, dz_ext1, dz_ext2), (dw_ext0, dw_ext1, dw_ext2))
+
+    @staticmethod
+    def _extra4d_first_mixed(c1, c2, xsb, ysb, zsb, wsb, dx0, dy0, dz0, dw0):
+        # The extra vertices of noise4d when inside the first dispentachoron
+        # with one closest point on each side
+        # Two contributions are the bigger-sided po with each 0 replaced with -1.
+        if (c1 & 0x01) == 0:
+            xsv_ext0 = xsb - 1
+            xsv_ext1 = xsb
+            dx_ext0 = dx0 + 1 - SQUISH_CONSTANT_4D
+            dx_ext1 = dx0 - SQUISH_CONSTANT_4D
+        else:
+            xsv_ext0 = xsv_ext1 = xsb + 1
+            dx_ext0 = dx_ext1 = dx0 - 1 - SQUISH_CONSTANT_4D
+
+        if (c1 & 0x02) == 0:
+            ysv_ext0 = ysv_ext1 = ysb
+            dy_ext0 = dy_ext1 = dy0 - SQUISH_CONSTANT_4D
+            if (c1 & 0x01) == 0x01:
+                ysv_ext0 = ysv_ext0 - 1
+                dy_ext0 = dy_ext0 + 1
+            else:
+                ysv_ext1 = ysv_ext1 - 1
+                dy_ext1 = dy_ext1 + 1
+
+        else:
+            ysv_ext0 = ysv_ext1 = ysb + 1
+            dy_ext0 = dy_ext1 = dy0 - 1 - SQUISH_CONSTANT_4D
+
+        if (c1 & 0x04) == 0:
+            zsv_ext0 = zsv_ext1 = zsb
+            dz_ext0 = dz_ext1 = dz0 - SQUISH_CONSTANT_4D
+            if (c1 & 0x03) == 0x03:
+                zsv_ext0 = zsv_ext0 - 1
+                dz_ext0 = dz_ext0 + 1
+            else:
+                zsv_ext1 = zsv_ext1 - 1
+                dz_ext1 = dz_ext1 + 1
+
+        else:
+            zsv_ext0 = zsv_ext1 = zsb + 1
+            dz_ext0 = dz_ext1 = dz0 - 1 - SQUISH_CONSTANT_4D
+
+        if (c1 & 0x08) == 0:
+            wsv_ext0 = wsb
+            wsv_ext1 = wsb - 1
+            dw_ext0 = dw0 - SQUISH_CONSTANT_4D
+            dw_ext1 = dw0 + 1 - SQUISH_CONSTANT_4D
+        else:
+            wsv_ext0 = wsv_ext1 = wsb + 1
+            dw_ext0 = dw_ext1 = dw0 - 1 - SQUISH_CONSTANT_4D
+
+        # One contribution is a _permutation of (0,0,0,2) based on the smaller-sided po
+        xsv_ext2 = xsb
+        ysv_ext2 = ysb
+        zsv_ext2 = zsb
+        wsv_ext2 = wsb
+        dx_ext2 = dx0 - 2*SQUISH_CONSTANT_4D
+        dy_ext2 = dy0 - 2*SQUISH_CONSTANT_4D
+        dz_ext2 = dz0 - 2*SQUISH_CONSTANT_4D
+        dw_ext2 = dw0 - 2*SQUISH_CONSTANT_4D
+        if (c2 & 0x01) != 0:
+            xsv_ext2 = xsv_ext2 + 2
+            dx_ext2 = dx_ext2 - 2
+        elif (c2 & 0x02) != 0:
+            ysv_ext2 = ysv_ext2 + 2
+            dy_ext2 = dy_ext2 - 2
+        elif (c2 & 0x04) != 0:
+            zsv_ext2 = zsv_ext2 + 2
+            dz_ext2 = dz_ext2 - 2
+        else:
+            wsv_ext2 = wsv_ext2 + 2
+            dw_ext2 = dw_ext2 - 2
+
+        return ((xsv_ext0, xsv_ext1, xsv_ext2), (ysv_ext0, ysv_ext1, ysv_ext2),
+                (zsv_ext0, zsv_ext1, zsv_ext2), (wsv_ext0, wsv_ext1, wsv_ext2),
+                (dx_ext0, dx_ext1, dx_ext2), (dy_ext0, dy_ext1, dy_ext2),
+                (dz_ext0, dz_ext1, dz_ext2), (dw_ext0, dw_ext1, dw_ext2))
+
+    @staticmethod
+    def _extra4d_second_bigger(c1, c2, xsb, ysb, zsb, wsb, dx0, dy0, dz0, dw0):
+        # The extra vertices of noise4d when inside the second dispentachoron
+        # with both closest points on the bigger side
+        # Two contributions are _permutations of (0,0,0,1) and (0,0,0,2) based on c1
+        xsv_ext0 = xsv_ext1 = xsb
+        ysv_ext0 = ysv_ext1 = ysb
+        zsv_ext0 = zsv_ext1 = zsb
+        wsv_ext0 = wsv_ext1 = wsb
+        dx_ext0 = dx0 - SQUISH_CONSTANT_4D
+        dy_ext0 = dy0 - SQUISH_CONSTANT_4D
+        dz_ext0 = dz0 - SQUISH_CONSTANT_4D
+        dw_ext0 = dw0 - SQUISH_CONSTANT_4D
+        dx_ext1 = dx0 - 2*SQUISH_CONSTANT_4D
+        dy_ext1 = dy0 - 2*SQUISH_CONSTANT_4D
+        dz_ext1 = dz0 - 2*SQUISH_CONSTANT_4D
+        dw_ext1 = dw0 - 2*SQUISH_CONSTANT_4D
+        if (c1 & 0x01) != 0:
+            xsv_ext0 = xsv_ext0 + 1
+            dx_ext0 = dx_ext0 - 1
+            xsv_ext1 = xsv_ext1 + 2
+            dx_ext1 = dx_ext1 - 2
+        elif (c1 & 0x02) != 0:
+            ysv_ext0 = ysv_ext0 + 1
+            dy_ext0 = dy_ext0 - 1
+            ysv_ext1 = ysv_ext1 + 2
+            dy_ext1 = dy_ext1 - 2
+        elif (c1 & 0x04) != 0:
+            zsv_ext0 = zsv_ext0 + 1
+            dz_ext0 = dz_ext0 - 1
+            zsv_ext1 = zsv_ext1 + 2
+            dz_ext1 = dz_ext1 - 2
+        else:
+            wsv_ext0 = wsv_ext0 + 1
+            dw_ext0 = dw_ext0 - 1
+            wsv_ext1 = wsv_ext1 + 2
+            dw_ext1 = dw_ext1 - 2
+
+        # One contribution is a _permutation of (1,1,1,-1) based on c2
+        xsv_ext2 = xsb + 1
+        ysv_ext2 = ysb + 1
+        zsv_ext2 = zsb + 1
+        wsv_ext2 = wsb + 1
+        dx_ext2 = dx0 - 1 - 2*SQUISH_CONSTANT_4D
+        dy_ext2 = dy0 - 1 - 2*SQUISH_CONSTANT_4D
+        dz_ext2 = dz0 - 1 - 2*SQUISH_CONSTANT_4D
+        dw_ext2 = dw0 - 1 - 2*SQUISH_CONSTANT_4D
+        if (c2 & 0x01) == 0:
+            xsv_ext2 = xsv_ext2 - 2
+            dx_ext2 = dx_ext2 + 2
+        elif (c2 & 0x02) == 0:
+            ysv_ext2 = ysv_ext2 - 2
+            dy_ext2 = dy_ext2 + 2
+        elif (c2 & 0x04) == 0:
+            zsv_ext2 = zsv_ext2 - 2
+            dz_ext2 = dz_ext2 + 2
+        else:
+            wsv_ext2 = wsv_ext2 - 2
+            dw_ext2 = dw_ext2 + 2
+
+        return ((xsv_ext0, xsv_ext1, xsv_ext2), (ysv_ext0, ysv_ext1, ysv_ext2),
+                (zsv_ext0, zsv_ext1, zsv_ext2), (wsv_ext0, wsv_ext1, wsv_ext2),
+                (dx_ext0, dx_ext1, dx_ext2), (dy_ext0, dy_ext1, dy_ext2),
+                (dz_ext0, dz_ext1, dz_ext2), (dw_ext0, dw_ext1, dw_ext2))
+
+    @staticmethod
+    def _extra4d_second_smaller(c, xsb, ysb, zsb, wsb, dx0, dy0, dz0, dw0):
+        # The extra vertices of noise4d when inside the second dispentachoron
+        # with both closest points on the smaller side
+        # One of the two extra pos is (1,1,1,1)
+        xsv_ext2 = xsb + 1
+        ysv_ext2 = ysb + 1
+        zsv_ext2 = zsb + 1
+        wsv_ext2 = wsb + 1
+        dx_ext2 = dx0 - 1 - 4*SQUISH_CONSTANT_4D
+        dy_ext2 = dy0 - 1 - 4*SQUISH_CONSTANT_4D
+        dz_ext2 = dz0 - 1 - 4*SQUISH_CONSTANT_4D
+        dw_ext2 = dw0 - 1 - 4*SQUISH_CONSTANT_4D
+        if (c & 0x01) != 0:
+            xsv_ext0 = xsb + 2
+            xsv_ext1 = xsb + 1
+            dx_ext0 = dx0 - 2 - 3*SQUISH_CONSTANT_4D
+            dx_ext1 = dx0 - 1 - 3*SQUISH_CONSTANT_4D
+        else:
+            xsv_ext0 = xsv_ext1 = xsb
+            dx_ext0 = dx_ext1 = dx0 - 3*SQUISH_CONSTANT_4D
+
+        if (c & 0x02) != 0:
+            ysv_ext0 = ysv_ext1 = ysb + 1
+            dy_ext0 = dy_ext1 = dy0 - 1 - 3*SQUISH_CONSTANT_4D
+            if (c & 0x01) == 0:
+                ysv_ext0 = ysv_ext0 + 1
+                dy_ext0 = dy_ext0 - 1
+            else:
+                ysv_ext1 = ysv_ext1 + 1
+                dy_ext1 = dy_ext1 - 1
+
+        else:
+            ysv_ext0 = ysv_ext1 = ysb
+            dy_ext0 = dy_ext1 = dy0 - 3*SQUISH_CONSTANT_4D
+
+        if (c & 0x04) != 0:
+            zsv_ext0 = zsv_ext1 = zsb + 1
+            dz_ext0 = dz_ext1 = dz0 - 1 - 3*SQUISH_CONSTANT_4D
+            if (c & 0x03) == 0:
+                zsv_ext0 = zsv_ext0 + 1
+                dz_ext0 = dz_ext0 - 1
+            else:
+                zsv_ext1 = zsv_ext1 + 1
+                dz_ext1 = dz_ext1 - 1
+
+        else:
+            zsv_ext0 = zsv_ext1 = zsb
+            dz_ext0 = dz_ext1 = dz0 - 3*SQUISH_CONSTANT_4D
+
+        if (c & 0x08) != 0:
+            wsv_ext0 = wsb + 1
+            wsv_ext1 = wsb + 2
+            dw_ext0 = dw0 - 1 - 3*SQUISH_CONSTANT_4D
+            dw_ext1 = dw0 - 2 - 3*SQUISH_CONSTANT_4D
+        else:
+            wsv_ext0 = wsv_ext1 = wsb
+            dw_ext0 = dw_ext1 = dw0 - 3*SQUISH_CONSTANT_4D
+
+        return ((xsv_ext0, xsv_ext1, xsv_ext2), (ysv_ext0, ysv_ext1, ysv_ext2),
+                (zsv_ext0, zsv_ext1, zsv_ext2), (wsv_ext0, wsv_ext1, wsv_ext2),
+                (dx_ext0, dx_ext1, dx_ext2), (dy_ext0, dy_ext1, dy_ext2),
+                (dz_ext0, dz_ext1, dz_ext2), (dw_ext0, dw_ext1, dw_ext2))
+
+    @staticmethod
+    def _extra4d_second_mixed(c1, c2, xsb, ysb, zsb, wsb, dx0, dy0, dz0, dw0):
+        # The extra vertices of noise4d when inside the second dispentachoron
+        # with one closest point on each side
+        # Two contributions are the bigger-sided po with each 1 replaced with 2.
+        if (c1 & 0x01) != 0:
+            xsv_ext0 = xsb + 2
+            xsv_ext1 = xsb + 1
+            dx_ext0 = dx0 - 2 - 3*SQUISH_CONSTANT_4D
+            dx_ext1 = dx0 - 1 - 3*SQUISH_CONSTANT_4D
+        else:
+            xsv_ext0 = xsv_ext1 = xsb
+            dx_ext0 = dx_ext1 = dx0 - 3*SQUISH_CONSTANT_4D
+
+        if (c1 & 0x02) != 0:
+            ysv_ext0 = ysv_ext1 = ysb + 1
+            dy_ext0 = dy_ext1 = dy0 - 1 - 3*SQUISH_CONSTANT_4D
+            if (c1 & 0x01) == 0:
+                ysv_ext0 = ysv_ext0 + 1
+                dy_ext0 = dy_ext0 - 1
+            else:
+                ysv_ext1 = ysv_ext1 + 1
+                dy_ext1 = dy_ext1 - 1
+
+        else:
+            ysv_ext0 = ysv_ext1 = ysb
+            dy_ext0 = dy_ext1 = dy0 - 3*SQUISH_CONSTANT_4D
+
+        if (c1 & 0x04) != 0:
+            zsv_ext0 = zsv_ext1 = zsb + 1
+            dz_ext0 = dz_ext1 = dz0 - 1 - 3*SQUISH_CONSTANT_4D
+            if (c1 & 0x03) == 0:
+                zsv_ext0 = zsv_ext0 + 1
+                dz_ext0 = dz_ext0 - 1
+            else:
+                zsv_ext1 = zsv_ext1 + 1
+                dz_ext1 = dz_ext1 - 1
+
+        else:
+            zsv_ext0 = zsv_ext1 = zsb
+            dz_ext0 = dz_ext1 = dz0 - 3*SQUISH_CONSTANT_4D
+
+        if (c1 & 0x08) != 0:
+            wsv_ext0 = wsb + 1
+            wsv_ext1 = wsb + 2
+            dw_ext0 = dw0 - 1 - 3*SQUISH_CONSTANT_4D
+            dw_ext1 = dw0 - 2 - 3*SQUISH_CONSTANT_4D
+        else:
+            wsv_ext0 = wsv_ext1 = wsb
+            dw_ext0 = dw_ext1 = dw0 - 3*SQUISH_CONSTANT_4D
+
+        # One contribution is a _permutation of (1,1,1,-1) based on the smaller-sided po
+        xsv_ext2 = xsb + 1
+        ysv_ext2 = ysb + 1
+        zsv_ext2 = zsb + 1
+        wsv_ext2 = wsb + 1
+        dx_ext2 = dx0 - 1 - 2*SQUISH_CONSTANT_4D
+        dy_ext2 = dy0 - 1 - 2*SQUISH_CONSTANT_4D
+        dz_ext2 = dz0 - 1 - 2*SQUISH_CONSTANT_4D
+        dw_ext2 = dw0 - 1 - 2*SQUISH_CONSTANT_4D
+        if (c2 & 0x01) == 0:
+            xsv_ext2 = xsv_ext2 - 2
+            dx_ext2 = dx_ext2 + 2
+        elif (c2 & 0x02) == 0:
+            ysv_ext2 = ysv_ext2 - 2
+            dy_ext2 = dy_ext2 + 2
+        elif (c2 & 0x04) == 0:
+            zsv_ext2 = zsv_ext2 - 2
+            dz_ext2 = dz_ext2 + 2
+        else:
+            wsv_ext2 = wsv_ext2 - 2
+            dw_ext2 = dw_ext2 + 2
+
+        return ((xsv_ext0, xsv_ext1, xsv_ext2), (ysv_ext0, ysv_ext1, ysv_ext2),
+                (zsv_ext0, zsv_ext1, zsv_ext2), (wsv_ext0, wsv_ext1, wsv_ext2),
+                (dx_ext0, dx_ext1, dx_ext2), (dy_ext0, dy_ext1, dy_ext2),
+                (dz_ext0, dz_ext1, dz_ext2), (dw_ext0, dw_ext1, dw_ext2))
+
+    def _extrapolate2d_array(self, xsb, ysb, dx, dy):
+        perm = self._perm_array
+        index = perm[(perm[xsb & 0xFF] + ysb) & 0xFF] & 0x0E
+
+        return _GRADIENTS_2D[index] * dx + _GRADIENTS_2D[index + 1] * dy
+
+    def _extrapolate3d_array(self, xsb, ysb, zsb, dx, dy, dz):
+        perm = self._perm_array
+        index = self._perm_grad_index_3D_array[(perm[
+            (perm[xsb & 0xFF] + ysb) & 0xFF] + zsb) & 0xFF]
+
+        return (_GRADIENTS_3D[index] * dx + _GRADIENTS_3D[index + 1] * dy +
+                _GRADIENTS_3D[index + 2] * dz)
+
+    def _extrapolate4d_array(self, xsb, ysb, zsb, wsb, dx, dy, dz, dw):
+        perm = self._perm_array
+        index = (perm[(perm[(perm[
+            (perm[xsb & 0xFF] + ysb) & 0xFF] + zsb) & 0xFF] + wsb) & 0xFF]
+                 & 0xFC)
+
+        return (_GRADIENTS_4D[index] * dx + _GRADIENTS_4D[index + 1] * dy +
+                _GRADIENTS_4D[index + 2] * dz + _GRADIENTS_4D[index + 3] * dw)
+
+    def _contribute2d_array(self, value, xsb, ysb, dx, dy):
+        # Same as a contribution block of noise2d, for every point at once.
+        # Points out of reach keep their value untouched (not even + 0.).
+        attn = 2 - dx*dx - dy*dy
+        reach = attn > 0
+        attn *= attn
+        return np.where(
+            reach,
+            value + attn * attn * self._extrapolate2d_array(xsb, ysb, dx, dy),
+            value)
+
+    def _contribute3d_array(self, value, xsb, ysb, zsb, dx, dy, dz):
+        attn = 2 - dx*dx - dy*dy - dz*dz
+        reach = attn > 0
+        attn *= attn
+        return np.where(
+            reach, value +
+            attn * attn * self._extrapolate3d_array(xsb, ysb, zsb, dx, dy, dz),
+            value)
+
+    def _contribute4d_array(self, value, xsb, ysb, zsb, wsb, dx, dy, dz, dw):
+        attn = 2 - dx*dx - dy*dy - dz*dz - dw*dw
+        reach = attn > 0
+        attn *= attn
+        return np.where(
+            reach, value + attn * attn *
+            self._extrapolate4d_array(xsb, ysb, zsb, wsb, dx, dy, dz, dw),
+            value)
+
+    def noise2d_array(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        2D open simplex noise over arrays\\
+        gives exactly the same values as ``noise2d`` on each point
+
+        Parameters
+        ----------
+            x : np.ndarray
+                the x-components of the points to evaluate
+            y : np.ndarray
+                the y-components of the points to evaluate, broadcast against x
+
+        Returns
+        -------
+            np.ndarray : open simplex 2D between -1 and 1, with the broadcast shape
+        """
+        x, y = np.broadcast_arrays(np.asarray(x, dtype=np.float64),
+                                   np.asarray(y, dtype=np.float64))
+        shape = x.shape
+        x, y = x.ravel(), y.ravel()
+
+        # Place input coordinates onto grid.
+        stretch_offset = (x+y) * STRETCH_CONSTANT_2D
+        xs = x + stretch_offset
+        ys = y + stretch_offset
+
+        # Floor to get grid coordinates of rhombus (stretched square) super-cell origin.
+        xsb = np.floor(xs).astype(np.int64)
+        ysb = np.floor(ys).astype(np.int64)
+
+        # Skew out to get actual coordinates of rhombus origin.
+        squish_offset = (xsb+ysb) * SQUISH_CONSTANT_2D
+        xb = xsb + squish_offset
+        yb = ysb + squish_offset
+
+        # Compute grid coordinates relative to rhombus origin.
+        xins = xs - xsb
+        yins = ys - ysb
+        in_sum = xins + yins
+
+        # Positions relative to origin point.
+        dx0 = x - xb
+        dy0 = y - yb
+
+        value = np.zeros(len(x))
+
+        # Contribution (1,0)
+        dx1 = dx0 - 1 - SQUISH_CONSTANT_2D
+        dy1 = dy0 - 0 - SQUISH_CONSTANT_2D
+        value = self._contribute2d_array(value, xsb + 1, ysb + 0, dx1, dy1)
+
+        # Contribution (0,1)
+        dx2 = dx0 - 0 - SQUISH_CONSTANT_2D
+        dy2 = dy0 - 1 - SQUISH_CONSTANT_2D
+        value = self._contribute2d_array(value, xsb + 0, ysb + 1, dx2, dy2)
+
+        # Each branch of noise2d computed for every point, then selected.
+        x_wins = xins > yins
+        inside = in_sum <= 1
+
+        # inside the triangle at (0,0)
+        zins = 1 - in_sum
+        closest = (zins > xins) | (zins > yins)
+        xsv_ext = np.select([closest & x_wins, closest], [xsb + 1, xsb - 1],
+                            xsb + 1)
+        ysv_ext = np.select([closest & x_wins, closest], [ysb - 1, ysb + 1],
+                            ysb + 1)
+        dx_ext = np.select([closest & x_wins, closest], [dx0 - 1, dx0 + 1],
+                           dx0 - 1 - 2*SQUISH_CONSTANT_2D)
+        dy_ext = np.select([closest & x_wins, closest], [dy0 + 1, dy0 - 1],
+                           dy0 - 1 - 2*SQUISH_CONSTANT_2D)
+
+        # inside the triangle at (1,1)
+        zins = 2 - in_sum
+        closest = (zins < xins) | (zins < yins)
+        conds = [inside, closest & x_wins, closest]
+        xsv_ext = np.select(conds, [xsv_ext, xsb + 2, xsb + 0], xsb)
+        ysv_ext = np.select(conds, [ysv_ext, ysb + 0, ysb + 2], ysb)
+        dx_ext = np.select(conds, [
+            dx_ext, dx0 - 2 - 2*SQUISH_CONSTANT_2D,
+            dx0 + 0 - 2*SQUISH_CONSTANT_2D
+        ], dx0)
+        dy_ext = np.select(conds, [
+            dy_ext, dy0 + 0 - 2*SQUISH_CONSTANT_2D,
+            dy0 - 2 - 2*SQUISH_CONSTANT_2D
+        ], dy0)
+        xsb = np.where(inside, xsb, xsb + 1)
+        ysb = np.where(inside, ysb, ysb + 1)
+        dx0 = np.where(inside, dx0, dx0 - 1 - 2*SQUISH_CONSTANT_2D)
+        dy0 = np.where(inside, dy0, dy0 - 1 - 2*SQUISH_CONSTANT_2D)
+
+        # Contribution (0,0) or (1,1)
+        value = self._contribute2d_array(value, xsb, ysb, dx0, dy0)
+
+        # Extra Vertex
+        value = self._contribute2d_array(value, xsv_ext, ysv_ext, dx_ext,
+                                         dy_ext)
+
+        return (value / NORM_CONSTANT_2D).reshape(shape)
+
+    def noise3d_array(self, x: np.ndarray, y: np.ndarray,
+                      z: np.ndarray) -> np.ndarray:
+        """
+        3D open simplex noise over arrays\\
+        gives exactly the same values as ``noise3d`` on each point
+
+        Parameters
+        ----------
+            x : np.ndarray
+                the x-components of the points to evaluate
+            y : np.ndarray
+                the y-components of the points to evaluate
+            z : np.ndarray
+                the z-components of the points to evaluate\\
+                x, y and z are broadcast against each other
+
+        Returns
+        -------
+            np.ndarray : open simplex 3D between -1 and 1, with the broadcast shape
+        """
+        x, y, z = np.broadcast_arrays(np.asarray(x, dtype=np.float64),
+                                      np.asarray(y, dtype=np.float64),
+                                      np.asarray(z, dtype=np.float64))
+        shape = x.shape
+        x, y, z = x.ravel(), y.ravel(), z.ravel()
+
+        # Place input coordinates on simplectic honeycomb.
+        stretch_offset = (x+y+z) * STRETCH_CONSTANT_3D
+        xs = x + stretch_offset
+        ys = y + stretch_offset
+        zs = z + stretch_offset
+
+        # Floor to get simplectic honeycomb coordinates of rhombohedron (stretched cube) super-cell origin.
+        xsb = np.floor(xs).astype(np.int64)
+        ysb = np.floor(ys).astype(np.int64)
+        zsb = np.floor(zs).astype(np.int64)
+
+        # Skew out to get actual coordinates of rhombohedron origin.
+        squish_offset = (xsb+ysb+zsb) * SQUISH_CONSTANT_3D
+        xb = xsb + squish_offset
+        yb = ysb + squish_offset
+        zb = zsb + squish_offset
+
+        # Compute simplectic honeycomb coordinates relative to rhombohedral origin.
+        xins = xs - xsb
+        yins = ys - ysb
+        zins = zs - zsb
+        in_sum = xins + yins + zins
+
+        # Positions relative to origin point.
+        dx0 = x - xb
+        dy0 = y - yb
+        dz0 = z - zb
+
+        # The three regions of noise3d add up different contributions, so each
+        # one is evaluated on its own subset of points.
+        value = np.empty(len(x))
+        low = in_sum <= 1
+        high = ~low & (in_sum >= 2)
+        middle = ~low & ~high
+        for region, mask in ((self._noise3d_low, low),
+                             (self._noise3d_high, high), (self._noise3d_middle,
+                                                          middle)):
+            if mask.any():
+                value[mask] = region(xsb[mask], ysb[mask], zsb[mask],
+                                     xins[mask], yins[mask], zins[mask],
+                                     dx0[mask], dy0[mask], dz0[mask])
+
+        return (value / NORM_CONSTANT_3D).reshape(shape)
+
+    def _noise3d_low(self, xsb, ysb, zsb, xins, yins, zins, dx0, dy0, dz0):
+        # We're inside the tetrahedron (3-Simplex) at (0,0,0)
+        in_sum = xins + yins + zins
+
+        # Determine which two of (0,0,1), (0,1,0), (1,0,0) are closest.
+        first = (xins >= yins) & (zins > yins)
+        second = ~first & (xins < yins) & (zins > xins)
+        a_score = np.where(second, zins, xins)
+        a_point = np.where(second, 0x04, 0x01)
+        b_score = np.where(first, zins, yins)
+        b_point = np.where(first, 0x04, 0x02)
+
+        # (0,0,0) is one of the closest two tetrahedral vertices.
+        wins = 1 - in_sum
+        closest = (wins > a_score) | (wins > b_score)
+        c = np.where(b_score > a_score, b_point, a_point)
+        cx, cy, cz = (c & 0x01) == 0, (c & 0x02) == 0, (c & 0x04) == 0
+        xsv_ext0 = np.where(cx, xsb - 1, xsb + 1)
+        xsv_ext1 = np.where(cx, xsb, xsb + 1)
+        dx_ext0 = np.where(cx, dx0 + 1, dx0 - 1)
+        dx_ext1 = np.where(cx, dx0, dx0 - 1)
+        ysv_ext0 = np.select([~cy, cx], [ysb + 1, ysb], ysb - 1)
+        ysv_ext1 = np.select([~cy, cx], [ysb + 1, ysb - 1], ysb)
+        dy_ext0 = np.select([~cy, cx], [dy0 - 1, dy0], dy0 + 1)
+        dy_ext1 = np.select([~cy, cx], [dy0 - 1, dy0 + 1], dy0)
+        zsv_ext0 = np.where(cz, zsb, zsb + 1)
+        zsv_ext1 = np.where(cz, zsb - 1, zsb + 1)
+        dz_ext0 = np.where(cz, dz0, dz0 - 1)
+        dz_ext1 = np.where(cz, dz0 + 1, dz0 - 1)
+
+        # (0,0,0) is not one of the closest two tetrahedral vertices.
+        c = a_point | b_point
+        cx, cy, cz = (c & 0x01) == 0, (c & 0x02) == 0, (c & 0x04) == 0
+        xsv_ext0 = np.where(closest, xsv_ext0, np.where(cx, xsb, xsb + 1))
+        xsv_ext1 = np.where(closest, xsv_ext1, np.where(cx, xsb - 1, xsb + 1))
+        dx_ext0 = np.where(
+            closest, dx_ext0,
+            np.where(cx, dx0 - 2*SQUISH_CONSTANT_3D,
+                     dx0 - 1 - 2*SQUISH_CONSTANT_3D))
+        dx_ext1 = np.where(
+            closest, dx_ext1,
+            np.where(cx, dx0 + 1 - SQUISH_CONSTANT_3D,
+                     dx0 - 1 - SQUISH_CONSTANT_3D))
+        ysv_ext0 = np.where(closest, ysv_ext0, np.where(cy, ysb, ysb + 1))
+        ysv_ext1 = np.where(closest, ysv_ext1, np.where(cy, ysb - 1, ysb + 1))
+        dy_ext0 = np.where(
+            closest, dy_ext0,
+            np.where(cy, dy0 - 2*SQUISH_CONSTANT_3D,
+                     dy0 - 1 - 2*SQUISH_CONSTANT_3D))
+        dy_ext1 = np.where(
+            closest, dy_ext1,
+            np.where(cy, dy0 + 1 - SQUISH_CONSTANT_3D,
+                     dy0 - 1 - SQUISH_CONSTANT_3D))
+        zsv_ext0 = np.where(closest, zsv_ext0, np.where(cz, zsb, zsb + 1))
+        zsv_ext1 = np.where(closest, zsv_ext1, np.where(cz, zsb - 1, zsb + 1))
+        dz_ext0 = np.where(
+            closest, dz_ext0,
+            np.where(cz, dz0 - 2*SQUISH_CONSTANT_3D,
+                     dz0 - 1 - 2*SQUISH_CONSTANT_3D))
+        dz_ext1 = np.where(
+            closest, dz_ext1,
+            np.where(cz, dz0 + 1 - SQUISH_CONSTANT_3D,
+                     dz0 - 1 - SQUISH_CONSTANT_3D))
+
+        contribute = self._contribute3d_array
+        value = np.zeros(len(xsb))
+
+        # Contribution (0,0,0)
+        value = contribute(value, xsb + 0, ysb + 0, zsb + 0, dx0, dy0, dz0)
+
+        # Contribution (1,0,0)
+        dx1 = dx0 - 1 - SQUISH_CONSTANT_3D
+        dy1 = dy0 - 0 - SQUISH_CONSTANT_3D
+        dz1 = dz0 - 0 - SQUISH_CONSTANT_3D
+        value = contribute(value, xsb + 1, ysb + 0, zsb + 0, dx1, dy1, dz1)
+
+        # Contribution (0,1,0)
+        dx2 = dx0 - 0 - SQUISH_CONSTANT_3D
+        dy2 = dy0 - 1 - SQUISH_CONSTANT_3D
+        dz2 = dz1
+        value = contribute(value, xsb + 0, ysb + 1, zsb + 0, dx2, dy2, dz2)
+
+        # Contribution (0,0,1)
+        dx3 = dx2
+        dy3 = dy1
+        dz3 = dz0 - 1 - SQUISH_CONSTANT_3D
+        value = contribute(value, xsb + 0, ysb + 0, zsb + 1, dx3, dy3, dz3)
+
+        # Extra vertices
+        value = contribute(value, xsv_ext0, ysv_ext0, zsv_ext0, dx_ext0,
+                           dy_ext0, dz_ext0)
+        return contribute(value, xsv_ext1, ysv_ext1, zsv_ext1, dx_ext1,
+                          dy_ext1, dz_ext1)
+
+    def _noise3d_high(self, xsb, ysb, zsb, xins, yins, zins, dx0, dy0, dz0):
+        # We're inside the tetrahedron (3-Simplex) at (1,1,1)
+        in_sum = xins + yins + zins
+
+        # Determine which two tetrahedral vertices are the closest, out of (1,1,0), (1,0,1), (0,1,1) but not (1,1,1).
+        first = (xins <= yins) & (zins < yins)
+        second = ~first & (xins > yins) & (zins < xins)
+        a_score = np.where(second, zins, xins)
+        a_point = np.where(second, 0x03, 0x06)
+        b_score = np.where(first, zins, yins)
+        b_point = np.where(first, 0x03, 0x05)
+
+        # (1,1,1) is one of the closest two tetrahedral vertices.
+        wins = 3 - in_sum
+        closest = (wins < a_score) | (wins < b_score)
+        c = np.where(b_score < a_score, b_point, a_point)
+        cx, cy, cz = (c & 0x01) != 0, (c & 0x02) != 0, (c & 0x04) != 0
+        xsv_ext0 = np.where(cx, xsb + 2, xsb)
+        xsv_ext1 = np.where(cx, xsb + 1, xsb)
+        dx_ext0 = np.where(cx, dx0 - 2 - 3*SQUISH_CONSTANT_3D,
+                           dx0 - 3*SQUISH_CONSTANT_3D)
+        dx_ext1 = np.where(cx, dx0 - 1 - 3*SQUISH_CONSTANT_3D,
+                           dx0 - 3*SQUISH_CONSTANT_3D)
+        dy = dy0 - 1 - 3*SQUISH_CONSTANT_3D
+        ysv_ext0 = np.select([~cy, cx], [ysb, ysb + 1], ysb + 1 + 1)
+        ysv_ext1 = np.select([~cy, cx], [ysb, ysb + 1 + 1], ysb + 1)
+        dy_ext0 = np.select([~cy, cx], [dy0 - 3*SQUISH_CONSTANT_3D, dy],
+                            dy - 1)
+        dy_ext1 = np.select([~cy, cx], [dy0 - 3*SQUISH_CONSTANT_3D, dy - 1],
+                            dy)
+        zsv_ext0 = np.where(cz, zsb + 1, zsb)
+        zsv_ext1 = np.where(cz, zsb + 2, zsb)
+        dz_ext0 = np.where(cz, dz0 - 1 - 3*SQUISH_CONSTANT_3D,
+                           dz0 - 3*SQUISH_CONSTANT_3D)
+        dz_ext1 = np.where(cz, dz0 - 2 - 3*SQUISH_CONSTANT_3D,
+                           dz0 - 3*SQUISH_CONSTANT_3D)
+
+        # (1,1,1) is not one of the closest two tetrahedral vertices.
+        c = a_point & b_point
+        cx, cy, cz = (c & 0x01) != 0, (c & 0x02) != 0, (c & 0x04) != 0
+        xsv_ext0 = np.where(closest, xsv_ext0, np.where(cx, xsb + 1, xsb))
+        xsv_ext1 = np.where(closest, xsv_ext1, np.where(cx, xsb + 2, xsb))
+        dx_ext0 = np.where(
+            closest, dx_ext0,
+            np.where(cx, dx0 - 1 - SQUISH_CONSTANT_3D,
+                     dx0 - SQUISH_CONSTANT_3D))
+        dx_ext1 = np.where(
+            closest, dx_ext1,
+            np.where(cx, dx0 - 2 - 2*SQUISH_CONSTANT_3D,
+                     dx0 - 2*SQUISH_CONSTANT_3D))
+        ysv_ext0 = np.where(closest, ysv_ext0, np.where(cy, ysb + 1, ysb))
+        ysv_ext1 = np.where(closest, ysv_ext1, np.where(cy, ysb + 2, ysb))
+        dy_ext0 = np.where(
+            closest, dy_ext0,
+            np.where(cy, dy0 - 1 - SQUISH_CONSTANT_3D,
+                     dy0 - SQUISH_CONSTANT_3D))
+        dy_ext1 = np.where(
+            closest, dy_ext1,
+            np.where(cy, dy0 - 2 - 2*SQUISH_CONSTANT_3D,
+                     dy0 - 2*SQUISH_CONSTANT_3D))
+        zsv_ext0 = np.where(closest, zsv_ext0, np.where(cz, zsb + 1, zsb))
+        zsv_ext1 = np.where(closest, zsv_ext1, np.where(cz, zsb + 2, zsb))
+        dz_ext0 = np.where(
+            closest, dz_ext0,
+            np.where(cz, dz0 - 1 - SQUISH_CONSTANT_3D,
+                     dz0 - SQUISH_CONSTANT_3D))
+        dz_ext1 = np.where(
+            closest, dz_ext1,
+            np.where(cz, dz0 - 2 - 2*SQUISH_CONSTANT_3D,
+                     dz0 - 2*SQUISH_CONSTANT_3D))
+
+        contribute = self._contribute3d_array
+        value = np.zeros(len(xsb))
+
+        # Contribution (1,1,0)
+        dx3 = dx0 - 1 - 2*SQUISH_CONSTANT_3D
+        dy3 = dy0 - 1 - 2*SQUISH_CONSTANT_3D
+        dz3 = dz0 - 0 - 2*SQUISH_CONSTANT_3D
+        value = contribute(value, xsb + 1, ysb + 1, zsb + 0, dx3, dy3, dz3)
+
+        # Contribution (1,0,1)
+        dx2 = dx3
+        dy2 = dy0 - 0 - 2*SQUISH_CONSTANT_3D
+        dz2 = dz0 - 1 - 2*SQUISH_CONSTANT_3D
+        value = contribute(value, xsb + 1, ysb + 0, zsb + 1, dx2, dy2, dz2)
+
+        # Contribution (0,1,1)
+        dx1 = dx0 - 0 - 2*SQUISH_CONSTANT_3D
+        dy1 = dy3
+        dz1 = dz2
+        value = contribute(value, xsb + 0, ysb + 1, zsb + 1, dx1, dy1, dz1)
+
+        # Contribution (1,1,1)
+        dx0 = dx0 - 1 - 3*SQUISH_CONSTANT_3D
+        dy0 = dy0 - 1 - 3*SQUISH_CONSTANT_3D
+        dz0 = dz0 - 1 - 3*SQUISH_CONSTANT_3D
+        value = contribute(value, xsb + 1, ysb + 1, zsb + 1, dx0, dy0, dz0)
+
+        # Extra vertices
+        value = contribute(value, xsv_ext0, ysv_ext0, zsv_ext0, dx_ext0,
+                           dy_ext0, dz_ext0)
+        return contribute(value, xsv_ext1, ysv_ext1, zsv_ext1, dx_ext1,
+                          dy_ext1, dz_ext1)
+
+    def _noise3d_middle(self, xsb, ysb, zsb, xins, yins, zins, dx0, dy0, dz0):
+        # We're inside the octahedron (Rectified 3-Simplex) in between.
+        # Decide between point (0,0,1) and (1,1,0) as closest
+        p1 = xins + yins
+        a_far = p1 > 1
+        a_score = np.where(a_far, p1 - 1, 1 - p1)
+        a_point = np.where(a_far, 0x03, 0x04)
+
+        # Decide between point (0,1,0) and (1,0,1) as closest
+        p2 = xins + zins
+        b_far = p2 > 1
+        b_score = np.where(b_far, p2 - 1, 1 - p2)
+        b_point = np.where(b_far, 0x05, 0x02)
+
+        # The closest out of the two (1,0,0) and (0,1,1) will replace the furthest out of the two decided above, if closer.
+        p3 = yins + zins
+        far = p3 > 1
+        score = np.where(far, p3 - 1, 1 - p3)
+        replace_a = (a_score <= b_score) & (a_score < score)
+        replace_b = ~replace_a & (a_score > b_score) & (b_score < score)
+        a_point = np.where(replace_a, np.where(far, 0x06, 0x01), a_point)
+        a_far = np.where(replace_a, far, a_far)
+        b_point = np.where(replace_b, np.where(far, 0x06, 0x01), b_point)
+        b_far = np.where(replace_b, far, b_far)
+
+        # Where each of the two closest points are determines how the extra two vertices are calculated.
+        same_far = (a_far == b_far) & a_far
+        same_near = (a_far == b_far) & ~a_far
+
+        # Both closest points on (1,1,1) side : the extra points are (1,1,1)
+        # and one based on the shared axis
+        c = a_point & b_point
+        cx, cy = (c & 0x01) != 0, (c & 0x02) != 0
+        far_x1 = np.select(
+            [cx, cy],
+            [dx0 - 2 - 2*SQUISH_CONSTANT_3D, dx0 - 2*SQUISH_CONSTANT_3D],
+            dx0 - 2*SQUISH_CONSTANT_3D)
+        far_y1 = np.select(
+            [cx, cy],
+            [dy0 - 2*SQUISH_CONSTANT_3D, dy0 - 2 - 2*SQUISH_CONSTANT_3D],
+            dy0 - 2*SQUISH_CONSTANT_3D)
+        far_z1 = np.select(
+            [cx, cy], [dz0 - 2*SQUISH_CONSTANT_3D, dz0 - 2*SQUISH_CONSTANT_3D],
+            dz0 - 2 - 2*SQUISH_CONSTANT_3D)
+        far_xsv1 = np.select([cx, cy], [xsb + 2, xsb], xsb)
+        far_ysv1 = np.select([cx, cy], [ysb, ysb + 2], ysb)
+        far_zsv1 = np.select([cx, cy], [zsb, zsb], zsb + 2)
+
+        # Both closest points on (0,0,0) side : the extra points are (0,0,0)
+        # and one based on the omitted axis
+        near = self._permutation_11m1(a_point | b_point, xsb, ysb, zsb, dx0,
+                                      dy0, dz0)
+
+        # One point on each side : one extra point is a permutation of
+        # (1,1,-1), the other one a permutation of (0,0,2)
+        c1 = np.where(a_far, a_point, b_point)
+        c2 = np.where(a_far, b_point, a_point)
+        mixed = self._permutation_11m1(c1, xsb, ysb, zsb, dx0, dy0, dz0)
+        cx, cy = (c2 & 0x01) != 0, (c2 & 0x02) != 0
+        conds = [cx, cy]
+        dx = dx0 - 2*SQUISH_CONSTANT_3D
+        dy = dy0 - 2*SQUISH_CONSTANT_3D
+        dz = dz0 - 2*SQUISH_CONSTANT_3D
+        mixed_x1 = np.select(conds, [dx - 2, dx], dx)
+        mixed_y1 = np.select(conds, [dy, dy - 2], dy)
+        mixed_z1 = np.select(conds, [dz, dz], dz - 2)
+        mixed_xsv1 = np.select(conds, [xsb + 2, xsb], xsb)
+        mixed_ysv1 = np.select(conds, [ysb, ysb + 2], ysb)
+        mixed_zsv1 = np.select(conds, [zsb, zsb], zsb + 2)
+
+        conds = [same_far, same_near]
+        dx_ext0 = np.select(conds, [dx0 - 1 - 3*SQUISH_CONSTANT_3D, dx0],
+                            mixed[3])
+        dy_ext0 = np.select(conds, [dy0 - 1 - 3*SQUISH_CONSTANT_3D, dy0],
+                            mixed[4])
+        dz_ext0 = np.select(conds, [dz0 - 1 - 3*SQUISH_CONSTANT_3D, dz0],
+                            mixed[5])
+        xsv_ext0 = np.select(conds, [xsb + 1, xsb], mixed[0])
+        ysv_ext0 = np.select(conds, [ysb + 1, ysb], mixed[1])
+        zsv_ext0 = np.select(conds, [zsb + 1, zsb], mixed[2])
+        dx_ext1 = np.select(conds, [far_x1, near[3]], mixed_x1)
+        dy_ext1 = np.select(conds, [far_y1, near[4]], mixed_y1)
+        dz_ext1 = np.select(conds, [far_z1, near[5]], mixed_z1)
+        xsv_ext1 = np.select(conds, [far_xsv1, near[0]], mixed_xsv1)
+        ysv_ext1 = np.select(conds, [far_ysv1, near[1]], mixed_ysv1)
+        zsv_ext1 = np.select(conds, [far_zsv1, near[2]], mixed_zsv1)
+
+        contribute = self._contribute3d_array
+        value = np.zeros(len(xsb))
+
+        # Contribution (1,0,0)
+        dx1 = dx0 - 1 - SQUISH_CONSTANT_3D
+        dy1 = dy0 - 0 - SQUISH_CONSTANT_3D
+        dz1 = dz0 - 0 - SQUISH_CONSTANT_3D
+        value = contribute(value, xsb + 1, ysb + 0, zsb + 0, dx1, dy1, dz1)
+
+        # Contribution (0,1,0)
+        dx2 = dx0 - 0 - SQUISH_CONSTANT_3D
+        dy2 = dy0 - 1 - SQUISH_CONSTANT_3D
+        dz2 = dz1
+        value = contribute(value, xsb + 0, ysb + 1, zsb + 0, dx2, dy2, dz2)
+
+        # Contribution (0,0,1)
+        dx3 = dx2
+        dy3 = dy1
+        dz3 = dz0 - 1 - SQUISH_CONSTANT_3D
+        value = contribute(value, xsb + 0, ysb + 0, zsb + 1, dx3, dy3, dz3)
+
+        # Contribution (1,1,0)
+        dx4 = dx0 - 1 - 2*SQUISH_CONSTANT_3D
+        dy4 = dy0 - 1 - 2*SQUISH_CONSTANT_3D
+        dz4 = dz0 - 0 - 2*SQUISH_CONSTANT_3D
+        value = contribute(value, xsb + 1, ysb + 1, zsb + 0, dx4, dy4, dz4)
+
+        # Contribution (1,0,1)
+        dx5 = dx4
+        dy5 = dy0 - 0 - 2*SQUISH_CONSTANT_3D
+        dz5 = dz0 - 1 - 2*SQUISH_CONSTANT_3D
+        value = contribute(value, xsb + 1, ysb + 0, zsb + 1, dx5, dy5, dz5)
+
+        # Contribution (0,1,1)
+        dx6 = dx0 - 0 - 2*SQUISH_CONSTANT_3D
+        dy6 = dy4
+        dz6 = dz5
+        value = contribute(value, xsb + 0, ysb + 1, zsb + 1, dx6, dy6, dz6)
+
+        # Extra vertices
+        value = contribute(value, xsv_ext0, ysv_ext0, zsv_ext0, dx_ext0,
+                           dy_ext0, dz_ext0)
+        return contribute(value, xsv_ext1, ysv_ext1, zsv_ext1, dx_ext1,
+                          dy_ext1, dz_ext1)
+
+    @staticmethod
+    def _permutation_11m1(c, xsb, ysb, zsb, dx0, dy0, dz0):
+        # The permutation of (1,1,-1) with -1 on the first axis missing from c
+        # (see the octahedron region of noise3d)
+        conds = [(c & 0x01) == 0, (c & 0x02) == 0]
+        return (
+            np.select(conds, [xsb - 1, xsb + 1], xsb + 1),
+            np.select(conds, [ysb + 1, ysb - 1], ysb + 1),
+            np.select(conds, [zsb + 1, zsb + 1], zsb - 1),
+            np.select(
+                conds,
+                [dx0 + 1 - SQUISH_CONSTANT_3D, dx0 - 1 - SQUISH_CONSTANT_3D],
+                dx0 - 1 - SQUISH_CONSTANT_3D),
+            np.select(
+                conds,
+                [dy0 - 1 - SQUISH_CONSTANT_3D, dy0 + 1 - SQUISH_CONSTANT_3D],
+                dy0 - 1 - SQUISH_CONSTANT_3D),
+            np.select(
+                conds,
+                [dz0 - 1 - SQUISH_CONSTANT_3D, dz0 - 1 - SQUISH_CONSTANT_3D],
+                dz0 + 1 - SQUISH_CONSTANT_3D),
+        )
+
+    def noise4d_array(self, x: np.ndarray, y: np.ndarray, z: np.ndarray,
+                      w: np.ndarray) -> np.ndarray:
+        """
+        4D open simplex noise over arrays\\
+        gives exactly the same values as ``noise4d`` on each point
+
+        Parameters
+        ----------
+            x : np.ndarray
+                the x-components of the points to evaluate
+            y : np.ndarray
+                the y-components of the points to evaluate
+            z : np.ndarray
+                the z-components of the points to evaluate
+            w : np.ndarray
+                the w-components of the points to evaluate\\
+                x, y, z and w are broadcast against each other
+
+        Returns
+        -------
+            np.ndarray : open simplex 4D between -1 and 1, with the broadcast shape
+        """
+        x, y, z, w = np.broadcast_arrays(np.asarray(x, dtype=np.float64),
+                                         np.asarray(y, dtype=np.float64),
+                                         np.asarray(z, dtype=np.float64),
+                                         np.asarray(w, dtype=np.float64))
+        shape = x.shape
+        x, y, z, w = x.ravel(), y.ravel(), z.ravel(), w.ravel()
+
+        # Place input coordinates on simplectic honeycomb.
+        stretch_offset = (x+y+z+w) * STRETCH_CONSTANT_4D
+        xs = x + stretch_offset
+        ys = y + stretch_offset
+        zs = z + stretch_offset
+        ws = w + stretch_offset
+
+        # Floor to get simplectic honeycomb coordinates of rhombo-hypercube super-cell origin.
+        xsb = np.floor(xs).astype(np.int64)
+        ysb = np.floor(ys).astype(np.int64)
+        zsb = np.floor(zs).astype(np.int64)
+        wsb = np.floor(ws).astype(np.int64)
+
+        # Skew out to get actual coordinates of stretched rhombo-hypercube origin.
+        squish_offset = (xsb+ysb+zsb+wsb) * SQUISH_CONSTANT_4D
+        xb = xsb + squish_offset
+        yb = ysb + squish_offset
+        zb = zsb + squish_offset
+        wb = wsb + squish_offset
+
+        # Compute simplectic honeycomb coordinates relative to rhombo-hypercube origin.
+        xins = xs - xsb
+        yins = ys - ysb
+        zins = zs - zsb
+        wins = ws - wsb
+        in_sum = xins + yins + zins + wins
+
+        # Positions relative to origin point.
+        dx0 = x - xb
+        dy0 = y - yb
+        dz0 = z - zb
+        dw0 = w - wb
+
+        # Same as noise3d_array, one subset of points per region of noise4d.
+        value = np.empty(len(x))
+        low = in_sum <= 1
+        high = ~low & (in_sum >= 3)
+        first = ~low & ~high & (in_sum <= 2)
+        second = ~low & ~high & ~first
+        for region, mask in ((self._noise4d_low,
+                              low), (self._noise4d_high,
+                                     high), (self._noise4d_first, first),
+                             (self._noise4d_second, second)):
+            if mask.any():
+                value[mask] = region(xins[mask], yins[mask], zins[mask],
+                                     wins[mask], xsb[mask], ysb[mask],
+                                     zsb[mask], wsb[mask], dx0[mask],
+                                     dy0[mask], dz0[mask], dw0[mask])
+
+        return (value / NORM_CONSTANT_4D).reshape(shape)
+
+    def _noise4d_low(self, xins, yins, zins, wins, *base):
+        # We're inside the pentachoron (4-Simplex) at (0,0,0,0)
+        in_sum = xins + yins + zins + wins
+
+        # Determine which two of (0,0,0,1), (0,0,1,0), (0,1,0,0), (1,0,0,0) are closest.
+        a_po = np.full(len(xins), 0x01)
+        b_po = np.full(len(xins), 0x02)
+        a_score, a_po, b_score, b_po, _, _ = self._closer4d(
+            np.greater, xins, a_po, yins, b_po, zins, 0x04)
+        a_score, a_po, b_score, b_po, _, _ = self._closer4d(
+            np.greater, a_score, a_po, b_score, b_po, wins, 0x08)
+
+        # (0,0,0,0) is one of the closest two pentachoron vertices or not.
+        uins = 1 - in_sum
+        closest = (uins > a_score) | (uins > b_score)
+        near = np.where(b_score > a_score, b_po, a_po)
+        far = a_po | b_po
+
+        value = self._lattice4d_array(
+            ((0, 0, 0, 0), (1, 0, 0, 0), (0, 1, 0, 0), (0, 0, 1, 0),
+             (0, 0, 0, 1)), *base)
+        cases = ((closest, self._extra4d_near_origin, (near, )),
+                 (~closest, self._extra4d_far_origin, (far, )))
+        return self._extra4d_array(value, cases, *base)
+
+    def _noise4d_high(self, xins, yins, zins, wins, *base):
+        # We're inside the pentachoron (4-Simplex) at (1,1,1,1)
+        in_sum = xins + yins + zins + wins
+
+        # Determine which two of (1,1,1,0), (1,1,0,1), (1,0,1,1), (0,1,1,1) are closest.
+        a_po = np.full(len(xins), 0x0E)
+        b_po = np.full(len(xins), 0x0D)
+        a_score, a_po, b_score, b_po, _, _ = self._closer4d(
+            np.less, xins, a_po, yins, b_po, zins, 0x0B)
+        a_score, a_po, b_score, b_po, _, _ = self._closer4d(
+            np.less, a_score, a_po, b_score, b_po, wins, 0x07)
+
+        # (1,1,1,1) is one of the closest two pentachoron vertices or not.
+        uins = 4 - in_sum
+        closest = (uins < a_score) | (uins < b_score)
+        near = np.where(b_score < a_score, b_po, a_po)
+        far = a_po & b_po
+
+        value = self._lattice4d_array(
+            ((1, 1, 1, 0), (1, 1, 0, 1), (1, 0, 1, 1), (0, 1, 1, 1),
+             (1, 1, 1, 1)), *base)
+        cases = ((closest, self._extra4d_near_corner, (near, )),
+                 (~closest, self._extra4d_far_corner, (far, )))
+        return self._extra4d_array(value, cases, *base)
+
+    def _noise4d_first(self, xins, yins, zins, wins, *base):
+        # We're inside the first dispentachoron (Rectified 4-Simplex)
+        in_sum = xins + yins + zins + wins
+        a_po, b_po, a_bigger, b_bigger = self._dispentachoron4d(
+            np.greater, xins, yins, zins, wins, 2 - in_sum,
+            (0x03, 0x0C, 0x05, 0x0A, 0x09, 0x06, 0x01, 0x02, 0x04, 0x08))
+
+        # Where each of the two closest points are determines how the extra three vertices are calculated.
+        bigger = a_bigger & b_bigger
+        smaller = ~a_bigger & ~b_bigger
+        mixed = a_bigger != b_bigger
+        big_po = np.where(a_bigger, a_po, b_po)
+        small_po = np.where(a_bigger, b_po, a_po)
+
+        value = self._lattice4d_array(
+            ((1, 0, 0, 0), (0, 1, 0, 0), (0, 0, 1, 0), (0, 0, 0, 1),
+             (1, 1, 0, 0), (1, 0, 1, 0), (1, 0, 0, 1), (0, 1, 1, 0),
+             (0, 1, 0, 1), (0, 0, 1, 1)), *base)
+        return self._extra4d_array(
+            value,
+            ((bigger, self._extra4d_first_bigger, (a_po | b_po, a_po & b_po)),
+             (smaller, self._extra4d_first_smaller, (a_po | b_po, )),
+             (mixed, self._extra4d_first_mixed, (big_po, small_po))), *base)
+
+    def _noise4d_second(self, xins, yins, zins, wins, *base):
+        # We're inside the second dispentachoron (Rectified 4-Simplex)
+        in_sum = xins + yins + zins + wins
+        a_po, b_po, a_bigger, b_bigger = self._dispentachoron4d(
+            np.less, xins, yins, zins, wins, 3 - in_sum,
+            (0x0C, 0x03, 0x0A, 0x05, 0x06, 0x09, 0x0E, 0x0D, 0x0B, 0x07))
+
+        # Where each of the two closest points are determines how the extra three vertices are calculated.
+        bigger = a_bigger & b_bigger
+        smaller = ~a_bigger & ~b_bigger
+        mixed = a_bigger != b_bigger
+        big_po = np.where(a_bigger, a_po, b_po)
+        small_po = np.where(a_bigger, b_po, a_po)
+
+        value = self._lattice4d_array(
+            ((1, 1, 1, 0), (1, 1, 0, 1), (1, 0, 1, 1), (0, 1, 1, 1),
+             (1, 1, 0, 0), (1, 0, 1, 0), (1, 0, 0, 1), (0, 1, 1, 0),
+             (0, 1, 0, 1), (0, 0, 1, 1)), *base)
+        return self._extra4d_array(
+            value,
+            ((bigger, self._extra4d_second_bigger, (a_po & b_po, a_po | b_po)),
+             (smaller, self._extra4d_second_smaller, (a_po & b_po, )),
+             (mixed, self._extra4d_second_mixed, (big_po, small_po))), *base)
+
+    @staticmethod
+    def _closer4d(closer, a_score, a_po, b_score, b_po, score, po):
+        # Replaces the further of a and b by po where score is closer than it
+        b_further = ~closer(b_score, a_score)
+        to_a = ~b_further & closer(score, a_score)
+        to_b = b_further & closer(score, b_score)
+        a_score = np.where(to_a, score, a_score)
+        a_po = np.where(to_a, po, a_po)
+        b_score = np.where(to_b, score, b_score)
+        b_po = np.where(to_b, po, b_po)
+        return a_score, a_po, b_score, b_po, to_a, to_b
+
+    def _dispentachoron4d(self, closer, xins, yins, zins, wins, offset,
+                          points):
+        # The two closest points of a dispentachoron (see noise4d), the points
+        # being ordered as they are compared there, and whether they are on
+        # the bigger side
+        xy_zw, xz_yw, xw_yz, p1, p2, p3, p4 = (points[0:2], points[2:4],
+                                               points[4:6], *points[6:])
+
+        # Decide between (1,1,0,0) and (0,0,1,1)
+        first = closer(xins + yins, zins + wins)
+        a_score = np.where(first, xins + yins, zins + wins)
+        a_po = np.where(first, *xy_zw)
+
+        # Decide between (1,0,1,0) and (0,1,0,1)
+        first = closer(xins + zins, yins + wins)
+        b_score = np.where(first, xins + zins, yins + wins)
+        b_po = np.where(first, *xz_yw)
+
+        # Closer between (1,0,0,1) and (0,1,1,0) will replace the further of a and b, if closer.
+        first = closer(xins + wins, yins + zins)
+        a_score, a_po, b_score, b_po, _, _ = self._closer4d(
+            closer, a_score, a_po, b_score, b_po,
+            np.where(first, xins + wins, yins + zins), np.where(first, *xw_yz))
+
+        # Decide if each single point (or its complement) is closer.
+        a_bigger = b_bigger = np.full(len(xins), True)
+        for ins, po in ((xins, p1), (yins, p2), (zins, p3), (wins, p4)):
+            a_score, a_po, b_score, b_po, to_a, to_b = self._closer4d(
+                closer, a_score, a_po, b_score, b_po, offset + ins, po)
+            a_bigger = a_bigger & ~to_a
+            b_bigger = b_bigger & ~to_b
+
+        return a_po, b_po, a_bigger, b_bigger
+
+    def _lattice4d_array(self, points, xsb, ysb, zsb, wsb, dx0, dy0, dz0, dw0):
+        # Adds up the contributions of the lattice points, in the given order
+        value = np.zeros(len(xsb))
+        for i, j, k, l in points:
+            squish = (i+j+k+l) * SQUISH_CONSTANT_4D
+            value = self._contribute4d_array(value, xsb + i, ysb + j, zsb + k,
+                                             wsb + l, dx0 - i - squish,
+                                             dy0 - j - squish,
+                                             dz0 - k - squish,
+                                             dw0 - l - squish)
+        return value
+
+    def _extra4d_array(self, value, cases, *base):
+        # Adds up the contributions of the extra vertices, each case being a
+        # mask of points, the helper computing their extra vertices and the
+        # closest points this helper branches on. The helper is run once per
+        # group of points sharing the same closest points.
+        vertices = [[np.empty(len(value), dtype=b.dtype) for _ in range(3)]
+                    for b in base]
+        for mask, extra, closest in cases:
+            key = sum(c << 4 * i for i, c in enumerate(closest))
+            for k in np.unique(key[mask]):
+                index = np.flatnonzero(mask & (key == k))
+                found = extra(*(int(c[index[0]]) for c in closest),
+                              *(b[index] for b in base))
+                for axis, triple in zip(vertices, found):
+                    for vertex, v in zip(axis, triple):
+                        vertex[index] = v
+
+        for vertex in zip(*vertices):
+            value = self._contribute4d_array(value, *vertex)
+        return value
@@ -1,9 +1,13 @@
 import math
 import random
+from collections import OrderedDict
 from itertools import product
+import numpy as np
 
 __all__ = ["PerlinNoise"]
 
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
 
 def quintic(t: float) -> float:
     """
@@ -20,6 +24,31 @@ def lerp(t: float, a: float, b: float) -> float:
     return a + t * (b-a)
 
 
+def mix(h: int) -> int:
+    """
+    64 bits finalizer of MurmurHash3, every bit of h has an effect on the
+    low byte of the result, used to hash whole lattice coordinates
+    """
+    h ^= h >> 33
+    h = (h * 0xFF51AFD7ED558CCD) & _MASK64
+    h ^= h >> 33
+    h = (h * 0xC4CEB9FE1A85EC53) & _MASK64
+    return h ^ (h >> 33)
+
+
+def mix_array(h: np.ndarray) -> np.ndarray:
+    """
+    Same as mix for an array of np.uint64, products wrap around 2**64
+    """
+    shift = np.uint64(33)
+    with np.errstate(over="ignore"):
+        h = h ^ (h >> shift)
+        h = h * np.uint64(0xFF51AFD7ED558CCD)
+        h = h ^ (h >> shift)
+        h = h * np.uint64(0xC4CEB9FE1A85EC53)
+    return h ^ (h >> shift)
+
+
 class PerlinNoise:
     """
     Perlin Noise
@@ -32,14 +61,23 @@ class PerlinNoise:
     arbitrary number of dimensions.  The underlying grid is aligned with the
     integers.
 
-    There is no limit to the coordinates used, new gradients are generated on
-    the fly as necessary.
+    Gradients are looked up in a fixed table of 256 random gradients, hashed
+    from every bit of the lattice coordinates (so the noise does not repeat
+    every 256 units), memory does not grow with the visited area and a given
+    ``seed`` always gives the same noise. Setting ``cache_size`` instead draws
+    a new random gradient for each lattice point, keeping only the most
+    recently used ones.
+
+    Whole arrays of points can be evaluated at once with ``grid`` and ``eval``,
+    giving the same values as calling the noise on each point.
     """
     def __init__(self,
                  dimension: int,
                  octaves: int = 1,
                  tile: tuple[int] = (),
-                 unbias: bool = False) -> None:
+                 unbias: bool = False,
+                 seed: int = None,
+                 cache_size: int = None) -> None:
         """
         Create a new Perlin noise factory in the given number of dimensions,
         which should be an integer and at least 1.
@@ -74,6 +112,13 @@ class PerlinNoise:
                 apply quintic function (based on octaves) and tiles before output
                 depending on rather or not you rely on frames, you might want let it False
                 defaults to False
+            seed : int, (optional)
+                seed of the gradients, uses the global ``random`` module if None
+                defaults to None
+            cache_size : int, (optional)
+                if given, draws a random gradient per lattice point and keeps the
+                last ``cache_size`` ones (evicted points get new gradients if visited again)
+                defaults to None
         """
         self.dimension = dimension
         self.octaves = octaves
@@ -84,7 +129,20 @@ class PerlinNoise:
         # by this to scale to ±1
         self.scale_factor = 2 * dimension**-0.5
 
-        self.gradient = {}
+        self.seed = seed
+        self._random = random if seed is None else random.Random(seed)
+
+        # per lattice point gradients, only used with a cache size
+        self.cache_size = cache_size
+        self.gradient: OrderedDict[tuple[int], tuple[float]] = OrderedDict()
+
+        # fixed gradient table and permutation, as lists for single points
+        # and as arrays (one row per axis for the gradients) for arrays
+        self._grads = [self._generate_gradient() for _ in range(256)]
+        self._perm_list = list(range(256))
+        self._random.shuffle(self._perm_list)
+        self._grad_table = np.array(self._grads).T.copy()
+        self._perm = np.array(self._perm_list, dtype=np.intp)
 
     def _generate_gradient(self) -> tuple[float]:
         # Generate a random unit vector at each grid point -- this is the
@@ -93,17 +151,40 @@ class PerlinNoise:
         # 1 dimension is special, since the only unit vector is trivial;
         # instead, use a slope between -1 and 1
         if self.dimension == 1:
-            return (random.uniform(-1, 1), )
+            return (self._random.uniform(-1, 1), )
 
         # Generate a random point on the surface of the unit n-hypersphere;
         # this is the same as a random unit vector in n dimensions. Thanks
         # to: http://mathworld.wolfram.com/SpherePointPicking.html
         # Pick n normal random variables with stddev 1
-        random_point = [random.gauss(0, 1) for _ in range(self.dimension)]
+        random_point = [
+            self._random.gauss(0, 1) for _ in range(self.dimension)
+        ]
         # Then scale the result to a unit vector
         scale = sum(n * n for n in random_point)**-0.5
         return tuple(coord * scale for coord in random_point)
 
+    def _get_gradient(self, grid_point: tuple[int]) -> tuple[float]:
+        """
+        Gradient of a lattice point, from the hashed table or the cache.
+        """
+        if self.cache_size is None:
+            perm = self._perm_list
+            h = 0
+            for coord in grid_point:
+                h = perm[(h + (mix(coord & _MASK64) & 255)) & 255]
+            return self._grads[h]
+
+        gradient = self.gradient
+        try:
+            gradient.move_to_end(grid_point)
+            return gradient[grid_point]
+        except KeyError:
+            gradient[grid_point] = g = self._generate_gradient()
+            if len(gradient) > self.cache_size:
+                gradient.popitem(last=False)
+            return g
+
     def get_plain_noise(self, *point: float) -> float:
         """
         Get plain noise for a single point, without taking into account
@@ -112,7 +193,13 @@ class PerlinNoise:
         if len(point) != self.dimension:
             raise ValueError(
                 f"Expected {self.dimension} values, got {len(point)}")
+        return self._plain_noise(point, self.tile)
 
+    def _plain_noise(self, point: tuple[float], tile: tuple[int]) -> float:
+        """
+        Plain noise for a single point, lattice coordinates wrap around
+        ``tile`` on the axes where it is not 0.
+        """
         # Build a list of the (min, max) bounds in each dimension
         grid_coords = []
         for coord in point:
@@ -125,9 +212,8 @@ class PerlinNoise:
         # gradient's "influence" on the chosen point.
         dots = []
         for grid_point in product(*grid_coords):
-            if grid_point not in self.gradient:
-                self.gradient[grid_point] = self._generate_gradient()
-            gradient = self.gradient[grid_point]
+            gradient = self._get_gradient(
+                tuple(c % t if t else c for c, t in zip(grid_point, tile)))
 
             dot = 0
             for i in range(self.dimension):
@@ -146,12 +232,7 @@ class PerlinNoise:
         while len(dots) > 1:
             dim -= 1
             s = quintic(point[dim] - grid_coords[dim][0])
-
-            next_dots = []
-            while dots:
-                next_dots.append(lerp(s, dots.pop(0), dots.pop(0)))
-
-            dots = next_dots
+            dots = [lerp(s, a, b) for a, b in zip(dots[0::2], dots[1::2])]
 
         return dots[0] * self.scale_factor
 
@@ -162,16 +243,22 @@ class PerlinNoise:
 
         Result float is between -1. and 1.
         """
+        if len(point) != self.dimension:
+            raise ValueError(
+                f"Expected {self.dimension} values, got {len(point)}")
+
         noise = 0
         for o in range(self.octaves):
             o2 = 1 << o
             new_point = []
+            tile = []
             for i, coord in enumerate(point):
                 coord *= o2
                 if self.tile[i]:
                     coord %= self.tile[i] * o2
                 new_point.append(coord)
-            noise += self.get_plain_noise(*new_point) / o2
+                tile.append(self.tile[i] * o2)
+            noise += self._plain_noise(new_point, tile) / o2
 
         # Need to scale n back down since adding all those extra octaves has
         # probably expanded it beyond ±1
@@ -193,3 +280,148 @@ class PerlinNoise:
             noise = r*2 - 1
 
         return noise
+
+    def _plain_noise_array(self, coords: list[np.ndarray],
+                           tile: tuple[int]) -> np.ndarray:
+        """
+        Plain noise for one array of coordinates per dimension, broadcast
+        against each other. Lattice coordinates wrap around ``tile`` on the
+        axes where it is not 0. Same operations as ``_plain_noise``.
+        """
+        lattice = []
+        offsets = []
+        smooth = []
+        for coord, t in zip(coords, tile):
+            floor = np.floor(coord)
+            low = floor.astype(np.intp)
+            high = low + 1
+            if t:
+                low, high = low % t, high % t
+            lattice.append((low, high))
+            offsets.append((coord - floor, coord - (floor+1)))
+            smooth.append(quintic(coord - floor))
+
+        # gradients of each corner, in the same order as product() in
+        # _plain_noise
+        if self.cache_size is None:
+            # Hash each corner by successive permutation lookups, one axis at
+            # a time, so corners sharing the first axes share the first
+            # lookups. Only the coordinates themselves are mixed.
+            perm = self._perm
+            byte = np.uint64(255)
+            hashes = [np.intp(0)]
+            for low, high in lattice:
+                low, high = ((mix_array(c.astype(np.uint64)) & byte).astype(
+                    np.intp) for c in (low, high))
+                hashes = [
+                    perm[(h + c) & 255] for h in hashes for c in (low, high)
+                ]
+            gradients = [[g[h] for g in self._grad_table] for h in hashes]
+        else:
+            gradients = [
+                self._get_gradient_array(corner)
+                for corner in product(*lattice)
+            ]
+
+        dots = []
+        for gradient, corner in zip(gradients,
+                                    product((0, 1), repeat=self.dimension)):
+            dot = 0
+            for i, c in enumerate(corner):
+                dot = dot + gradient[i] * offsets[i][c]
+            dots.append(dot)
+
+        # collapse the last dimension first, interpolating adjacent pairs
+        for s in reversed(smooth):
+            dots = [a + s * (b-a) for a, b in zip(dots[0::2], dots[1::2])]
+
+        return dots[0] * self.scale_factor
+
+    def _get_gradient_array(self,
+                            corner: tuple[np.ndarray]) -> list[np.ndarray]:
+        """
+        Gradients from the cache for one array of lattice coordinates per
+        dimension, each unique lattice point is only looked up once.
+        """
+        corner = np.broadcast_arrays(*corner)
+        points = np.stack([c.ravel() for c in corner], axis=-1)
+        unique, inverse = np.unique(points, axis=0, return_inverse=True)
+        table = np.array(
+            [self._get_gradient(tuple(p)) for p in unique.tolist()])
+        return [g[inverse.ravel()].reshape(corner[0].shape) for g in table.T]
+
+    def _octaves_array(self, coords: list[np.ndarray]) -> np.ndarray:
+        """
+        Octaves, tiling and unbias on top of ``_plain_noise_array``, same
+        operations as ``__call__``.
+        """
+        noise = 0
+        for o in range(self.octaves):
+            o2 = 1 << o
+            tile = tuple(t * o2 for t in self.tile[:self.dimension])
+            new_coords = []
+            for coord, t in zip(coords, tile):
+                coord = coord * o2
+                if t:
+                    coord = coord % t
+                new_coords.append(coord)
+            noise = noise + self._plain_noise_array(new_coords, tile) / o2
+
+        noise /= 2 - 2**(1 - self.octaves)
+
+        if self.unbias:
+            r = (noise+1) / 2
+            for _ in range(int(self.octaves / 2 + 0.5)):
+                r = quintic(r)
+            noise = r*2 - 1
+
+        return noise
+
+    def eval(self, points: np.ndarray) -> np.ndarray:
+        """
+        Get the value of this Perlin noise function at each of the given points,
+        taking into account octaves, tiling and unbias.
+
+        Parameters
+        ----------
+            points : np.ndarray
+                array of shape (..., dimension), or any shape in dimension 1
+
+        Returns
+        -------
+            np.ndarray : array of shape (...) of floats between -1. and 1.
+        """
+        points = np.asarray(points, dtype=np.float64)
+        if self.dimension == 1 and (points.ndim == 0 or points.shape[-1] != 1):
+            points = points[..., np.newaxis]
+        if points.shape[-1] != self.dimension:
+            raise ValueError(
+                f"Expected {self.dimension} values, got {points.shape[-1]}")
+        return self._octaves_array(
+            [points[..., i] for i in range(self.dimension)])
+
+    def grid(self, *axes: np.ndarray) -> np.ndarray:
+        """
+        Get the value of this Perlin noise function on the grid spanned by one
+        array of coordinates per dimension. Cheaper than ``eval`` on the whole
+        grid since the lattice is only located once per coordinate.
+
+        Parameters
+        ----------
+            axes : np.ndarray
+                one 1D array of coordinates per dimension
+
+        Returns
+        -------
+            np.ndarray : array of shape (len(axes[0]), len(axes[1]), ...)
+                where ``result[i, j] == noise(axes[0][i], axes[1][j])``
+        """
+        if len(axes) != self.dimension:
+            raise ValueError(
+                f"Expected {self.dimension} axes, got {len(axes)}")
+        coords = []
+        for i, axis in enumerate(axes):
+            shape = [1] * self.dimension
+            shape[i] = -1
+            coords.append(np.asarray(axis, dtype=np.float64).reshape(shape))
+        return self._octaves_array(coords)
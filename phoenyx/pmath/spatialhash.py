@@ -0,0 +1,367 @@
+import math as m
+from typing import Union
+import numpy as np
+
+__all__ = ["SpatialHash"]
+
+from .vector import Vector
+
+
+def _cell_keys(cx: np.ndarray, cy: np.ndarray) -> np.ndarray:
+    """
+    packs integer cell coordinates into a single int64 key per cell
+    """
+    return (cx.astype(np.int64) << 32) + (cy.astype(np.int64) + (1 << 31))
+
+
+class SpatialHash:
+    """
+    Spatial Hash
+    ============
+    Uniform grid index over 2D points for neighbor queries.
+     * points are inserted in bulk and get integer ids, which stay valid until removed
+     * points can be moved and removed, only the ones changing cell touch the grid
+     * radius, k-nearest and all-pairs queries return numpy arrays of ids
+
+    The grid works best when ``cell_size`` is about the usual query radius. Ids of
+    removed points are reused by later insertions.
+
+    Examples
+    --------
+    >>> grid = SpatialHash(20)
+    >>> ids = grid.insert(np.random.random((1000, 2)) * 600)
+    >>> grid.query_radius((300, 300), 50)
+    ... # ids of the points at most 50 away from (300, 300)
+    >>> grid.pairs(10)
+    ... # (M, 2) array of ids of the points at most 10 away from each other
+    """
+    def __init__(self, cell_size: float, points: np.ndarray = None) -> None:
+        """
+        new SpatialHash instance
+
+        Parameters
+        ----------
+            cell_size : float
+                width and height of the grid cells
+            points : np.ndarray, (optional)
+                (N, 2) array-like of points inserted right away, with ids 0 to N - 1
+                defaults to None
+        """
+        if cell_size <= 0:
+            raise ValueError(f"cell size must be positive, got {cell_size}")
+        self.cell_size = float(cell_size)
+
+        self._points = np.empty((0, 2), dtype=np.float64)
+        self._keys = np.empty(0, dtype=np.int64)
+        self._alive = np.empty(0, dtype=bool)
+        self._free: list[int] = []
+        self._cells: dict[int, set[int]] = {}
+
+        if points is not None:
+            self.insert(points)
+
+    @staticmethod
+    def _as_points(points: np.ndarray) -> np.ndarray:
+        """
+        Converts an array-like of points or a single point to a (N, 2) float array\\
+        extra coordinates are dropped
+        """
+        points = np.asarray(points, dtype=np.float64)
+        if points.ndim == 1:
+            points = points.reshape(1, -1)
+        if points.ndim != 2 or points.shape[1] < 2:
+            raise ValueError(
+                f"expected a (N, 2) array of points, got shape {points.shape}")
+        return points[:, :2]
+
+    def _ids(self, ids: Union[int, np.ndarray]) -> np.ndarray:
+        """
+        Converts ids to an array, checking they are in use
+        """
+        ids = np.atleast_1d(np.asarray(ids, dtype=np.intp))
+        if ids.size and (ids.min() < 0 or ids.max() >= len(self._alive)
+                         or not self._alive[ids].all()):
+            raise ValueError("unknown or removed ids")
+        return ids
+
+    def _keys_of(self, points: np.ndarray) -> np.ndarray:
+        """
+        Gets the key of the cell of each point
+        """
+        cells = np.floor(points / self.cell_size)
+        return _cell_keys(cells[:, 0], cells[:, 1])
+
+    def __len__(self) -> int:
+        return len(self._alive) - len(self._free)
+
+    @property
+    def ids(self) -> np.ndarray:
+        """
+        Gets the ids in use, in increasing order
+        """
+        return np.flatnonzero(self._alive)
+
+    def positions(self, ids: Union[int, np.ndarray] = None) -> np.ndarray:
+        """
+        Gets a copy of the positions of some points
+
+        Parameters
+        ----------
+            ids : int | np.ndarray, (optional)
+                ids of the points
+                defaults to all the ids in use, see ``ids``
+
+        Returns
+        -------
+            np.ndarray : (N, 2) array of positions
+        """
+        if ids is None:
+            return self._points[self._alive]
+        return self._points[self._ids(ids)]
+
+    def insert(self, points: np.ndarray) -> np.ndarray:
+        """
+        Inserts points in the grid
+
+        Parameters
+        ----------
+            points : np.ndarray
+                (N, 2) array-like of points, or a single point
+
+        Returns
+        -------
+            np.ndarray : the ids given to the points, in order
+        """
+        points = self._as_points(points)
+        n = len(points)
+        reused = min(n, len(self._free))
+        ids = np.empty(n, dtype=np.intp)
+        ids[:reused] = [self._free.pop() for _ in range(reused)]
+
+        start = len(self._alive)
+        ids[reused:] = np.arange(start, start + n - reused)
+        if n > reused:
+            size = start + n - reused
+            capacity = max(size, 2 * start)
+            self._points = np.resize(self._points, (capacity, 2))
+            self._keys = np.resize(self._keys, capacity)
+            self._alive = np.resize(self._alive, capacity)
+            self._alive[start:] = False
+            self._free.extend(range(capacity - 1, size - 1, -1))
+
+        keys = self._keys_of(points)
+        self._points[ids] = points
+        self._keys[ids] = keys
+        self._alive[ids] = True
+        cells = self._cells
+        for i, key in zip(ids.tolist(), keys.tolist()):
+            try:
+                cells[key].add(i)
+            except KeyError:
+                cells[key] = {i}
+        return ids
+
+    def move(self, ids: Union[int, np.ndarray], points: np.ndarray) -> None:
+        """
+        Moves points to new positions
+
+        Parameters
+        ----------
+            ids : int | np.ndarray
+                ids of the points to move
+            points : np.ndarray
+                (N, 2) array-like of new positions, one for each id
+        """
+        ids = self._ids(ids)
+        points = self._as_points(points)
+        if len(points) != len(ids):
+            raise ValueError(f"expected {len(ids)} points, got {len(points)}")
+        keys = self._keys_of(points)
+        old = self._keys[ids]
+        self._points[ids] = points
+        self._keys[ids] = keys
+
+        changed = np.flatnonzero(keys != old)
+        cells = self._cells
+        for i, k0, k1 in zip(ids[changed].tolist(), old[changed].tolist(),
+                             keys[changed].tolist()):
+            cell = cells[k0]
+            cell.discard(i)
+            if not cell:
+                del cells[k0]
+            try:
+                cells[k1].add(i)
+            except KeyError:
+                cells[k1] = {i}
+
+    def remove(self, ids: Union[int, np.ndarray]) -> None:
+        """
+        Removes points from the grid, their ids can be given to new points
+
+        Parameters
+        ----------
+            ids : int | np.ndarray
+                ids of the points to remove
+        """
+        ids = np.unique(self._ids(ids))
+        cells = self._cells
+        for i, key in zip(ids.tolist(), self._keys[ids].tolist()):
+            cell = cells[key]
+            cell.discard(i)
+            if not cell:
+                del cells[key]
+        self._alive[ids] = False
+        self._free.extend(ids[::-1].tolist())
+
+    def clear(self) -> None:
+        """
+        Removes all points
+        """
+        self._points = np.empty((0, 2), dtype=np.float64)
+        self._keys = np.empty(0, dtype=np.int64)
+        self._alive = np.empty(0, dtype=bool)
+        self._free.clear()
+        self._cells.clear()
+
+    def query_radius(self, center: Union[tuple, list, Vector],
+                     radius: float) -> np.ndarray:
+        """
+        Gets the points at most ``radius`` away from ``center``
+
+        Parameters
+        ----------
+            center : tuple | list | Vector
+                center of the query
+            radius : float
+                radius of the query
+
+        Returns
+        -------
+            np.ndarray : ids of the points, in increasing order
+        """
+        ids, _ = self._query_radius(center, radius)
+        return ids
+
+    def _query_radius(self, center: Union[tuple, list, Vector],
+                      radius: float) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the ids of the points at most ``radius`` away from ``center``\\
+        and their squared distances
+        """
+        x, y = float(center[0]), float(center[1])
+        size = self.cell_size
+        cx0, cx1 = m.floor((x-radius) / size), m.floor((x+radius) / size)
+        cy0, cy1 = m.floor((y-radius) / size), m.floor((y+radius) / size)
+
+        # few cells : only look at those, else check every point
+        if (cx1-cx0+1) * (cy1-cy0+1) < len(self._cells):
+            cells = self._cells
+            found = []
+            for cx in range(cx0, cx1 + 1):
+                key = cx << 32
+                for cy in range(cy0 + (1 << 31), cy1 + (1 << 31) + 1):
+                    cell = cells.get(key + cy)
+                    if cell:
+                        found.extend(cell)
+            ids = np.array(sorted(found), dtype=np.intp)
+        else:
+            ids = self.ids
+
+        delta = self._points[ids] - (x, y)
+        dist_sq = np.einsum("ij,ij->i", delta, delta)
+        keep = dist_sq <= radius * radius
+        return ids[keep], dist_sq[keep]
+
+    def query_knn(self, center: Union[tuple, list, Vector],
+                  k: int) -> np.ndarray:
+        """
+        Gets the ``k`` nearest points to ``center``
+
+        Parameters
+        ----------
+            center : tuple | list | Vector
+                center of the query
+            k : int
+                number of points, all the points are returned if there are not enough
+
+        Returns
+        -------
+            np.ndarray : ids of the points, nearest first
+        """
+        k = min(k, len(self))
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+
+        # grow the radius until it holds enough points, all the k nearest are then in
+        radius = self.cell_size
+        while True:
+            ids, dist_sq = self._query_radius(center, radius)
+            if len(ids) >= k:
+                break
+            radius *= 2
+        nearest = np.argpartition(dist_sq, k - 1)[:k]
+        return ids[nearest[np.argsort(dist_sq[nearest], kind="stable")]]
+
+    def pairs(self, radius: float) -> np.ndarray:
+        """
+        Gets all the pairs of points at most ``radius`` away from each other
+
+        Parameters
+        ----------
+            radius : float
+                maximum distance between the two points of a pair
+
+        Returns
+        -------
+            np.ndarray : (M, 2) array of ids, with the smallest id of each pair first
+        """
+        ids = self.ids
+        points = self._points[ids]
+        size = self.cell_size
+        cells = np.floor(points / size).astype(np.int64)
+
+        # points sorted by cell, so each cell is a contiguous range
+        keys = _cell_keys(cells[:, 0], cells[:, 1])
+        order = np.argsort(keys, kind="stable")
+        keys, cells, points, ids = keys[order], cells[order], points[
+            order], ids[order]
+        n = len(ids)
+        radius_sq = radius * radius
+
+        # each pair of neighbor cells is visited once
+        reach = max(m.ceil(radius / size), 1)
+        firsts, seconds = [], []
+        for dx in range(0, reach + 1):
+            for dy in range(-reach, reach + 1):
+                if dx == 0 and dy < 0:
+                    continue
+                if dx == 0 and dy == 0:
+                    # same cell : only the points after the current one
+                    lo = np.arange(1, n + 1)
+                    hi = np.searchsorted(keys, keys, side="right")
+                else:
+                    other = _cell_keys(cells[:, 0] + dx, cells[:, 1] + dy)
+                    lo = np.searchsorted(keys, other)
+                    hi = np.searchsorted(keys, other, side="right")
+                counts = hi - lo
+                total = int(counts.sum())
+                if total == 0:
+                    continue
+                first = np.repeat(np.arange(n), counts)
+                second = np.arange(total) - np.repeat(
+                    np.cumsum(counts) - counts - lo, counts)
+                delta = points[first] - points[second]
+                keep = np.einsum("ij,ij->i", delta, delta) <= radius_sq
+                firsts.append(ids[first[keep]])
+                seconds.append(ids[second[keep]])
+
+        if not firsts:
+            return np.empty((0, 2), dtype=np.intp)
+        first = np.concatenate(firsts)
+        second = np.concatenate(seconds)
+        return np.stack((np.minimum(first, second), np.maximum(first, second)),
+                        axis=1)
+
+    # aliases
+    query = query_radius
+    knn = query_knn
@@ -147,18 +147,20 @@ class Vector(np.ndarray):
 
     def __getitem__(self, key: Union[int,
                                      slice]) -> Union[int, float, np.ndarray]:
-
+        # slices are plain ndarray views (no copy, writing to them changes the
+        # Vector), a 2 items Vector would not have a z-component
         if isinstance(key, slice):
-            return np.array([self[i] for i in range(*key.indices(len(self)))])
+            return self.view(np.ndarray)[key]
         return super().__getitem__(key)
 
     def __setitem__(self, key: Union[int, slice],
                     value: Union[int, float, list[Union[int, float]]]) -> None:
+        # extra values of a slice assignment are ignored, as they used to be
         if isinstance(key, slice):
-            for i, v in zip(range(*key.indices(len(self))), value):
-                self[i] = v
-        else:
-            super().__setitem__(key, value)
+            value = np.asarray(value)
+            if value.ndim:
+                value = value[:len(range(*key.indices(len(self))))]
+        super().__setitem__(key, value)
 
     def __delitem__(self, key: Union[int, slice]) -> None:
         if isinstance(key, slice):
@@ -0,0 +1,476 @@
+from typing import Iterable, Iterator, Union
+import numpy as np
+
+__all__ = ["VectorArray"]
+
+from .vector import Vector
+
+Operand = Union[float, int, np.ndarray, Vector, "VectorArray"]
+
+
+class VectorArray:
+    """
+    VectorArray
+    ===========
+    provides :
+    1. N vectors stored in a single (N, 3) float64 numpy array
+    2. The ``Vector`` operations computed on all the vectors at once
+    3. Views on the underlying array when indexing
+
+    Examples
+    --------
+        >>> particles = VectorArray.random2d(10000, mag=2)
+        >>> particles.magnitude
+        array([2., 2., 2., ..., 2., 2., 2.])
+
+        >>> particles[0]
+        ... # Vector view on the first row, writes go to the array
+
+        >>> particles[:10].normalize()
+        ... # normalizes the first ten vectors in place
+
+        >>> positions = VectorArray([Vector(1, 2), Vector(3, 4)])
+        >>> positions.x
+        array([1., 3.])
+
+    Parameters
+    ----------
+        vectors : np.ndarray | Iterable[Vector] | int
+            (N, 2) or (N, 3) array-like of coordinates, copied\\
+            or number of zero vectors
+
+    Note
+    ----
+        In arithmetic, a sequence of length 2 or 3 is one vector applied to all rows,
+        per vector scalars must be given as an (N, 1) array (like ``values[:, None]``).
+    """
+    __slots__ = ("_data", )
+    # lets numpy arrays and Vectors defer to the reflected operators
+    __array_ufunc__ = None
+
+    def __init__(
+            self,
+            vectors: Union[np.ndarray, Iterable[Vector], int] = 0) -> None:
+        """
+        new VectorArray instance
+
+        Parameters
+        ----------
+            vectors : np.ndarray | Iterable[Vector] | int, (optional)
+                (N, 2) or (N, 3) array-like of coordinates, copied\\
+                or number of zero vectors
+                defaults to 0
+        """
+        if isinstance(vectors, int):
+            self._data = np.zeros((vectors, 3))
+            return
+        if isinstance(vectors, VectorArray):
+            vectors = vectors._data
+        data = np.array(vectors, dtype=np.float64)
+        if data.ndim == 1 and data.size == 0:
+            data = data.reshape(0, 3)
+        assert data.ndim == 2 and data.shape[1] in (2, 3), "illegal shape"
+        if data.shape[1] == 2:
+            data = np.hstack((data, np.zeros((len(data), 1))))
+        self._data = data
+
+    @classmethod
+    def _view(cls, data: np.ndarray) -> "VectorArray":
+        """
+        Wraps an (N, 3) float64 array without copying it
+        """
+        obj = cls.__new__(cls)
+        obj._data = data
+        return obj
+
+    @property
+    def data(self) -> np.ndarray:
+        """
+        The underlying (N, 3) array, modifying it modifies the vectors
+        """
+        return self._data
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        if dtype is None and not copy:
+            return self._data
+        return np.array(self._data, dtype=dtype)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self)} vectors)"
+
+    def __iter__(self) -> Iterator[Vector]:
+        for row in self._data:
+            yield row.view(Vector)
+
+    def __getitem__(self, key) -> Union[Vector, "VectorArray", np.ndarray]:
+        """
+        ``array[i]`` is a Vector view on row i\\
+        ``array[a:b]``, ``array[mask]`` or ``array[indices]`` is a VectorArray\\
+        (a view for slices, a copy otherwise, as with numpy)\\
+        ``array[:, :2]`` and other tuples index the underlying array
+        """
+        if isinstance(key, tuple):
+            return self._data[key]
+        if isinstance(key, (int, np.integer)):
+            return self._data[key].view(Vector)
+        return self._view(self._data[key])
+
+    def __setitem__(self, key, value: Operand) -> None:
+        if isinstance(value, VectorArray):
+            value = value._data
+        self._data[key] = value
+
+    # components
+
+    @property
+    def x(self) -> np.ndarray:
+        """
+        the x-components, as a view
+        """
+        return self._data[:, 0]
+
+    @x.setter
+    def x(self, value: Union[float, np.ndarray]) -> None:
+        self._data[:, 0] = value
+
+    @property
+    def y(self) -> np.ndarray:
+        """
+        the y-components, as a view
+        """
+        return self._data[:, 1]
+
+    @y.setter
+    def y(self, value: Union[float, np.ndarray]) -> None:
+        self._data[:, 1] = value
+
+    @property
+    def z(self) -> np.ndarray:
+        """
+        the z-components, as a view
+        """
+        return self._data[:, 2]
+
+    @z.setter
+    def z(self, value: Union[float, np.ndarray]) -> None:
+        self._data[:, 2] = value
+
+    @property
+    def xy(self) -> np.ndarray:
+        """
+        the (N, 2) x and y components, as a view\\
+        can be given to the Renderer batch drawing methods
+        """
+        return self._data[:, :2]
+
+    # arithmetic
+
+    def _operand(self, other: Operand) -> np.ndarray:
+        """
+        Vectors and VectorArrays are used as is, sequences of length 2 or 3 are
+        a single vector, (N, 2) and (N, 3) arrays are one vector per row and
+        (N, 1) arrays are per vector scalars, whatever N (other lengths raise)
+        """
+        if isinstance(other, VectorArray):
+            return other._data
+        if isinstance(other, Vector):
+            return other.view(np.ndarray)
+        if np.isscalar(other):
+            return other
+        other = np.asarray(other, dtype=np.float64)
+        if other.ndim == 0:
+            return other
+        if other.ndim > 2 or other.shape[-1] not in (1, 2, 3):
+            raise ValueError(
+                f"expected a vector of length 2 or 3, or an (N, 1), (N, 2) or (N, 3) array, got shape {other.shape}"
+            )
+        if other.shape[-1] == 2:
+            pad = [(0, 0)] * (other.ndim - 1) + [(0, 1)]
+            other = np.pad(other, pad)
+        return other
+
+    def _scalars(self, values: Union[float, np.ndarray]) -> np.ndarray:
+        """
+        One scalar for all vectors or an (N,) array of per vector scalars,
+        shaped to broadcast against the (N, 3) data
+        """
+        if np.isscalar(values):
+            return values
+        values = np.asarray(values, dtype=np.float64)
+        return values.reshape(-1, 1) if values.ndim else values
+
+    def __add__(self, other: Operand) -> "VectorArray":
+        return self._view(self._data + self._operand(other))
+
+    def __sub__(self, other: Operand) -> "VectorArray":
+        return self._view(self._data - self._operand(other))
+
+    def __mul__(self, other: Operand) -> "VectorArray":
+        return self._view(self._data * self._operand(other))
+
+    def __truediv__(self, other: Operand) -> "VectorArray":
+        return self._view(self._data / self._operand(other))
+
+    def __radd__(self, other: Operand) -> "VectorArray":
+        return self._view(self._operand(other) + self._data)
+
+    def __rsub__(self, other: Operand) -> "VectorArray":
+        return self._view(self._operand(other) - self._data)
+
+    def __rmul__(self, other: Operand) -> "VectorArray":
+        return self._view(self._operand(other) * self._data)
+
+    def __iadd__(self, other: Operand) -> "VectorArray":
+        self._data += self._operand(other)
+        return self
+
+    def __isub__(self, other: Operand) -> "VectorArray":
+        self._data -= self._operand(other)
+        return self
+
+    def __imul__(self, other: Operand) -> "VectorArray":
+        self._data *= self._operand(other)
+        return self
+
+    def __itruediv__(self, other: Operand) -> "VectorArray":
+        self._data /= self._operand(other)
+        return self
+
+    def __neg__(self) -> "VectorArray":
+        return self._view(-self._data)
+
+    # vector operations
+
+    def copy(self) -> "VectorArray":
+        """
+        Return a copy of the vectors, not sharing memory
+        """
+        return self._view(self._data.copy())
+
+    @property
+    def magnitude(self) -> np.ndarray:
+        """
+        The (N,) magnitudes of the vectors\\
+        setting it to a number or an (N,) array rescales the vectors (zero vectors stay zero)
+        """
+        return np.sqrt(self.magnitude_sq)
+
+    @magnitude.setter
+    def magnitude(self, value: Union[float, np.ndarray]) -> None:
+        mag = self.magnitude
+        scale = np.divide(np.abs(value),
+                          mag,
+                          out=np.zeros_like(mag),
+                          where=mag != 0)
+        self._data *= scale[:, np.newaxis]
+
+    @property
+    def magnitude_sq(self) -> np.ndarray:
+        """
+        The (N,) squared magnitudes of the vectors
+        """
+        return np.einsum("ij,ij->i", self._data, self._data)
+
+    @magnitude_sq.setter
+    def magnitude_sq(self, value: Union[float, np.ndarray]) -> None:
+        self.magnitude = np.sqrt(value)
+
+    def normalize(self) -> None:
+        """
+        Sets the magnitude of all the vectors to 1, zero vectors stay zero
+        """
+        self.magnitude = 1
+
+    def normalized(self) -> "VectorArray":
+        """
+        Returns a copy of the vectors with a magnitude of 1
+        """
+        other = self.copy()
+        other.magnitude = 1
+        return other
+
+    def limit(self,
+              upper: Union[float, np.ndarray] = None,
+              lower: Union[float, np.ndarray] = None) -> None:
+        """
+        Keeps the magnitude of all the vectors under or above given limits
+        """
+        mag = self.magnitude
+        target = mag
+        if upper is not None:
+            target = np.minimum(target, upper)
+        if lower is not None:
+            target = np.maximum(target, lower)
+        if target is not mag:
+            self.magnitude = target
+
+    def limited(self,
+                upper: Union[float, np.ndarray] = None,
+                lower: Union[float, np.ndarray] = None) -> "VectorArray":
+        """
+        Returns a copy of the vectors whom magnitude has been keeped under or above given limits
+        """
+        other = self.copy()
+        other.limit(upper, lower)
+        return other
+
+    def dot(self, other: Operand) -> np.ndarray:
+        """
+        Computes the (N,) dot products with a Vector or with each vector of another VectorArray
+        """
+        return np.einsum(
+            "ij,ij->i", self._data,
+            np.broadcast_to(self._operand(other), self._data.shape))
+
+    def cross(self, other: Operand) -> "VectorArray":
+        """
+        Computes the cross products with a Vector or with each vector of another VectorArray
+        """
+        return self._view(np.cross(self._data, self._operand(other)))
+
+    def distance_sq(self, other: Operand) -> np.ndarray:
+        """
+        Computes the (N,) squared distances to a Vector or to each vector of another VectorArray
+        """
+        diff = self._data - self._operand(other)
+        return np.einsum("ij,ij->i", diff, diff)
+
+    def distance(self, other: Operand) -> np.ndarray:
+        """
+        Computes the (N,) distances to a Vector or to each vector of another VectorArray
+        """
+        return np.sqrt(self.distance_sq(other))
+
+    def lerp(self, other: Operand, amount: Union[float,
+                                                 np.ndarray]) -> "VectorArray":
+        """
+        Linearly interpolate each vector to a Vector or to each vector of another VectorArray
+
+        Parameters
+        ----------
+            other : Vector | VectorArray
+                points to interpolate to
+            amount : float | np.ndarray
+                amount by which to interpolate, one for all or one per vector
+
+        Returns
+        -------
+            VectorArray : new vectors
+        """
+        other = self._operand(other)
+        return self._view(self._data + self._scalars(amount) *
+                          (other - self._data))
+
+    @property
+    def angle(self) -> np.ndarray:
+        """
+        The (N,) angles of rotation of the vectors in the xy plane (in radians)\\
+        setting it rotates the vectors
+        """
+        return np.arctan2(self._data[:, 1], self._data[:, 0])
+
+    @angle.setter
+    def angle(self, theta: Union[float, np.ndarray]) -> None:
+        self.rotate(theta - self.angle)
+
+    def rotate(self, theta: Union[float, np.ndarray]) -> None:
+        """
+        Rotates the vectors in the xy plane, by one angle or one angle per vector (in radians)
+        """
+        cos, sin = np.cos(theta), np.sin(theta)
+        x, y = self._data[:, 0].copy(), self._data[:, 1]
+        self._data[:, 0] = x*cos - y*sin
+        self._data[:, 1] = x*sin + y*cos
+
+    def rotated(self, theta: Union[float, np.ndarray]) -> "VectorArray":
+        """
+        Returns a copy of the vectors rotated in the xy plane
+        """
+        other = self.copy()
+        other.rotate(theta)
+        return other
+
+    # constructors and conversions
+
+    @classmethod
+    def random(cls,
+               n: int,
+               v1: float,
+               v2: float,
+               size: int = 3) -> "VectorArray":
+        """
+        Creates n vectors with coordinates uniformly drawn between ``v1`` and ``v2``
+
+        Parameters
+        ----------
+            n : int
+                number of vectors
+            v1 : float
+                the minimum value
+            v2 : float
+                the maximum value
+            size : int, (optional)
+                the number of random-generated coordinates : min=0 | max=3
+                defaults to 3
+        """
+        assert not ((size := abs(size)) >= 4), "please enter valid size"
+        data = np.zeros((n, 3))
+        data[:, :size] = np.random.uniform(v1, v2, (n, size))
+        return cls._view(data)
+
+    @classmethod
+    def random2d(cls,
+                 n: int,
+                 mag: Union[float, np.ndarray] = 1) -> "VectorArray":
+        """
+        Generates n 2d vectors with uniformly random directions and an optional desired magnitude
+        """
+        return cls.from_angle(np.random.uniform(-np.pi, np.pi, n), mag)
+
+    @classmethod
+    def random3d(cls,
+                 n: int,
+                 mag: Union[float, np.ndarray] = 1) -> "VectorArray":
+        """
+        Generates n 3d vectors with uniformly random directions and an optional desired magnitude
+        """
+        obj = cls._view(np.random.normal(size=(n, 3)))
+        obj.magnitude = mag
+        return obj
+
+    @classmethod
+    def from_angle(cls,
+                   angles: np.ndarray,
+                   mag: Union[float, np.ndarray] = 1) -> "VectorArray":
+        """
+        Creates 2d vectors with the given angles (in radians) and magnitude
+        """
+        angles = np.asarray(angles, dtype=np.float64)
+        data = np.zeros((len(angles), 3))
+        data[:, 0] = np.cos(angles)
+        data[:, 1] = np.sin(angles)
+        data[:, :2] *= np.reshape(mag, (-1, 1))
+        return cls._view(data)
+
+    @classmethod
+    def from_vectors(cls, vectors: Iterable[Vector]) -> "VectorArray":
+        """
+        Creates a VectorArray from a list of Vectors, copying them
+        """
+        return cls(list(vectors))
+
+    def to_vectors(self) -> list[Vector]:
+        """
+        Returns a list of new Vectors, not sharing memory with the array
+        """
+        return [row.view(Vector) for row in self._data.copy()]
+
+    # aliases
+    mag = norm = magnitude
+    mag2 = magnitude_sq
+    dist = distance
+    dist_sq = distance_sq
+    heading = angle
@@ -0,0 +1,5 @@
+import os
+
+# no window is ever opened by the tests
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
@@ -0,0 +1,34 @@
+import numpy as np
+
+from phoenyx import NoiseField, OpenSimplexNoise, PerlinNoise
+
+
+def test_cache_is_reused_with_same_parameters(tmp_path):
+    path = str(tmp_path / "field.npy")
+    first = NoiseField(PerlinNoise(2, seed=1), (32, 32), (4, 4), path=path)
+    second = NoiseField(PerlinNoise(2, seed=1), (32, 32), (4, 4), path=path)
+    assert isinstance(second._data, np.memmap)
+    assert np.array_equal(first.texture, second.texture)
+
+
+def test_cache_is_recomputed_when_parameters_change(tmp_path):
+    path = str(tmp_path / "field.npy")
+    NoiseField(PerlinNoise(2, seed=1), (32, 32), (4, 4), path=path)
+    changes = [
+        (PerlinNoise(2, seed=1), (8, 8)),
+        (PerlinNoise(2, seed=2), (4, 4)),
+        (PerlinNoise(2, octaves=3, seed=1), (4, 4)),
+        (PerlinNoise(2, tile=(4, 4), seed=1), (4, 4)),
+        (OpenSimplexNoise(1), (4, 4)),
+    ]
+    for noise, size in changes:
+        field = NoiseField(noise, (32, 32), size, path=path)
+        fresh = NoiseField(noise, (32, 32), size)
+        assert np.array_equal(field.texture, fresh.texture)
+
+
+def test_cache_without_parameters_is_recomputed(tmp_path):
+    path = str(tmp_path / "field.npy")
+    np.save(path, np.zeros((32, 32)))
+    field = NoiseField(PerlinNoise(2, seed=1), (32, 32), (4, 4), path=path)
+    assert np.any(field.texture != 0)
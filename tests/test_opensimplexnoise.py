@@ -0,0 +1,23 @@
+import numpy as np
+
+from phoenyx import OpenSimplexNoise
+
+
+def _points(dim, scale, count=2000):
+    return np.random.default_rng(0).uniform(-scale, scale, (dim, count))
+
+
+def test_noise4d_array_matches_noise4d():
+    noise = OpenSimplexNoise(3)
+    for scale in (1, 50, 1e5):
+        points = _points(4, scale)
+        expected = [noise.noise4d(*point) for point in points.T]
+        assert np.array_equal(noise.noise4d_array(*points), expected)
+
+
+def test_noise4d_array_broadcasts():
+    noise = OpenSimplexNoise(3)
+    values = noise.noise4d_array(np.arange(3)[:, None] / 3, np.arange(4) / 5,
+                                 0.5, -1)
+    assert values.shape == (3, 4)
+    assert values[2, 1] == noise.noise4d(2 / 3, 1 / 5, 0.5, -1)
@@ -0,0 +1,23 @@
+import numpy as np
+
+from phoenyx import PerlinNoise
+
+
+def test_no_period_on_large_coordinates():
+    noise = PerlinNoise(2, seed=1)
+    points = np.random.default_rng(0).uniform(0, 256, (200, 2))
+    for shift in ((256, 0), (0, 256), (256, 256), (2**40, 0)):
+        shifted = noise.eval(points + shift)
+        assert not np.allclose(noise.eval(points), shifted)
+
+
+def test_arrays_match_single_points():
+    for dimension in (1, 2, 3):
+        noise = PerlinNoise(dimension, octaves=3, seed=4)
+        points = np.random.default_rng(1).uniform(-1e6, 1e6, (300, dimension))
+        expected = [noise(*point) for point in points]
+        assert np.array_equal(noise.eval(points), expected)
+    noise = PerlinNoise(2, octaves=2, tile=(5, 0), seed=4)
+    xs, ys = np.linspace(-20, 20, 17), np.linspace(-300, 300, 13)
+    expected = [[noise(x, y) for y in ys] for x in xs]
+    assert np.array_equal(noise.grid(xs, ys), expected)
@@ -0,0 +1,75 @@
+import time
+
+from phoenyx import Renderer
+
+
+def test_idle_without_redraw_leaves_no_ghosts_in_dirty_mode():
+    renderer = Renderer(200, 200, headless=True)
+    renderer.set_background(0)
+    renderer.set_dirty_rects(True)
+    renderer.fill = 255
+    renderer.no_stroke()
+    # drawn at x = 50, frozen for a few frames, then drawn at x = 150
+    renderer.set_idle(lambda: 3 <= renderer.frame_count < 6, redraw=False)
+    drawn, shown = [], []
+
+    def draw() -> None:
+        x = 50 if renderer.frame_count < 6 else 150
+        renderer.circle((x, 100), 10)
+        drawn.append(renderer.frame_count)
+
+    def until() -> bool:
+        frame = renderer.get_frame()
+        shown.append((frame[100, 50].tolist(), frame[100, 150].tolist()))
+        return False
+
+    renderer.run(draw=draw, frames=8, until=until)
+    white, black = [255, 255, 255], [0, 0, 0]
+    # one more draw when going idle, none while idle
+    assert drawn == [0, 1, 2, 3, 6, 7]
+    assert shown[:6] == [(white, black)] * 6
+    assert shown[6:] == [(black, white)] * 2
+
+
+def test_headless_updates_with_unlocked_frame_rate():
+    for fps in (0, -1):
+        renderer = Renderer(100, 100, headless=True)
+        renderer.fps = fps
+        steps, alphas = [], []
+        renderer.run(draw=alphas.append,
+                     frames=10,
+                     update=steps.append,
+                     dt=1 / 50)
+        # one update per frame
+        assert steps == [1/50] * 10
+        assert alphas == [0.] * 10
+
+
+def test_profiler_overlay_has_its_own_lap():
+    renderer = Renderer(100, 100, headless=True)
+    profiler = renderer.set_profiler(overlay=True)
+    draw = profiler.draw
+
+    def slow_draw(renderer) -> None:
+        time.sleep(.02)
+        draw(renderer)
+
+    profiler.draw = slow_draw
+    renderer.run(draw=lambda: None, frames=3)
+    phases = profiler.phases
+    assert phases.index("tick") < phases.index("overlay") < phases.index(
+        "present")
+    assert profiler.samples("overlay").min() >= 2e7
+    assert profiler.samples("present").max() < 2e7
+
+
+def test_headless_run_twice_then_draw_text():
+    renderer = Renderer(100, 100, headless=True)
+    frames = []
+    renderer.run(draw=lambda: frames.append(renderer.frame_count), frames=2)
+    renderer.run(draw=lambda: frames.append(renderer.frame_count), frames=3)
+    assert frames == [0, 1, 2, 3, 4]
+    renderer.text_color = 255
+    renderer.text(50, 50, "still running")
+    assert renderer.get_frame().any()
+    renderer.quit()
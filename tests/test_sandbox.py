@@ -0,0 +1,81 @@
+import pytest
+import pymunk
+
+from phoenyx import SandBox
+
+
+def _sleeping_sandbox() -> SandBox:
+    sandbox = SandBox(None, 300, 300, bounce=True, sleep_time_threshold=.1)
+    sandbox.add_ball(300, 580, 1, 10)
+    for _ in range(600):
+        sandbox.step(iter=2)
+        if sandbox.is_idle:
+            break
+    assert sandbox.is_idle
+    return sandbox
+
+
+def test_moving_kinematic_body_keeps_stepping():
+    sandbox = _sleeping_sandbox()
+    body = pymunk.Body(body_type=pymunk.Body.KINEMATIC)
+    body.position = 100, 100
+    body.velocity = 60, 0
+    sandbox._space.add(body, pymunk.Circle(body, 5))
+
+    assert not sandbox.is_idle
+    for _ in range(60):
+        sandbox.step()
+    assert body.position.x > 150
+    assert sandbox.substeps > 0
+
+
+def test_still_kinematic_body_is_idle():
+    sandbox = _sleeping_sandbox()
+    body = pymunk.Body(body_type=pymunk.Body.KINEMATIC)
+    body.position = 100, 100
+    sandbox._space.add(body, pymunk.Circle(body, 5))
+
+    assert sandbox.is_idle
+    sandbox.step()
+    assert sandbox.substeps == 0
+
+
+def test_add_segments_rejects_mismatched_lengths():
+    sandbox = SandBox(None, 300, 300)
+    p1 = [(0, 0), (10, 0), (20, 0)]
+    p2 = [(0, 10), (10, 10), (20, 10)]
+    for args in ((p1, p2[:2], 1, 2), (p1, p2, [1, 1], 2), (p1, p2, 1,
+                                                           [2, 2, 2, 2])):
+        with pytest.raises(ValueError):
+            sandbox.add_segments(*args)
+    assert not sandbox._space.shapes
+    group = sandbox.add_segments(p1, p2, [1, 2, 3], 2)
+    assert len(group) == 3
+
+
+def test_adaptive_step_counts_kinematic_bodies(monkeypatch):
+    for batch in (True, False):
+        sandbox = SandBox(None, 300, 300)
+        if not batch:
+            monkeypatch.setattr(sandbox, "_batch", None)
+        sandbox.add_ball(100, 100, 1, 5)
+        sandbox.step(iter=10, adaptive=True)
+        assert sandbox.substeps == 1
+        body = pymunk.Body(body_type=pymunk.Body.KINEMATIC)
+        body.velocity = 1200, 0
+        sandbox._space.add(body, pymunk.Circle(body, 5))
+        # 1200 / 60 = 20 pixels per frame, 4 iterations of 5 pixels
+        sandbox.step(iter=10, adaptive=True)
+        assert sandbox.substeps == 4
+
+
+def test_clear_removes_joints():
+    sandbox = SandBox(None, 300, 300)
+    group = sandbox.add_balls([(100, 100), (150, 100)], 1, 5)
+    a, b = group.bodies
+    sandbox._space.add(pymunk.PinJoint(a, b))
+    sandbox.clear()
+    assert not sandbox._space.bodies
+    assert not sandbox._space.shapes
+    assert not sandbox._space.constraints
+    sandbox.step()
@@ -0,0 +1,61 @@
+import numpy as np
+
+from phoenyx import Renderer, Vector
+
+
+def test_slice_is_a_view():
+    v = Vector(1, 2, 3)
+    xy = v[:2]
+    assert type(xy) is np.ndarray
+    assert xy.tolist() == [1, 2]
+    xy[0] = 10
+    assert v.x == 10
+    copy = v[:2].copy()
+    copy[1] = 20
+    assert v.y == 2
+
+
+def test_slice_assignment():
+    v = Vector(1, 2, 3)
+    v[1:] = (5, 6)
+    assert v.tolist() == [1, 5, 6]
+    # extra values are ignored, as they always were
+    v[:2] = [7, 8, 9]
+    assert v.tolist() == [7, 8, 6]
+    v[0] = 4
+    assert v.x == 4
+
+
+def test_slice_assignment_goes_through_numpy():
+    v = Vector(1, 2, 3)
+    v[:2] = 0
+    assert v.tolist() == [0, 0, 3]
+    v[::2] = np.array([4, 5, 6])
+    assert v.tolist() == [4, 0, 5]
+
+
+def test_circle_with_vector_has_no_per_item_work(monkeypatch):
+    renderer = Renderer(100, 100, headless=True)
+    renderer.set_background(0)
+    renderer.fill = 255
+    calls = []
+    getitem, iterate = Vector.__getitem__, Vector.__iter__
+
+    def counted_getitem(self, key):
+        calls.append(key)
+        return getitem(self, key)
+
+    def counted_iter(self):
+        calls.append("iter")
+        return iterate(self)
+
+    monkeypatch.setattr(Vector, "__getitem__", counted_getitem)
+    monkeypatch.setattr(Vector, "__iter__", counted_iter)
+    renderer.circle(Vector(30, 40), 5)
+    renderer.translate(10, 10)
+    renderer.circle(Vector(30, 40), 5)
+    assert calls == []
+
+    frame = renderer.get_frame()
+    assert frame[40, 30].tolist() == [255, 255, 255]
+    assert frame[50, 40].tolist() == [255, 255, 255]
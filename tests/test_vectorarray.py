@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from phoenyx import Vector, VectorArray
+
+
+@pytest.mark.parametrize("n", [2, 3, 4])
+def test_sequence_is_one_vector_whatever_n(n):
+    va = VectorArray(np.arange(3 * n, dtype=float).reshape(n, 3))
+    expected = va.data + (1, 2, 0)
+    assert np.array_equal((va + (1, 2, 0)).data, expected)
+    assert np.array_equal(((1, 2, 0) + va).data, expected)
+    assert np.array_equal((va + (1, 2)).data, expected)
+    assert np.array_equal((va + np.array([1., 2., 0.])).data, expected)
+
+
+@pytest.mark.parametrize("n", [2, 3])
+def test_per_vector_scalars_need_a_column(n):
+    va = VectorArray(np.ones((n, 3)))
+    scales = np.arange(1, n + 1, dtype=float)
+    assert np.array_equal((va * scales[:, None]).data,
+                          np.ones((n, 3)) * scales[:, None])
+    with pytest.raises(ValueError):
+        va * np.arange(5.)
+
+
+def test_lerp_amount_per_vector():
+    va = VectorArray(np.zeros((3, 3)))
+    out = va.lerp(Vector(2, 0, 0), np.array([0., .5, 1.]))
+    assert np.array_equal(out.x, [0., 1., 2.])